@@ -5,9 +5,21 @@
 # LICENSE file in the root directory of this source tree.
 #############################################################################
 
-from .asciigraf import graph_from_ascii # noqa F401
-
+from functools import lru_cache
 
+from .asciigraf import graph_from_ascii # noqa F401
+from .batch import graphs_from_ascii # noqa F401
+from .cache import ParseCache # noqa F401
+from .diskcache import DiskCache # noqa F401
+from .canvas import draw_graph # noqa F401
+from .layout import ascii_from_graph # noqa F401
+from .spatial import SpatialIndex # noqa F401
+from .stats import ParseStats # noqa F401
+from .validate import validate_ascii # noqa F401
+from .diagram import Diagram # noqa F401
+
+
+@lru_cache(maxsize=None)
 def get_version():
     import sys
 
@@ -23,4 +35,10 @@ def get_version():
         return files(__name__).joinpath("VERSION").open("r").read().strip()
 
 
-__version__ = get_version()
+def __getattr__(name):
+    # the version is only read from the VERSION file when it's asked for
+    if name == "__version__":
+        return get_version()
+    raise AttributeError(
+        "module {!r} has no attribute {!r}".format(__name__, name)
+    )
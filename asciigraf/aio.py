@@ -0,0 +1,106 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from .asciigraf import graph_from_ascii
+from .stream import StreamParser
+
+ROWS_PER_YIELD = 256  # rows parsed between yielding to the event loop
+
+_default_executor = None
+_default_executor_lock = threading.Lock()
+
+
+async def graph_from_ascii_async(
+        network_string, executor=None, limit=None, **kwargs):
+    """ `graph_from_ascii`, run in `executor` so that it doesn't block the
+        event loop
+
+        e.g.
+
+        limit = asyncio.Semaphore(4)
+        graph = await graph_from_ascii_async(diagram, limit=limit)
+
+        `executor` can be any `concurrent.futures` executor; by default
+        diagrams are parsed in a thread pool shared by every call. With a
+        `ProcessPoolExecutor` parses also run in parallel, though keyword
+        arguments such as `stats` are only filled in by thread executors.
+
+        `limit` is an `asyncio.Semaphore` shared by the calls to limit,
+        e.g. one per service; no more of them than it allows will parse
+        at once. Giving the executor more workers than that leaves room
+        for other work while the biggest diagrams are being parsed.
+
+        Cancelling the call before the parse starts means it never runs.
+        A parse which has already started can't be interrupted, so it
+        keeps its place in `limit` until it finishes.
+    """
+    if limit is not None:
+        await limit.acquire()
+    try:
+        job = (executor or default_executor()).submit(
+            partial(graph_from_ascii, network_string, **kwargs)
+        )
+    except BaseException:
+        if limit is not None:
+            limit.release()
+        raise
+
+    if limit is not None:
+        loop = asyncio.get_running_loop()
+
+        def release(_):
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(limit.release)
+
+        job.add_done_callback(release)
+    # cancelling the wrapped future cancels `job` too, unless it's started
+    return await asyncio.wrap_future(job)
+
+
+async def graph_from_stream(reader, limit=None):
+    """ Produces a networkx graph from an ascii (or utf-8) drawing of a
+        network read from `reader`, an `asyncio.StreamReader`, one row at
+        a time as it arrives
+
+        Rows are parsed on the event loop by a `StreamParser`, which
+        yields to other tasks every ROWS_PER_YIELD rows so that a huge
+        diagram can't starve them. As with `graph_from_lines`, the drawing
+        isn't attached to the graph. `limit` is an `asyncio.Semaphore`, as
+        for `graph_from_ascii_async`, which is held until the graph is
+        built. Rows longer than the reader's `limit` raise a ValueError.
+    """
+    if limit is not None:
+        async with limit:
+            return await graph_from_stream(reader)
+
+    parser = StreamParser()
+    n_rows = 0
+    while True:
+        line = await reader.readline()
+        if not line:
+            break
+        parser.feed(line)
+        n_rows += 1
+        if n_rows % ROWS_PER_YIELD == 0:
+            await asyncio.sleep(0)
+    return parser.close()
+
+
+def default_executor():
+    """ The thread pool diagrams are parsed in when no executor is given """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                thread_name_prefix="asciigraf"
+            )
+        return _default_executor
@@ -0,0 +1,125 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from array import array
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional
+
+TYPECODE = "q"  # signed 64 bit ints, i.e. numpy's int64
+
+
+class ArrayGraph(NamedTuple):
+    """ A parsed diagram as flat arrays, rather than a networkx graph.
+
+        For N nodes and E edges:
+          * nodes: the N node names
+          * positions: 2N ints, the (x, y) position of each node in turn
+          * sources, targets: E ints each, the index in `nodes` of either
+                              end of each edge
+          * lengths: E ints, the number of points on each edge
+          * labels: E labels, None for edges without one
+          * point_offsets: E + 1 ints; the points of edge `i` are points
+                           `point_offsets[i]` up to `point_offsets[i + 1]`
+          * points: 2 ints, (x, y), for each point of each edge in turn
+
+        The arrays are `array.array`s of int64, so they pickle compactly
+        and can be wrapped without copying, e.g. by
+        `numpy.frombuffer(graph.points, dtype=numpy.int64).reshape(-1, 2)`.
+
+        Nodes are in the same order as in the networkx graph
+        `graph_from_ascii` would produce. Edges are in the order they were
+        traced from the diagram, with repeats of an edge in the place of
+        the first one; networkx lists edges node by node instead, so
+        `graph.edges()` can differ in order. `to_networkx` turns the
+        arrays into that graph (without its `ascii_string` attribute).
+    """
+    nodes: List[str]
+    positions: array
+    sources: array
+    targets: array
+    lengths: array
+    labels: List[Optional[str]]
+    point_offsets: array
+    points: array
+
+    def copy(self):
+        """ A copy of the graph, which shares none of its arrays """
+        return ArrayGraph(*(field[:] for field in self))
+
+    def edge_points(self, i):
+        """ The points of edge `i`, as (x, y) tuples """
+        start, stop = self.point_offsets[i], self.point_offsets[i + 1]
+        coordinates = self.points[2 * start:2 * stop]
+        return list(zip(coordinates[::2], coordinates[1::2]))
+
+    def to_networkx(self):
+        import networkx
+
+        graph = networkx.Graph()
+        graph.add_nodes_from(
+            (name, {"position": tuple(self.positions[2 * i:2 * i + 2])})
+            for i, name in enumerate(self.nodes)
+        )
+        for i, (source, target) in enumerate(zip(self.sources, self.targets)):
+            graph.add_edge(
+                self.nodes[source],
+                self.nodes[target],
+                length=self.lengths[i],
+                points=self.edge_points(i),
+            )
+            if self.labels[i] is not None:
+                graph[self.nodes[source]][self.nodes[target]]["label"] = (
+                    self.labels[i]
+                )
+        return graph
+
+
+def build_array_graph(nodes, edges):
+    """ The `ArrayGraph` equivalent of `build_networkx_graph` """
+    # like a networkx graph, the last of any repeated nodes or edges wins,
+    # but they keep the place in line of the first one (and an edge keeps
+    # the label of the last of its repeats which had one)
+    node_positions = OrderedDict()  # of the form {name -> Point}
+    for pos, name in nodes.items():
+        node_positions[name] = pos
+    node_index = {name: i for i, name in enumerate(node_positions)}
+
+    pair_edges = OrderedDict()  # of the form {frozenset(nodes) -> edge}
+    pair_labels = {}  # of the form {frozenset(nodes) -> label}
+    for edge in edges:
+        pair = frozenset(edge["nodes"])
+        pair_edges[pair] = edge
+        if "label" in edge:
+            pair_labels[pair] = edge["label"][1:-1]
+
+    positions = array(TYPECODE)
+    for pos in node_positions.values():
+        positions.extend(pos)
+
+    sources, targets = array(TYPECODE), array(TYPECODE)
+    lengths, point_offsets = array(TYPECODE), array(TYPECODE, [0])
+    labels, points = [], array(TYPECODE)
+    for pair, edge in pair_edges.items():
+        source, target = edge["nodes"]
+        sources.append(node_index[source])
+        targets.append(node_index[target])
+        lengths.append(len(edge["points"]))
+        labels.append(pair_labels.get(pair))
+        for pos in edge["points"]:
+            points.extend(pos)
+        point_offsets.append(point_offsets[-1] + len(edge["points"]))
+
+    return ArrayGraph(
+        nodes=list(node_positions),
+        positions=positions,
+        sources=sources,
+        targets=targets,
+        lengths=lengths,
+        labels=labels,
+        point_offsets=point_offsets,
+        points=points,
+    )
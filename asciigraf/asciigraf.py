@@ -6,14 +6,14 @@
 #############################################################################
 
 import re
+import sys
 from collections import OrderedDict
-from itertools import chain
+from heapq import merge
+from itertools import chain, dropwhile, islice
 from typing import List, Tuple
 
-import colorama
-import networkx
-from colorama import Style, Fore
-
+from .arrays import build_array_graph
+from .geometry import GEOMETRIES, PointRuns
 from .point import Point
 
 LEFT, RIGHT = Point(-1, 0), Point(1, 0)
@@ -36,19 +36,124 @@ ABUTTING = {
     BOTTOM_LEFT: "/",  BELOW: "|", BOTTOM_RIGHT: "\\",
 }
 
-
-def graph_from_ascii(network_string):
+# a word is a run of anything but spaces and edge chars; the text of a
+# node or label is one or more words separated by single spaces. Words and
+# separators can't overlap, so there's no backtracking, and matching is
+# linear in the length of the text whatever it holds
+WORD = r'[^ \-\\\/|\n]+'
+NODE_MATCH = re.compile(WORD + r'(?: ' + WORD + r')*')
+TOKEN_MATCH = re.compile(
+    r'(\n)'  # the end of a row
+    r'|([\-\\\/|])'  # an edge char
+    r'|(' + NODE_MATCH.pattern + r')'  # the text of a node or label
+)
+
+ENGINES = ("auto", "dict", "grid", "numpy")
+GRID_ENGINE_THRESHOLD = 64  # diagrams at least this long use the grid
+BACKENDS = ("networkx", "arrays")
+
+# error maps of bigger diagrams only show a window around the bad edge
+ERROR_MAP_MAX_CHARS = 2000
+ERROR_WINDOW_ROWS = 10  # rows shown above and below the bad edge
+ERROR_WINDOW_COLUMNS = 40  # columns shown either side of it
+
+
+def graph_from_ascii(
+        network_string, engine="auto", backend="networkx", geometry="points",
+        stats=None, lean=False):
     """ Produces a networkx graph, based on an ascii drawing
         of a network
+
+        `engine` selects how edges are traced (see `get_edges`)
+
+        With `backend="arrays"`, the graph is returned as an `ArrayGraph`
+        of flat arrays instead, without ever building a networkx graph
+
+        `geometry` selects how each edge's `points` are stored (see
+        `build_networkx_graph`)
+
+        Pass a `ParseStats` as `stats` to have it filled in with the time
+        each stage took, and counts of what was found along the way
+
+        With `lean=True`, the graph is made to take up less memory when
+        many are held at once: `network_string` isn't attached to it, and
+        node names and edge labels are interned, so that every graph with
+        the same names shares the same strings. Pair it with
+        `geometry="none"` to leave out the edges' points too.
     """
-    nodes, labels = get_nodes_and_labels(network_string)
-    edges = get_edges(network_string, nodes, labels)
-    graph = build_networkx_graph(nodes, edges)
-    graph.graph["ascii_string"] = network_string
+    if backend not in BACKENDS:
+        raise ValueError(
+            "Unknown backend {!r}, expected one of {}".format(
+                backend, BACKENDS
+            )
+        )
+    if geometry not in GEOMETRIES:
+        raise ValueError(
+            "Unknown geometry {!r}, expected one of {}".format(
+                geometry, GEOMETRIES
+            )
+        )
+    if backend == "arrays" and geometry != "points":
+        raise ValueError("The arrays backend only supports points geometry")
+
+    if stats is not None:
+        stats.start()
+        stats.rows = network_string.count("\n") + 1
+        stats.chars = len(network_string)
+
+    engine = resolve_engine(engine, network_string)
+    if engine == "dict":
+        nodes, labels, edge_chars = tokenize(network_string)
+        if stats is not None:
+            stats.lap("tokenize")
+    else:
+        # the grid engine reads edge chars straight into its `CharGrid`
+        nodes, labels = get_nodes_and_labels(network_string)
+        edge_chars = None
+        if stats is not None:
+            stats.lap("get_nodes_and_labels")
+    if stats is not None:
+        stats.nodes, stats.labels = len(nodes), len(labels)
+    if lean:
+        # before tracing edges, so the edges share the interned names
+        for position, name in nodes.items():
+            nodes[position] = sys.intern(name)
+
+    edges = get_edges(
+        network_string, nodes, labels, engine=engine, stats=stats,
+        edge_chars=edge_chars,
+    )
+    if stats is not None:
+        stats.edges = len(edges)
+        stats.max_edge_length = max(
+            (len(edge["points"]) for edge in edges), default=0
+        )
+
+    if backend == "arrays":
+        graph = build_array_graph(nodes, edges)
+        if lean:
+            graph.labels[:] = [
+                label if label is None else sys.intern(label)
+                for label in graph.labels
+            ]
+        if stats is not None:
+            stats.lap("build_array_graph")
+        return graph
+    graph = build_networkx_graph(nodes, edges, geometry=geometry)
+    if lean:
+        for _, _, data in graph.edges(data=True):
+            if "label" in data:
+                data["label"] = sys.intern(data["label"])
+    else:
+        graph.graph["ascii_string"] = network_string
+    if stats is not None:
+        stats.lap("build_networkx_graph")
     return graph
 
 
-def get_edges(network_string, nodes, labels):
+def get_edges(
+        network_string, nodes, labels, engine="auto", stats=None,
+        edge_chars=None):
     """ Traverses all adjacent edge characters to identify
         edges in the network.
 
@@ -62,13 +167,69 @@ def get_edges(network_string, nodes, labels):
             ...
         }
 
+        `engine` picks how neighbouring characters are looked up:
+          * "dict": edge and node characters are kept in mappings keyed
+                    by `Point`
+          * "grid": the diagram is loaded into a `CharGrid`, and
+                    neighbours are found through fixed index offsets
+          * "numpy": the diagram is loaded into a `CharGrid` as for
+                     "grid", and every edge character's neighbours are
+                     found at once with numpy (falling back to "grid" if
+                     numpy isn't installed)
+          * "auto": "grid" for diagrams of GRID_ENGINE_THRESHOLD or more
+                    characters, "dict" otherwise
+
+        All the engines produce exactly the same edges, and raise the same
+        errors.
+
+        `stats` is an optional `ParseStats`, to time each stage with.
+
+        The "dict" engine can be handed `edge_chars` that have already
+        been found and patched over labels (e.g. by `tokenize`).
     """
-    edge_chars = get_edge_chars(network_string)
-    edge_chars = patch_edge_chars_over_labels(labels, edge_chars)
+    engine = resolve_engine(engine, network_string)
+    if engine == "grid":
+        return get_edges_from_grid(network_string, nodes, labels, stats)
+    if engine == "numpy":
+        from .vectorized import get_edges_from_array
+
+        return get_edges_from_array(network_string, nodes, labels, stats)
+
+    if edge_chars is None:
+        edge_chars = get_edge_chars(network_string)
+        if stats is not None:
+            stats.lap("get_edge_chars")
+        edge_chars = patch_edge_chars_over_labels(labels, edge_chars)
+        if stats is not None:
+            stats.lap("patch_edge_chars_over_labels")
+    if stats is not None:
+        stats.edge_chars = len(edge_chars)
+    node_char_to_node = map_text_chars_to_text(nodes)
+    edge_char_to_neighbours = get_neighbour_map(
+        network_string, edge_chars, nodes, node_chars=node_char_to_node
+    )
+    if stats is not None:
+        stats.lap("get_neighbour_map")
+
+    edges = trace_edges(
+        edge_char_to_neighbours,
+        node_char_to_node,
+        map_text_chars_to_text(labels),
+    )
+    if stats is not None:
+        stats.lap("trace_edges")
+    return edges
+
+
+def get_neighbour_map(network_string, edge_chars, nodes, node_chars=None):
+    """ Maps each (patched) edge character to its two neighbours, raising
+        an `InvalidEdgeError` for any that doesn't have exactly two
 
-    node_chars = {}
-    for root_pos, text in nodes.items():
-        node_chars.update(char_map(text, root_pos))
+        `node_chars` can be a map of every node character's position, as
+        from `map_text_chars_to_text(nodes)`, if one has already been built
+    """
+    if node_chars is None:
+        node_chars = map_text_chars_to_text(nodes)
 
     edge_char_to_neighbours = {}
     for pos in edge_chars.keys():
@@ -77,28 +238,87 @@ def get_edges(network_string, nodes, labels):
         # every edge char should end up with exactly 2 neighbours, or
         # we have a line that doesn't make sense. the neighbours could either
         # be an adjacent edge character or a character in a node label
-        n_nodes = len(neighbouring_positions)
-        if n_nodes != 2:
-            error_map = highlight_bad_edge_characters(
-                network_string, [pos, *neighbouring_positions]
-            )
-            raise InvalidEdgeError(
-                "Too {} many neighbors at ln {}, col {}".format(
-                    "many" if n_nodes > 2 else "few",
-                    pos.y,
-                    pos.x,
-                )
-                + "\n\n{}".format(error_map)
+        if len(neighbouring_positions) != 2:
+            raise invalid_edge_error(
+                network_string, pos, neighbouring_positions
             )
 
         edge_char_to_neighbours[pos] = neighbouring_positions
+    return edge_char_to_neighbours
+
+
+def get_edges_from_grid(network_string, nodes, labels, stats=None):
+    """ Equivalent of `get_edges` that resolves neighbours on a `CharGrid`
+        rather than through mappings keyed by `Point`
+    """
+    grid = CharGrid(network_string.split("\n"))
+    grid.mark_nodes(nodes)
+    if stats is not None:
+        stats.lap("load_grid")
+    grid.patch_labels(labels)
+    if stats is not None:
+        stats.lap("patch_labels")
+
+    neighbour_map = {}
+    for index in grid.edge_indexes():
+        neighbours = grid.neighbours(index)
+        if len(neighbours) != 2:
+            raise invalid_edge_error(
+                network_string,
+                grid.point(index),
+                [grid.point(neighbour) for neighbour in neighbours],
+            )
+        neighbour_map[index] = neighbours
+    if stats is not None:
+        stats.lap("get_neighbour_map")
+        stats.edge_chars = len(neighbour_map)
+
+    edges = trace_edges(
+        neighbour_map,
+        grid.map_text_chars_to_text(nodes),
+        grid.map_text_chars_to_text(labels),
+        point=grid.point,
+    )
+    for edge in edges:
+        edge["points"] = [grid.point(index) for index in edge["points"]]
+    if stats is not None:
+        stats.lap("trace_edges")
+    return edges
+
+
+def resolve_engine(engine, network_string):
+    """ Turns the `engine` argument of `get_edges` into the engine to use:
+        "dict", "grid", or "numpy" if numpy is installed
+    """
+    if engine not in ENGINES:
+        raise ValueError(
+            "Unknown engine {!r}, expected one of {}".format(engine, ENGINES)
+        )
+    if engine == "numpy":
+        from .vectorized import numpy
+
+        return "grid" if numpy is None else "numpy"
+    if engine == "auto":
+        return (
+            "grid" if len(network_string) >= GRID_ENGINE_THRESHOLD
+            else "dict"
+        )
+    return engine
+
+
+def trace_edges(
+        neighbour_map, node_char_to_node, label_char_to_label, point=None):
+    """ Builds an edge for every chain of edge characters in `neighbour_map`
 
+        Positions can be anything hashable and ordered row-major, so
+        this works on `Point` keys as well as `CharGrid` indexes. Edges
+        are returned in the order of their first character in
+        `neighbour_map`.
+    """
     edges = []  # [{"points": [], "nodes": []},... ]
     edge_char_to_edge_map = {}  # {Point -> edge}
 
-    node_char_to_node = map_text_chars_to_text(nodes)
-    label_char_to_label = map_text_chars_to_text(labels)
-    for pos, char in edge_chars.items():
+    for pos in neighbour_map:
         if pos in edge_char_to_edge_map:
             # We only expect to get past this continue for one char
             # in each edge -- if the above condition is false, we'll
@@ -106,7 +326,7 @@ def get_edges(network_string, nodes, labels):
             continue
 
         new_edge = build_edge_from_position(
-            pos, edge_char_to_neighbours, node_char_to_node
+            pos, neighbour_map, node_char_to_node, point=point
         )
 
         for position in new_edge['points']:
@@ -118,17 +338,55 @@ def get_edges(network_string, nodes, labels):
     return edges
 
 
-def build_networkx_graph(nodes, edges):
+def invalid_edge_error(network_string, pos, neighbouring_positions):
+    """ Builds the InvalidEdgeError for an edge char at `pos` that doesn't
+        have exactly two neighbours
+    """
+    n_nodes = len(neighbouring_positions)
+    error_map = highlight_bad_edge_characters(
+        network_string, [pos, *neighbouring_positions]
+    )
+    return InvalidEdgeError(
+        "Too {} many neighbors at ln {}, col {}".format(
+            "many" if n_nodes > 2 else "few",
+            pos.y,
+            pos.x,
+        )
+        + "\n\n{}".format(error_map)
+    )
+
+
+def build_networkx_graph(nodes, edges, geometry="points"):
+    """ Builds the networkx graph of a diagram's nodes and edges
+
+        `geometry` selects how each edge's `points` attribute is stored:
+          * "points": a list of (x, y) tuples, one per edge character
+          * "runs": a `PointRuns`, which stores the points as straight runs
+                    and reads like the list of tuples
+          * "none": edges have no `points`, only their `length`
+    """
+    if geometry == "runs":
+        def edge_points(points):
+            return PointRuns.from_points(points)
+    else:
+        def edge_points(points):
+            return [tuple(el) for el in points]
+
+    def edge_data(edge):
+        data = {"length": len(edge["points"])}
+        if geometry != "none":
+            data["points"] = edge_points(edge["points"])
+        return data
+
+    import networkx  # deferred, as it's slow to import
+
     # Build networkx datastructure
     ascii_graph = networkx.Graph()
     ascii_graph.add_nodes_from(
         (node, {"position": tuple(pos)}) for pos, node in nodes.items()
     )
     ascii_graph.add_edges_from(
-        (edge['nodes'][0], edge['nodes'][1], {
-            "length": len(edge["points"]),
-            "points": [tuple(el) for el in edge["points"]]
-        })
+        (edge['nodes'][0], edge['nodes'][1], edge_data(edge))
         for edge in edges
     )
     networkx.set_edge_attributes(
@@ -155,13 +413,20 @@ def get_nodes_and_labels(network_string):
     nodes = OrderedDict()  # of the form {Point -> 'node_name'}
     labels = OrderedDict()  # of the form {Point -> 'label'}
     for ascii_label, root_position in node_iter(network_string):
-        if ascii_label.startswith("(") and ascii_label.endswith(")"):
+        if is_label(ascii_label):
             labels[root_position] = ascii_label
         else:
             nodes[root_position] = ascii_label
     return nodes, labels
 
 
+def is_label(text):
+    """ Whether text matched by NODE_MATCH is an edge label, rather than
+        the name of a node
+    """
+    return text.startswith("(") and text.endswith(")")
+
+
 def get_edge_chars(network_string):
     """ Map positions in the string to edge chars
 
@@ -171,7 +436,7 @@ def get_edge_chars(network_string):
             Point(5,0): "|",
         }
     """
-    return OrderedDict(
+    return dict(
         (Point(col, row), char)
         for row, line in enumerate(network_string.split("\n"))
         for col, char in enumerate(line)
@@ -221,7 +486,8 @@ def get_neighbours(pos, edge_chars, node_chars):
 
 
 def build_edge_from_position(
-        starting_char_position, neighbour_map, node_char_to_node):
+        starting_char_position, neighbour_map, node_char_to_node,
+        point=None):
     """ Given the position of any one character on an edge, traverses the
         neighbour_map to build an ordered list of all the points on the edge
 
@@ -238,24 +504,40 @@ def build_edge_from_position(
                                     Point(2,2): "n2",
                                     Point(3,2): "n2",
                                }
+          * point: Maps positions back to `Point`s for error messages, when
+                   they are something else (e.g. `CharGrid` indexes)
+
+        The edge is walked iteratively, so edges of any length can be
+        traced in linear time.
     """
-    def follow_edge(starting_position, neighbour):
-        if neighbour in node_char_to_node:
-            return (neighbour,)
-        else:
-            a, b = neighbour_map[neighbour]
-            next_neighbour = a if b == starting_position else b
-            return (neighbour, ) + follow_edge(neighbour, next_neighbour)
+    def follow_edge(previous, position):
+        """ Walks away from `previous` until reaching a node character,
+            returning every position visited along the way (including the
+            node character)
+        """
+        path = []
+        while position not in node_char_to_node:
+            if position == starting_char_position:
+                pos = point(position) if point else position
+                raise InvalidEdgeError(
+                    "Edge at ln {}, col {} never reaches a node".format(
+                        pos.y, pos.x
+                    )
+                )
+            path.append(position)
+            a, b = neighbour_map[position]
+            previous, position = position, a if b == previous else b
+        path.append(position)
+        return path
 
     neighbour_1, neighbour_2 = sorted(neighbour_map[starting_char_position])
-    positions = list(chain(
-        reversed(follow_edge(starting_char_position, neighbour_1)),
-        (starting_char_position, ),
-        follow_edge(starting_char_position, neighbour_2)
-    ))
+    positions = follow_edge(starting_char_position, neighbour_1)
+    positions.reverse()
+    positions.append(starting_char_position)
+    positions.extend(follow_edge(starting_char_position, neighbour_2))
 
     if positions[0] > positions[-1]:
-        positions = list(reversed(positions))
+        positions.reverse()
 
     new_edge = dict(
         points=positions[1:-1],
@@ -282,34 +564,56 @@ def patch_edge_chars_over_labels(labels, edge_chars):
                 |                         |
           (vertical_label)   becomes      |
                 |                         |
-    """
-
-    edge_chars = dict(edge_chars)  # so we don't mutate
-    label_chars = OrderedDict(
-        (root_position + Point(i, 0), char)
-        for root_position, label in labels.items()
-        for i, char in enumerate(label)
-    )
-    for position, label_character in label_chars.items():
-        def neighbour(offset):
-            return edge_chars.get(position + offset)
-
-        if label_character == "(":
-            if neighbour(LEFT) == "-":
-                edge_chars[position] = "-"
-        elif label_character == ")":
-            if neighbour(RIGHT) == "-":
-                edge_chars[position] = "-"
-        elif neighbour(ABOVE) == "|" and neighbour(BELOW) == "|":
-            edge_chars[position] = "|"
-        else:
-            # since we process each label left->right, we'll have already
-            # patched characters to the left of our position during previous
-            # iterations of the loop
-            if neighbour(LEFT) == '-':
-                edge_chars[position] = '-'
 
-    return OrderedDict(sorted(edge_chars.items()))
+        `edge_chars` is patched in place and returned. If it was in
+        row-major order, it stays that way: the patched chars are moved
+        in amongst the others, rather than everything being re-sorted.
+    """
+    patched = patch_label_chars(labels, edge_chars)
+    if patched:
+        # the patched chars were added at the end, so only the chars after
+        # the first of them need moving, to be re-added in merged order
+        patched.sort()
+        originals = islice(edge_chars, len(edge_chars) - len(patched))
+        following = list(merge(
+            dropwhile(lambda position: position < patched[0], originals),
+            patched,
+        ))
+        for position in following:
+            edge_chars[position] = edge_chars.pop(position)
+    return edge_chars
+
+
+def patch_label_chars(labels, edge_chars):
+    """ Patches edge chars over `labels` in `edge_chars`, which can be any
+        mapping of {Point -> edge char} which supports `get` and item
+        assignment, and returns the positions which were patched in the
+        order they were patched (left to right through each label).
+    """
+    patched = []
+    for root_position, label in labels.items():
+        for i, label_character in enumerate(label):
+            position = Point(root_position.x + i, root_position.y)
+
+            def neighbour(offset):
+                return edge_chars.get(position + offset)
+
+            if label_character == "(":
+                edge_char = "-" if neighbour(LEFT) == "-" else None
+            elif label_character == ")":
+                edge_char = "-" if neighbour(RIGHT) == "-" else None
+            elif neighbour(ABOVE) == "|" and neighbour(BELOW) == "|":
+                edge_char = "|"
+            else:
+                # since we process each label left->right, we'll have
+                # already patched characters to the left of our position
+                # during previous iterations of the loop
+                edge_char = "-" if neighbour(LEFT) == "-" else None
+
+            if edge_char is not None:
+                edge_chars[position] = edge_char
+                patched.append(position)
+    return patched
 
 
 def char_map(text, root_position):
@@ -348,10 +652,10 @@ def map_text_chars_to_text(text_map):
             Point(5, 4): 'bar',
         }
     """
-    return OrderedDict(
-        (position, text)
+    return dict(
+        (Point(root_position.x + i, root_position.y), text)
         for root_position, text in text_map.items()
-        for position, _ in char_map(text, root_position).items()
+        for i in range(len(text))
     )
 
 
@@ -363,15 +667,186 @@ def node_iter(network_string):
             (Point(0,0), node1), (Point(9,0), (label1))
         )
     """
-    NODE_MATCH = re.compile(
-        r'('
-          r'[^ \-\\\/|]+[ ^ ]'  # any of non-edge chars, followed by  1 space # noqa
-        r')*'  # as many of ^ as are repeated (including zero)
-        r'([^ \\\/\-|]+)'  # ... followed by a group of non-edge characters
+    row, row_start = 0, 0
+    for match in TOKEN_MATCH.finditer(network_string):
+        newline, _, text = match.groups()
+        if newline:
+            row, row_start = row + 1, match.end()
+        elif text:
+            yield (text, Point(match.start() - row_start, row))
+
+
+def tokenize(network_string):
+    """ Finds the nodes, labels and edge chars of a diagram in one pass.
+
+        Returns (nodes, labels, edge_chars), as `get_nodes_and_labels`
+        would return the first two, and with `edge_chars` already patched
+        over labels (as by `patch_edge_chars_over_labels`) and in
+        row-major order.
+
+        Patching a row's labels needs the (patched) row above it and the
+        row below it, so each row is held back until the next has been
+        read, and its edge chars merged with those patched in.
+    """
+    nodes = OrderedDict()  # of the form {Point -> 'node_name'}
+    labels = OrderedDict()  # of the form {Point -> 'label'}
+    edge_chars = {}  # of the form {Point -> edge char}
+
+    previous = []  # the (patched) edge chars of the row above `current`
+    current = ([], [])  # the ([(Point, edge char)], [(Point, label)]) of
+    row_edges, row_labels = [], []  # ... a row, and of the one after it
+
+    def finish_row(previous, current, following):
+        """ Patches the labels of the `current` row, and adds its edge
+            chars to `edge_chars`, returning them as [(Point, edge char)]
+        """
+        row_edges, row_labels = current
+        if not row_labels:
+            edge_chars.update(row_edges)
+            return row_edges
+
+        around = dict(previous)
+        around.update(row_edges)
+        around.update(following)
+        patched = [
+            (position, around[position])
+            for position in patch_label_chars(dict(row_labels), around)
+        ]
+        row = list(merge(row_edges, patched, key=lambda item: item[0].x))
+        edge_chars.update(row)
+        return row
+
+    row, row_start = 0, 0
+    for match in TOKEN_MATCH.finditer(network_string):
+        newline, edge_char, text = match.groups()
+        if newline:
+            previous = finish_row(previous, current, row_edges)
+            current, row_edges, row_labels = (row_edges, row_labels), [], []
+            row, row_start = row + 1, match.end()
+            continue
+
+        position = Point(match.start() - row_start, row)
+        if edge_char:
+            row_edges.append((position, edge_char))
+        elif is_label(text):
+            labels[position] = text
+            row_labels.append((position, text))
+        else:
+            nodes[position] = text
+
+    previous = finish_row(previous, current, row_edges)
+    finish_row(previous, (row_edges, row_labels), [])
+    return nodes, labels, edge_chars
+
+
+class CharGrid(object):
+    """ A dense, row-major array of character codes for a diagram.
+
+        Rows are padded to the width of the widest row, and the whole
+        diagram is framed by a border of blank cells, so the neighbours of
+        any cell sit at fixed index offsets and can be read without any
+        bounds checks. A cell holds one of:
+
+          * BLANK: whitespace, or text which isn't part of a node
+          * NODE: a character of a node's text
+          * EDGE_CODES[char]: an edge character
+    """
+    BLANK, NODE = 0, 1
+    EDGE_CODES = {"-": 2, "|": 3, "\\": 4, "/": 5}
+
+    _NON_EDGE_CHAR = re.compile(r"[^\-|\\/]")
+    _TO_EDGE_CODE = str.maketrans(
+        {char: chr(code) for char, code in EDGE_CODES.items()}
     )
-    for row, line in enumerate(network_string.split("\n")):
-        for match in NODE_MATCH.finditer(line):
-            yield (match.group(0), Point(match.start(), row))
+    _EDGE_CODE = re.compile(b"[\x02-\x05]")
+
+    def __init__(self, lines):
+        self.stride = max((len(line) for line in lines), default=0) + 2
+        self.cells = bytearray(self.stride * (len(lines) + 2))
+        for row, line in enumerate(lines):
+            start = self.index(Point(0, row))
+            self.cells[start:start + len(line)] = (
+                self._NON_EDGE_CHAR.sub("\x00", line)
+                .translate(self._TO_EDGE_CODE)
+                .encode("latin-1")
+            )
+
+        self._char_offsets = {
+            self.EDGE_CODES[char]: tuple(map(self.offset, offsets))
+            for char, offsets in EDGE_CHAR_NEIGHBOURS.items()
+        }
+        self._abutting_offsets = tuple(
+            (self.offset(offset), self.EDGE_CODES[char])
+            for offset, char in ABUTTING.items()
+        )
+
+    def index(self, pos):
+        """ Index in `cells` of the character at `pos` """
+        return (pos.y + 1) * self.stride + pos.x + 1
+
+    def offset(self, offset):
+        """ Index delta between a cell and the cell at `offset` from it """
+        return offset.y * self.stride + offset.x
+
+    def point(self, index):
+        """ Position of the character at `index` in `cells` """
+        y, x = divmod(index, self.stride)
+        return Point(x - 1, y - 1)
+
+    def edge_indexes(self):
+        """ Yields the index of every edge character, in row-major order """
+        for match in self._EDGE_CODE.finditer(self.cells):
+            yield match.start()
+
+    def mark_nodes(self, nodes):
+        """ Marks every character of every node's text as a NODE cell """
+        for root_position, text in nodes.items():
+            start = self.index(root_position)
+            self.cells[start:start + len(text)] = bytes(
+                [self.NODE]
+            ) * len(text)
+
+    def patch_labels(self, labels):
+        """ Grid equivalent of `patch_edge_chars_over_labels` """
+        cells, stride = self.cells, self.stride
+        dash, pipe = self.EDGE_CODES["-"], self.EDGE_CODES["|"]
+        for root_position, label in labels.items():
+            start = self.index(root_position)
+            for index, label_character in enumerate(label, start):
+                if label_character == "(":
+                    if cells[index - 1] == dash:
+                        cells[index] = dash
+                elif label_character == ")":
+                    if cells[index + 1] == dash:
+                        cells[index] = dash
+                elif (cells[index - stride] == pipe
+                        and cells[index + stride] == pipe):
+                    cells[index] = pipe
+                elif cells[index - 1] == dash:
+                    cells[index] = dash
+
+    def map_text_chars_to_text(self, text_map):
+        """ Grid equivalent of `map_text_chars_to_text` """
+        return {
+            index: text
+            for root_position, text in text_map.items()
+            for index in range(
+                self.index(root_position),
+                self.index(root_position) + len(text)
+            )
+        }
+
+    def neighbours(self, index):
+        """ Grid equivalent of `get_neighbours` """
+        cells = self.cells
+        neighbouring_indexes = set()
+        for offset in self._char_offsets[cells[index]]:
+            if cells[index + offset] != self.BLANK:
+                neighbouring_indexes.add(index + offset)
+        for offset, code in self._abutting_offsets:
+            if cells[index + offset] == code:
+                neighbouring_indexes.add(index + offset)
+        return tuple(neighbouring_indexes)
 
 
 class InvalidEdgeError(Exception):
@@ -384,14 +859,34 @@ class AnsiColours:
     RESET = "\033[0m"
 
 
+_colorama_initialised = False
+
+
+def init_colorama():
+    """ Initialises colorama once; every `colorama.init()` wraps stdout and
+        stderr again, so calling it for every error would eventually
+        overflow the stack
+    """
+    global _colorama_initialised
+    if not _colorama_initialised:
+        import colorama
+
+        colorama.init()
+        _colorama_initialised = True
+
+
 def highlight_bad_edge_characters(
     network_string: str, relevant_char_positions: List[Point]
 ) -> str:
     """Highlights all the characters specified in `relevant_char_positions`
-    using ANSI colour codes"""
+    using ANSI colour codes. Diagrams of more than ERROR_MAP_MAX_CHARS only
+    have a window around them rendered (see `highlight_window`)"""
+    from colorama import Style, Fore
+
     try:
-        colorama.init()
-        lines = network_string.splitlines(keepends=True)
+        init_colorama()
+        if len(network_string) > ERROR_MAP_MAX_CHARS:
+            return highlight_window(network_string, relevant_char_positions)
 
         quote_char = "\'" if "\"" in network_string else "\""
         quote_val = (
@@ -403,8 +898,11 @@ def highlight_bad_edge_characters(
 
         # first we calculate the index in `network_string` of each character
         # we want to highlight
+        offsets = line_offsets(
+            network_string, max(pos.y for pos in relevant_char_positions)
+        )
         char_indexes = sorted(
-            sum(len(el) for el in lines[0:char_pos.y])
+            offsets[char_pos.y]
             + char_pos.x  # depth into relevant line
             for char_pos in relevant_char_positions
         )
@@ -475,8 +973,84 @@ def highlight_bad_edge_characters(
         return ""
 
 
+def highlight_window(network_string, relevant_char_positions):
+    """ Highlights the characters at `relevant_char_positions` like
+        `highlight_bad_edge_characters`, but only renders the rows and
+        columns around them (see ERROR_WINDOW_ROWS and
+        ERROR_WINDOW_COLUMNS), under rulers of the column numbers and
+        beside the row numbers. Rows and columns left out are marked with
+        '...'; the rows above are counted, but the rows below only noted.
+
+        Only the rows down to the window are scanned for line breaks, and
+        only the window itself is copied, so the error map stays small and
+        quick to render however big the diagram is.
+    """
+    from colorama import Style, Fore
+
+    highlighted = set(map(tuple, relevant_char_positions))
+    top = max(min(y for _, y in highlighted) - ERROR_WINDOW_ROWS, 0)
+    left = max(min(x for x, _ in highlighted) - ERROR_WINDOW_COLUMNS, 0)
+    right = max(x for x, _ in highlighted) + ERROR_WINDOW_COLUMNS + 1
+    offsets = line_offsets(
+        network_string, max(y for _, y in highlighted) + ERROR_WINDOW_ROWS + 1
+    )
+    offsets.append(len(network_string) + 1)  # i.e. after the last row
+    bottom = min(
+        max(y for _, y in highlighted) + ERROR_WINDOW_ROWS, len(offsets) - 2
+    )
+    more_below = network_string.find("\n", offsets[bottom]) != -1
+
+    gutter = " " * len(str(bottom)) + "   "
+    numbers, ticks = [" "] * (right - left), []
+    for x in range(left, right):
+        if x % 10 == 0 and x - left + len(str(x)) <= len(numbers):
+            numbers[x - left:x - left + len(str(x))] = str(x)
+        ticks.append("|" if x % 10 == 0 else ":" if x % 5 == 0 else ".")
+
+    error_lines = ["network_string, ln {}-{}, col {}-{}:".format(
+        top, bottom, left, right - 1
+    )]
+    if top:
+        error_lines.append("{}... {} rows above ...".format(gutter, top))
+    error_lines.append(gutter + "    " + "".join(numbers).rstrip())
+    error_lines.append(gutter + "    " + "".join(ticks))
+    for y in range(top, bottom + 1):
+        start, end = offsets[y], offsets[y + 1] - 1
+        text = network_string[min(start + left, end):min(start + right, end)]
+        error_lines.append("{:>{}} | {}{}{}".format(
+            y, len(gutter) - 3,
+            "... " if left and end > start else "    ",
+            "".join(
+                f"{Fore.RED + Style.BRIGHT}{char}{Style.RESET_ALL}"
+                if (x, y) in highlighted else char
+                for x, char in enumerate(text, left)
+            ),
+            " ..." if end > start + right else "",
+        ))
+    if more_below:
+        error_lines.append("{}... more rows below ...".format(gutter))
+    return Style.RESET_ALL + ("\n" + Style.RESET_ALL).join(error_lines)
+
+
+def line_offsets(network_string, last_row):
+    """ The index in `network_string` at which each row starts, up to and
+        including `last_row` (or to the end of the string, if it has fewer
+        rows than that)
+    """
+    offsets = [0]
+    find = network_string.find
+    while len(offsets) <= last_row:
+        end = find("\n", offsets[-1])
+        if end == -1:
+            break
+        offsets.append(end + 1)
+    return offsets
+
+
 def draw(edge_chars, nodes=None):
     """ Redraws a char_map and node_char map """
+    from .canvas import draw_chars  # which itself builds on this module
+
     nodes = nodes or {}
     node_start_map = OrderedDict()
     for position, node_label in nodes.items():
@@ -486,21 +1060,7 @@ def draw(edge_chars, nodes=None):
             if position < node_start_map[node_label]:
                 node_start_map[node_label] = position
 
-    all_chars = sorted(chain(
-        ((val, key) for key, val in node_start_map.items()),
-        edge_chars.items()),
-        key=lambda x: x[0]
-    )
-
-    string = ""
-    cursor = Point(0, 0)
-    for position, label in all_chars:
-        if cursor.y < position.y:
-            string += '\n' * (position.y - cursor.y)
-            cursor = Point(0, position.y+1)
-        if cursor.x < position.x:
-            string += ' ' * (position.x - cursor.x)
-            cursor = position
-        string += label
-        cursor = Point(position.x + len(label), position.y)
-    return string
+    return draw_chars(chain(
+        ((position, label) for label, position in node_start_map.items()),
+        edge_chars.items(),
+    ))
@@ -0,0 +1,101 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import os
+from collections import deque
+from itertools import islice
+from typing import NamedTuple, Optional
+
+from .arrays import ArrayGraph
+from .asciigraf import graph_from_ascii
+
+
+class BatchResult(NamedTuple):
+    """ The outcome of parsing `strings[index]`: either `graph` or `error`
+        is set
+    """
+    index: int
+    graph: Optional[ArrayGraph]
+    error: Optional[Exception]
+
+
+def graphs_from_ascii(
+        strings, workers=None, chunksize=32, ordered=True, engine="auto"):
+    """ Parses many diagrams across a pool of `workers` processes
+        (defaulting to one per CPU), yielding a `BatchResult` for each.
+
+        e.g.
+
+        for result in graphs_from_ascii(diagrams, workers=8):
+            if result.error:
+                print("diagram", result.index, "is broken:", result.error)
+            else:
+                graph = result.graph.to_networkx()
+
+        Diagrams are sent to the workers `chunksize` at a time. With
+        `ordered=True` results come back in the same order as `strings`;
+        otherwise each chunk's results are yielded as soon as it's done. A
+        diagram which fails to parse doesn't stop the rest of the batch:
+        its result carries the exception instead of a graph.
+
+        `strings` can be any iterable, and is only read a few chunks ahead
+        of the results which have been yielded.
+    """
+    from concurrent.futures import (  # slow to import
+        FIRST_COMPLETED, ProcessPoolExecutor, wait,
+    )
+
+    workers = workers or os.cpu_count() or 1
+    chunks = _chunked(enumerate(strings), chunksize)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+
+        def submit_next_chunk():
+            chunk = next(chunks, None)
+            if chunk is not None:
+                pending.append(executor.submit(_parse_chunk, chunk, engine))
+
+        for _ in range(workers * 2):
+            submit_next_chunk()
+
+        try:
+            while pending:
+                if ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+                submit_next_chunk()
+                yield from future.result()
+        finally:
+            # if the caller stopped early, don't parse what they won't read
+            for future in pending:
+                future.cancel()
+
+
+def _chunked(iterable, size):
+    iterator = iter(iterable)
+    while True:
+        chunk = tuple(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _parse_chunk(chunk, engine):
+    results = []
+    for index, network_string in chunk:
+        try:
+            graph = graph_from_ascii(
+                network_string, engine=engine, backend="arrays"
+            )
+            results.append(BatchResult(index, graph, None))
+        except Exception as error:
+            results.append(BatchResult(index, None, error))
+    return results
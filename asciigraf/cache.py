@@ -0,0 +1,133 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from . import asciigraf
+from .arrays import ArrayGraph
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    currsize: int
+    maxsize: int
+
+
+class ParseCache(object):
+    """ A size-bounded, least-recently-used cache of parsed diagrams.
+
+        Diagrams are keyed by their text (and any keyword arguments passed
+        through to `graph_from_ascii`), so the same drawing is only parsed
+        once no matter where it comes from:
+
+            cache = ParseCache(maxsize=256)
+            graph = cache.graph_from_ascii(\"\"\"
+                A---B
+            \"\"\")
+
+        Cached graphs are frozen with `networkx.freeze`. By default each
+        call hands out a copy of the cached graph which can be modified
+        freely (attribute values such as `points` lists are still shared
+        with the cache, so replace them rather than mutating them in
+        place). With `copy=False` the frozen graph itself is returned.
+        `ArrayGraph`s (from `backend="arrays"`) can't be frozen, but are
+        copied in the same way, with none of their arrays shared.
+
+        When several threads ask for the same uncached diagram at once,
+        only one of them parses it and the others wait for its result.
+    """
+
+    def __init__(self, maxsize=128, copy=True):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.copy = copy
+
+        self._lock = threading.Lock()
+        self._graphs = OrderedDict()  # of the form {key -> frozen graph}
+        self._parsing = {}  # of the form {key -> Future}
+        self._hits = self._misses = self._evictions = 0
+
+    def graph_from_ascii(self, network_string, stats=None, **kwargs):
+        """ `asciigraf.graph_from_ascii`, served from the cache if possible
+
+            `stats` are only filled in when the diagram is actually parsed
+        """
+        key = (network_string, tuple(sorted(kwargs.items())))
+        with self._lock:
+            if key in self._graphs:
+                self._hits += 1
+                self._graphs.move_to_end(key)
+                return self._hand_out(self._graphs[key])
+
+            parse = self._parsing.get(key)
+            is_parsing = parse is None
+            if is_parsing:
+                from concurrent.futures import Future  # slow to import
+
+                self._misses += 1
+                parse = self._parsing[key] = Future()
+            else:
+                # another thread is already parsing this diagram
+                self._hits += 1
+
+        if is_parsing:
+            self._parse(key, parse, network_string, stats, kwargs)
+        return self._hand_out(parse.result())
+
+    def _parse(self, key, parse, network_string, stats, kwargs):
+        try:
+            graph = asciigraf.graph_from_ascii(
+                network_string, stats=stats, **kwargs
+            )
+            if not isinstance(graph, ArrayGraph):
+                import networkx
+
+                graph = networkx.freeze(graph)
+        except BaseException as e:
+            with self._lock:
+                del self._parsing[key]
+            parse.set_exception(e)
+            return
+
+        with self._lock:
+            del self._parsing[key]
+            self._graphs[key] = graph
+            while len(self._graphs) > self.maxsize:
+                self._graphs.popitem(last=False)
+                self._evictions += 1
+        parse.set_result(graph)
+
+    def _hand_out(self, graph):
+        if not self.copy:
+            return graph
+        if isinstance(graph, ArrayGraph):
+            return graph.copy()
+        # built afresh rather than with `graph.copy()`, which deep copies
+        # on older networkx, along with the methods `freeze` overrode
+        return graph.__class__(graph)
+
+    def info(self):
+        """ Hit, miss and eviction counters for the cache """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                len(self._graphs),
+                self.maxsize,
+            )
+
+    def clear(self):
+        """ Drops every cached graph and resets the counters """
+        with self._lock:
+            self._graphs.clear()
+            self._hits = self._misses = self._evictions = 0
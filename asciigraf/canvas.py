@@ -0,0 +1,283 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from itertools import chain
+
+from .arrays import ArrayGraph
+from .asciigraf import ABOVE, ABUTTING, BELOW, LEFT, RIGHT
+from .point import Point
+
+ORTHOGONAL = (LEFT, RIGHT, ABOVE, BELOW)
+
+
+class Canvas(object):
+    """ Rows of characters to draw text onto.
+
+        Each row is a list of one-character strings, so drawing is just
+        slice assignment, and `render` joins everything up once at the
+        end. Rows can be allocated up front with `widths`, and writes past
+        the end of the canvas grow it.
+    """
+    __slots__ = ("rows",)
+
+    def __init__(self, widths=()):
+        self.rows = [[" "] * width for width in widths]
+
+    @classmethod
+    def fitting(cls, items):
+        """ A canvas just big enough for `items`, of the form
+            [((x, y), text), ...]
+        """
+        widths = []
+        for (x, y), text in items:
+            if y >= len(widths):
+                widths.extend([0] * (y + 1 - len(widths)))
+            widths[y] = max(widths[y], x + len(text))
+        return cls(widths)
+
+    def get(self, x, y):
+        """ The character at (x, y), which is blank off the canvas """
+        if 0 <= y < len(self.rows) and 0 <= x < len(self.rows[y]):
+            return self.rows[y][x]
+        return " "
+
+    def write(self, x, y, text):
+        rows = self.rows
+        if y >= len(rows):
+            rows.extend([] for _ in range(y + 1 - len(rows)))
+        row = rows[y]
+        end = x + len(text)
+        if end > len(row):
+            row.extend(" " * (end - len(row)))
+        row[x:end] = text
+
+    def render(self):
+        return "\n".join(map("".join, self.rows))
+
+
+def draw_chars(items):
+    """ Draws `items`, of the form [((x, y), text), ...], in one pass """
+    canvas = Canvas()
+    write = canvas.write
+    for (x, y), text in items:
+        write(x, y, text)
+    return canvas.render()
+
+
+def draw_graph(graph):
+    """ Draws a graph from its nodes' `position` and its edges' `points`
+        attributes; parsing the drawing gives back the same graph, as long
+        as each node is drawn once.
+
+        `graph` can be a networkx graph from `graph_from_ascii` (or one
+        built to look like it) or an `ArrayGraph`. Edge characters are
+        worked out from the directions the points step in, and labels are
+        drawn on the first stretch of their edge with room for them.
+
+        A graph only keeps one `position` per node, so graphs parsed from
+        diagrams which draw a node more than once (as `ascii_from_graph`
+        does for the edges it can't route) can't be drawn; they raise a
+        ValueError.
+    """
+    nodes, edges = graph_geometry(graph)
+    text = {node: str(node) for node, _ in nodes}
+    position = dict(nodes)
+
+    canvas = Canvas.fitting(chain(
+        ((pos, text[node]) for node, pos in nodes),
+        (((x, y), " ") for _, _, points, _ in edges for x, y in points),
+    ))
+    for u, v, points, _ in edges:
+        if not points:
+            continue
+        start, end = orient(
+            (u, v), points, (position[u], text[u]), (position[v], text[v])
+        )
+        for (x, y), char in zip(points, edge_chars(points, start, end)):
+            canvas.write(x, y, char)
+    for node, (x, y) in nodes:
+        canvas.write(x, y, text[node])
+    for _, _, points, label in edges:
+        if label is not None:
+            draw_label(canvas, points, "({})".format(label))
+    return canvas.render()
+
+
+def graph_geometry(graph):
+    """ The `position` of each node and the `points` and `label` of each
+        edge of a networkx graph or an `ArrayGraph`, as
+        ([(node, (x, y)), ...], [(u, v, [(x, y), ...], label), ...])
+
+        Raises a ValueError if an edge has no `points`, e.g. because the
+        graph was parsed with `geometry="none"`.
+    """
+    if isinstance(graph, ArrayGraph):
+        nodes = [
+            (name, tuple(graph.positions[2 * i:2 * i + 2]))
+            for i, name in enumerate(graph.nodes)
+        ]
+        edges = [
+            (
+                graph.nodes[source],
+                graph.nodes[target],
+                graph.edge_points(i),
+                graph.labels[i],
+            )
+            for i, (source, target) in enumerate(
+                zip(graph.sources, graph.targets)
+            )
+        ]
+    else:
+        import networkx
+
+        nodes = list(
+            networkx.get_node_attributes(graph, "position").items()
+        )
+        edges = []
+        for u, v, data in graph.edges(data=True):
+            if "points" not in data:
+                raise ValueError(
+                    "Edge ({!r}, {!r}) has no points; the graph needs its "
+                    "geometry, so it can't be parsed with "
+                    "geometry=\"none\"".format(u, v)
+                )
+            edges.append((u, v, data["points"], data.get("label")))
+    return nodes, edges
+
+
+def orient(edge, points, node_1, node_2):
+    """ The positions of the characters of each node, of the form
+        {Point}, as (the node `points` start at, the node they end at).
+
+        Raises a ValueError if `points` doesn't run from one node to the
+        other, e.g. because one of them was drawn more than once and
+        `edge` is attached to a copy at another position.
+    """
+    def node_chars(node):
+        (x, y), text = node
+        return {Point(x + i, y) for i in range(len(text))}
+
+    chars_1, chars_2 = node_chars(node_1), node_chars(node_2)
+    if touching(points[0], chars_1) and touching(points[-1], chars_2):
+        return chars_1, chars_2
+    if touching(points[0], chars_2) and touching(points[-1], chars_1):
+        return chars_2, chars_1
+    raise ValueError(
+        "Edge {!r} doesn't run between the positions of its nodes; a node "
+        "drawn more than once can't be drawn from a graph".format(edge)
+    )
+
+
+def touching(pos, node_chars):
+    return bool(directions_to(Point(*pos), node_chars))
+
+
+def directions_to(pos, node_chars):
+    """ The offsets from `pos` to any neighbouring characters in
+        `node_chars`, straight ones first
+    """
+    offsets = sorted(ABUTTING, key=lambda offset: offset not in ORTHOGONAL)
+    return [offset for offset in offsets if pos + offset in node_chars]
+
+
+def edge_chars(points, start, end):
+    """ Picks a character for each of an edge's `points`, such that every
+        step along the edge, from the characters of the `start` node to
+        those of the `end` node, is joined up.
+
+        Each edge character joins up the two steps in its own direction;
+        a node character joins nothing, so the characters next to nodes
+        have to point at them, and corners have to leave one of their
+        steps to the next character along.
+    """
+    points = [Point(*pos) for pos in points]
+    last = len(points) - 1
+    chars = []
+    joined = False  # whether the step into the current point is joined
+    for i, pos in enumerate(points):
+        back = (
+            directions_to(pos, start) if i == 0 else [points[i - 1] - pos]
+        )
+        ahead = (
+            directions_to(pos, end) if i == last else [points[i + 1] - pos]
+        )
+        straight = [
+            offset for offset in back
+            if Point(-offset.x, -offset.y) in ahead
+        ]
+        if straight:
+            direction, joined = straight[0], True
+        elif not joined:
+            # the step back has to be joined here, which leaves the step
+            # ahead to the next character
+            direction, joined = (back or ahead)[0], False
+        else:
+            direction, joined = (ahead or back)[0], True
+        chars.append(ABUTTING[direction])
+    return chars
+
+
+def draw_label(canvas, points, label):
+    """ Writes `label` over a straight stretch of the edge through
+        `points`, if it has one with room for it, returning the `Point`
+        it was written at (or None if it wasn't)
+    """
+    points = [Point(*pos) for pos in points]
+    return (
+        try_horizontal_label(canvas, points, label)
+        or try_vertical_label(canvas, points, label)
+    )
+
+
+def try_horizontal_label(canvas, points, label):
+    # the label needs an edge character either side of it, for the edge
+    # to be patched back together underneath it
+    span = len(label) + 2
+    for i in range(len(points) - span + 1):
+        first, last = points[i], points[i + span - 1]
+        if (
+            first.y == last.y
+            and abs(last.x - first.x) == span - 1
+            and all(pos.y == first.y for pos in points[i:i + span])
+            and canvas.get(first.x, first.y) == "-"
+            and canvas.get(last.x, last.y) == "-"
+        ):
+            canvas.write(min(first.x, last.x) + 1, first.y, label)
+            return Point(min(first.x, last.x) + 1, first.y)
+    return None
+
+
+def try_vertical_label(canvas, points, label):
+    # the label crosses the edge at one of its middle characters, which
+    # needs a '|' above and below it
+    crossing = len(label) // 2
+    for i in range(1, len(points) - 1):
+        above, pos, below = sorted(points[i - 1:i + 2], key=lambda p: p.y)
+        if not (
+            above + BELOW == pos == below + ABOVE
+            and canvas.get(above.x, above.y) == "|"
+            and canvas.get(below.x, below.y) == "|"
+        ):
+            continue
+        x = pos.x - crossing
+        # the cells the label covers, and two either side (so it isn't
+        # read as more words of a neighbouring node), must be free, and
+        # none of it but the crossing may sit between two '|'s
+        if x < 0 or any(
+            canvas.get(x + i, pos.y) != " "
+            for i in range(-2, len(label) + 2)
+            if i != crossing
+        ) or any(
+            canvas.get(x + i, pos.y - 1) == "|"
+            and canvas.get(x + i, pos.y + 1) == "|"
+            for i in range(len(label))
+            if i != crossing
+        ):
+            continue
+        canvas.write(x, pos.y, label)
+        return Point(x, pos.y)
+    return None
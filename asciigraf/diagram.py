@@ -0,0 +1,354 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from . import stream
+from .asciigraf import (
+    build_edge_from_position,
+    get_neighbours,
+    invalid_edge_error,
+    patch_label_chars,
+    trace_edges,
+)
+from .point import Point
+
+
+class Diagram(object):
+    """ An ascii diagram of a network which can be edited, and keeps its
+        networkx graph up to date as it is.
+
+        e.g.
+
+        diagram = Diagram("A---B")
+        diagram.replace(0, 4, 5, "C")  # replaces 'B' with 'C'
+        diagram.insert_lines(1, ["|", "D"])  # hooks 'D' up to 'A'
+        diagram.graph.edges()  -> [("A", "C"), ("A", "D")]
+
+        An edit only re-parses the rows it touches, plus the rows either
+        side of them which can see the change (a row's label patching
+        looks one row up and down, and so do the neighbours of its edge
+        characters). Edges passing through those rows are re-traced, and
+        the graph is patched in place, so edits within the existing lines
+        cost in proportion to the rows around them.
+
+        Edits which insert or delete lines aren't incremental in that way:
+        the graph holds absolute positions and points, so every node and
+        edge below the edit has to be moved, and those edits cost in
+        proportion to the rest of the diagram below them.
+
+        Edits which would leave an invalid drawing raise an
+        `InvalidEdgeError` and aren't applied.
+
+        Unlike `graph_from_ascii`, the graph doesn't carry the drawing as
+        its `ascii_string` attribute, since it would need rebuilding on
+        every edit; it's available as `Diagram.text` instead.
+    """
+
+    def __init__(self, network_string=""):
+        import networkx
+
+        self.graph = networkx.Graph()
+        self._rows = []
+        self._node_rows = {}  # of the form {'node_name' -> {_Row, ...}}
+        self._pair_edges = {}  # of the form {frozenset(nodes) -> [edge]}
+        self._replace_rows(0, 0, network_string.split("\n"))
+
+    @property
+    def text(self):
+        """ The diagram, as it would be passed to `graph_from_ascii` """
+        return "\n".join(row.line for row in self._rows)
+
+    @property
+    def lines(self):
+        return [row.line for row in self._rows]
+
+    def replace(self, row, start_col, end_col, text):
+        """ Replaces the characters of line `row` from `start_col` up to
+            `end_col` with `text` (which may span several lines)
+        """
+        line = self._rows[row].line
+        if not 0 <= start_col <= end_col:
+            raise IndexError("Invalid column range for replace")
+        line = line.ljust(end_col)
+        self._replace_rows(
+            row, row + 1,
+            (line[:start_col] + text + line[end_col:]).split("\n"),
+        )
+
+    def insert_lines(self, row, lines):
+        """ Inserts `lines` before line `row` """
+        if not 0 <= row <= len(self._rows):
+            raise IndexError("Line {} is out of range".format(row))
+        self._replace_rows(row, row, list(lines))
+
+    def delete_lines(self, start, stop):
+        """ Deletes lines `start` up to (but not including) `stop` """
+        if not 0 <= start <= stop <= len(self._rows):
+            raise IndexError("Invalid line range for delete")
+        self._replace_rows(start, stop, [])
+
+    def _replace_rows(self, start, stop, lines):
+        """ Replaces rows `start` to `stop` with `lines`, and updates the
+            graph to match. This is O(rows touched) when `lines` replaces
+            as many rows as it removes, and O(rows below) otherwise.
+        """
+        delta = len(lines) - (stop - start)
+        end = start + len(lines)  # the first row after `lines`
+        new = _EditedRows(self._rows, start, stop, end, delta)
+
+        # first, re-tokenize and re-patch the edited rows, the row before
+        # them, and as many rows after them as have their patching changed
+        first = max(start - 1, 0)
+        edge_chars = stream._RowView(new, "edge_chars")
+        if first < new.n_rows:
+            new.tokenize(first, lines)
+        y = first
+        while y < new.n_rows:
+            if y + 1 < new.n_rows:
+                new.tokenize(y + 1, lines)
+            _patch(new[y], edge_chars)
+            if y >= end and new[y].edge_chars == new.old(y).edge_chars:
+                if y + 1 < new.n_rows and y + 1 >= end:
+                    new.untokenize(y + 1)
+                break
+            y += 1
+        patched_end = min(y + 1, new.n_rows)
+
+        # next, work out the neighbours of every edge character in (or next
+        # to) those rows
+        band_start, band_end = max(first - 1, 0), min(
+            patched_end + 1, new.n_rows
+        )
+        node_chars = stream._RowView(new, "node_chars")
+        links = {}  # of the form {y -> {x -> (offset, offset)}}
+        for y in range(band_start, band_end):
+            links[y] = {}
+            for x in sorted(new[y].edge_chars):
+                pos = Point(x, y)
+                neighbours = get_neighbours(pos, edge_chars, node_chars)
+                if len(neighbours) != 2:
+                    raise invalid_edge_error(
+                        "\n".join(new[i].line for i in range(new.n_rows)),
+                        pos, neighbours
+                    )
+                links[y][x] = tuple(
+                    neighbour - pos for neighbour in neighbours
+                )
+
+        # then re-trace every edge which passes through those rows
+        neighbour_map = _Links(new, links, band_start, band_end)
+        new_edges = trace_edges(
+            neighbour_map, node_chars, stream._RowView(new, "label_chars"),
+        )
+        for edge in new_edges:
+            if edge["nodes"][0] == edge["nodes"][1]:
+                # a loop back onto the same node character runs in whichever
+                # direction it was traced from, so trace it from its first
+                # character, as a full parse would
+                edge["points"] = build_edge_from_position(
+                    min(edge["points"]), neighbour_map, node_chars
+                )["points"]
+
+        # the edit is good: drop the old edges and rows and move everything
+        # below the edit
+        dirty_pairs, dirty_nodes = set(), set()
+        old_band = range(band_start, band_end - delta)
+        removed = {
+            id(edge): edge
+            for y in old_band
+            for edge in self._rows[y].edge_of.values()
+        }
+        for edge in removed.values():
+            for pos in edge["points"]:
+                self._rows[pos.y].edge_of.pop(pos.x, None)
+            self._forget_edge(edge, dirty_pairs)
+
+        if delta:
+            below = {
+                id(edge): edge
+                for row in self._rows[band_end - delta:]
+                for edge in row.edge_of.values()
+            }
+            for edge in below.values():
+                edge["points"] = [
+                    Point(pos.x, pos.y + delta) for pos in edge["points"]
+                ]
+                dirty_pairs.add(frozenset(edge["nodes"]))
+
+        for row in self._rows[first:patched_end - delta]:
+            for node in row.nodes.values():
+                self._node_rows[node].discard(row)
+                dirty_nodes.add(node)
+        self._rows[first:patched_end - delta] = [
+            new[y] for y in range(first, patched_end)
+        ]
+        for y in range(first, patched_end):
+            for node in self._rows[y].nodes.values():
+                self._node_rows.setdefault(node, set()).add(self._rows[y])
+                dirty_nodes.add(node)
+
+        for y in range(first, len(self._rows) if delta else patched_end):
+            self._rows[y].y = y
+            if delta:
+                dirty_nodes.update(self._rows[y].nodes.values())
+
+        for y in range(band_start, band_end):
+            self._rows[y].links = links[y]
+            self._rows[y].edge_of = {}
+        for edge in new_edges:
+            for pos in edge["points"]:
+                self._rows[pos.y].edge_of[pos.x] = edge
+            self._pair_edges.setdefault(frozenset(edge["nodes"]), []).append(
+                edge
+            )
+            dirty_pairs.add(frozenset(edge["nodes"]))
+
+        # and finally bring the graph up to date
+        for pair in dirty_pairs:
+            self._sync_edge(pair)
+        for node in dirty_nodes:
+            self._sync_node(node)
+
+    def _forget_edge(self, edge, dirty_pairs):
+        pair = frozenset(edge["nodes"])
+        self._pair_edges[pair] = [
+            other for other in self._pair_edges[pair] if other is not edge
+        ]
+        dirty_pairs.add(pair)
+
+    def _sync_edge(self, pair):
+        """ Updates the graph's edge between a pair of nodes to match
+            what `build_networkx_graph` would produce
+        """
+        edges = sorted(
+            self._pair_edges.get(pair, []),
+            key=lambda edge: min(edge["points"]),
+        )
+        if not edges:
+            self._pair_edges.pop(pair, None)
+            nodes = tuple(pair)
+            u, v = nodes if len(nodes) == 2 else nodes * 2  # self-loops
+            if self.graph.has_edge(u, v):
+                self.graph.remove_edge(u, v)
+            return
+
+        # like `build_networkx_graph`, later edges win
+        data = {
+            "length": len(edges[-1]["points"]),
+            "points": [tuple(pos) for pos in edges[-1]["points"]],
+        }
+        for edge in edges:
+            if "label" in edge:
+                data["label"] = edge["label"][1:-1]
+
+        u, v = edges[-1]["nodes"]
+        self.graph.add_edge(u, v)
+        self.graph[u][v].clear()
+        self.graph[u][v].update(data)
+
+    def _sync_node(self, node):
+        """ Updates (or removes) a node in the graph to match what
+            `build_networkx_graph` would produce
+        """
+        rows = self._node_rows.get(node)
+        if not rows:
+            self._node_rows.pop(node, None)
+            if self.graph.has_node(node):
+                self.graph.remove_node(node)
+            return
+
+        # like `build_networkx_graph`, the last occurrence of a node wins
+        position = max(
+            Point(x, row.y)
+            for row in rows
+            for x, name in row.nodes.items()
+            if name == node
+        )
+        self.graph.add_node(node, position=tuple(position))
+
+
+class _Row(stream._Row):
+    """ A `stream._Row` which also keeps track of its edge characters'
+        neighbours, and the edges they're part of
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(_Row, self).__init__(*args, **kwargs)
+        self.links = {}  # of the form {x -> (offset, offset)}
+        self.edge_of = {}  # of the form {x -> edge}
+
+
+def _patch(row, edge_chars):
+    patch_label_chars(
+        {Point(x, row.y): label for x, label in row.labels.items()},
+        edge_chars,
+    )
+
+
+class _EditedRows(object):
+    """ The rows of a diagram as they will be after an edit: rows which
+        have been re-tokenized, layered over the rows from before the edit
+    """
+
+    def __init__(self, rows, start, stop, end, delta):
+        self.n_rows = len(rows) + delta
+        self._rows = rows
+        self._start, self._stop, self._end = start, stop, end
+        self._delta = delta
+        self._tokenized = {}  # of the form {y -> _Row}
+
+    def old(self, y):
+        """ The row before the edit which becomes row `y` """
+        if y < self._start:
+            return self._rows[y]
+        if y >= self._end:
+            return self._rows[y - self._delta]
+        return None
+
+    def tokenize(self, y, lines):
+        if self._start <= y < self._end:
+            line = lines[y - self._start]
+        else:
+            line = self.old(y).line
+        self._tokenized[y] = _Row.from_text(y, line)
+
+    def untokenize(self, y):
+        del self._tokenized[y]
+
+    def get(self, y, default=None):
+        if not 0 <= y < self.n_rows:
+            return default
+        return self[y]
+
+    def __getitem__(self, y):
+        if y in self._tokenized:
+            return self._tokenized[y]
+        return self.old(y)
+
+
+class _Links(object):
+    """ The neighbour map of a diagram after an edit, for `trace_edges`.
+
+        Iterates over the edge characters in the re-parsed rows, and looks
+        up the neighbours of any edge character in the diagram
+    """
+
+    def __init__(self, rows, links, band_start, band_end):
+        self._rows = rows
+        self._links = links
+        self._band = range(band_start, band_end)
+
+    def __iter__(self):
+        for y in self._band:
+            for x in sorted(self._links[y]):
+                yield Point(x, y)
+
+    def __getitem__(self, pos):
+        if pos.y in self._links:
+            offsets = self._links[pos.y][pos.x]
+        else:
+            offsets = self._rows[pos.y].links[pos.x]
+        return tuple(pos + offset for offset in offsets)
@@ -0,0 +1,275 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import os
+import struct
+import sys
+from array import array
+
+from . import asciigraf
+from .arrays import TYPECODE, ArrayGraph
+
+CACHE_DIRNAME = "__asciigraf_cache__"
+SUFFIX = ".agc"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# magic, byte order, then the number of nodes, edges and points, and the
+# sizes of the node names and labels, which come next; the arrays follow
+HEADER = struct.Struct("<4sc3x5Q")
+MAGIC = b"AGC1"
+BYTE_ORDER = b"l" if sys.byteorder == "little" else b"b"
+
+
+class DiskCache(object):
+    """ A persistent cache of parsed diagrams, shared between processes,
+        in the spirit of `__pycache__`:
+
+            cache = DiskCache()
+            graph = cache.graph_from_path("tests/fixtures/feeder.txt")
+
+        Each diagram is stored as its `ArrayGraph`, in a compact binary
+        file named for a hash of the drawing and the asciigraf version, so
+        a changed drawing or a new release never reads a stale entry.
+        Loading an entry only copies its arrays out of the file, which is
+        much cheaper than parsing the drawing again.
+
+        Entries of `graph_from_path` are kept in a `__asciigraf_cache__`
+        directory next to the drawing, and those of `graph_from_ascii` in
+        the user's cache directory (e.g. ~/.cache/asciigraf), unless a
+        `directory` is given for all of them. Entries are written to a
+        temporary file and moved into place, so processes sharing a cache
+        (e.g. pytest-xdist workers) never read half-written ones. Once a
+        directory holds more than `max_bytes` of entries, the least
+        recently used are deleted.
+
+        Graphs come back as `graph_from_ascii` would return them, with
+        `backend="arrays"` for an `ArrayGraph`.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        if max_bytes < 0:
+            raise ValueError("max_bytes can't be negative")
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def graph_from_ascii(self, network_string, backend="networkx"):
+        """ `asciigraf.graph_from_ascii`, loaded from the cache if possible
+        """
+        directory = self.directory or default_directory()
+        graph = self._load_or_parse(
+            directory,
+            network_string.encode("utf-8", "surrogatepass"),
+            lambda: network_string,
+        )
+        return as_backend(graph, backend, lambda: network_string)
+
+    def graph_from_path(self, path, backend="networkx"):
+        """ Parses the ascii (or utf-8) drawing in the file at `path`, or
+            loads it from the cache if the file hasn't changed since
+        """
+        directory = self.directory or os.path.join(
+            os.path.dirname(os.path.abspath(path)), CACHE_DIRNAME
+        )
+        with open(path, "rb") as fp:
+            content = fp.read()
+        graph = self._load_or_parse(
+            directory, content, lambda: content.decode("utf-8")
+        )
+        return as_backend(graph, backend, lambda: content.decode("utf-8"))
+
+    def _load_or_parse(self, directory, content, network_string):
+        import hashlib  # slow to import
+
+        digest = hashlib.sha256()
+        digest.update(version().encode("utf-8") + b"\0")
+        digest.update(content)
+        entry = os.path.join(directory, digest.hexdigest() + SUFFIX)
+
+        graph = load(entry)
+        if graph is not None:
+            try:
+                os.utime(entry)  # i.e. mark it as recently used
+            except OSError:
+                pass
+            return graph
+
+        graph = asciigraf.graph_from_ascii(network_string(), backend="arrays")
+        try:
+            save(entry, graph)
+            evict(directory, self.max_bytes)
+        except OSError:
+            pass  # the cache is only ever an optimisation
+        return graph
+
+    def clear(self, directory=None):
+        """ Deletes every entry in `directory`, by default the one entries
+            of `graph_from_ascii` are kept in
+        """
+        evict(directory or self.directory or default_directory(), 0)
+
+
+def version():
+    from . import get_version  # which is only set up once we're imported
+
+    return get_version()
+
+
+def default_directory():
+    return os.path.join(
+        os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache"),
+        "asciigraf",
+    )
+
+
+def as_backend(graph, backend, network_string):
+    if backend not in asciigraf.BACKENDS:
+        raise ValueError("backend must be one of {}, not {!r}".format(
+            asciigraf.BACKENDS, backend
+        ))
+    if backend == "arrays":
+        return graph
+    networkx_graph = graph.to_networkx()
+    networkx_graph.graph["ascii_string"] = network_string()
+    return networkx_graph
+
+
+def dumps(graph):
+    """ The bytes of an entry holding `graph`, an `ArrayGraph` """
+    names = "\n".join(graph.nodes).encode("utf-8", "surrogatepass")
+    # an empty line for edges without a label, so labels can be empty too
+    labels = "\n".join(
+        "" if label is None else "+" + label for label in graph.labels
+    ).encode("utf-8", "surrogatepass")
+    return b"".join([
+        HEADER.pack(
+            MAGIC, BYTE_ORDER, len(graph.nodes), len(graph.labels),
+            len(graph.points) // 2, len(names), len(labels),
+        ),
+        names,
+        labels,
+        graph.positions.tobytes(),
+        graph.sources.tobytes(),
+        graph.targets.tobytes(),
+        graph.lengths.tobytes(),
+        graph.point_offsets.tobytes(),
+        graph.points.tobytes(),
+    ])
+
+
+def loads(data):
+    """ The `ArrayGraph` held in the bytes of an entry, or None if they
+        aren't a whole entry written on a machine like this one
+    """
+    if len(data) < HEADER.size:
+        return None
+    magic, byte_order, n_nodes, n_edges, n_points, names_size, labels_size = (
+        HEADER.unpack_from(data)
+    )
+    item_size = array(TYPECODE).itemsize
+    sizes = [
+        names_size, labels_size, 2 * n_nodes * item_size,
+        n_edges * item_size, n_edges * item_size, n_edges * item_size,
+        (n_edges + 1) * item_size, 2 * n_points * item_size,
+    ]
+    if (
+        magic != MAGIC or byte_order != BYTE_ORDER
+        or len(data) != HEADER.size + sum(sizes)
+    ):
+        return None
+
+    view = memoryview(data)
+    fields = []
+    start = HEADER.size
+    for size in sizes:
+        fields.append(view[start:start + size])
+        start += size
+    names, labels, *arrays = fields
+
+    def read_array(buffer):
+        values = array(TYPECODE)
+        values.frombytes(buffer)
+        return values
+
+    positions, sources, targets, lengths, point_offsets, points = map(
+        read_array, arrays
+    )
+    return ArrayGraph(
+        nodes=(
+            str(names, "utf-8", "surrogatepass").split("\n")
+            if n_nodes else []
+        ),
+        positions=positions,
+        sources=sources,
+        targets=targets,
+        lengths=lengths,
+        labels=[
+            label[1:] if label else None
+            for label in str(labels, "utf-8", "surrogatepass").split("\n")
+        ] if n_edges else [],
+        point_offsets=point_offsets,
+        points=points,
+    )
+
+
+def load(entry):
+    """ The `ArrayGraph` in the file `entry`, or None if there isn't a
+        valid one there
+    """
+    try:
+        with open(entry, "rb") as fp:
+            return loads(fp.read())
+    except OSError:
+        return None
+
+
+def save(entry, graph):
+    """ Writes `graph` to the file `entry`, atomically """
+    import tempfile  # slow to import
+
+    directory = os.path.dirname(entry)
+    os.makedirs(directory, exist_ok=True)
+    fd, temporary = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fp:
+            fp.write(dumps(graph))
+        os.chmod(temporary, 0o644)  # rather than mkstemp's owner-only 0o600
+        os.replace(temporary, entry)
+    except BaseException:
+        try:
+            os.unlink(temporary)
+        except OSError:
+            pass
+        raise
+
+
+def evict(directory, max_bytes):
+    """ Deletes the least recently used entries in `directory` until they
+        take up no more than `max_bytes`
+    """
+    entries = []
+    try:
+        with os.scandir(directory) as scan:
+            for dir_entry in scan:
+                if dir_entry.name.endswith(SUFFIX):
+                    try:
+                        stat = dir_entry.stat()
+                    except OSError:  # e.g. deleted by another process
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, dir_entry))
+    except FileNotFoundError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, dir_entry in sorted(entries, key=lambda entry: entry[:2]):
+        if total <= max_bytes:
+            break
+        try:
+            os.unlink(dir_entry.path)
+        except FileNotFoundError:
+            pass
+        total -= size
@@ -0,0 +1,107 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from itertools import accumulate
+
+from .arrays import TYPECODE
+
+GEOMETRIES = ("points", "runs", "none")
+RUN_SIZE = 5  # each run is stored as x, y, dx, dy, length
+
+
+class PointRuns(Sequence):
+    """ The points of an edge, stored as runs of points in a straight line
+        rather than as one tuple per character.
+
+        Each run is (x, y, dx, dy, length): `length` points starting at
+        (x, y), each a step of (dx, dy) from the last. Since every edge
+        character continues in a straight line until it turns a corner,
+        long edges need only a handful of runs.
+
+        A `PointRuns` acts as a read-only list of (x, y) tuples, which are
+        only worked out as they're read; `expand()` returns the plain list
+        that `graph_from_ascii` would otherwise have stored. Its `len()`
+        comes straight from the runs.
+    """
+    __slots__ = ("runs", "_offsets")
+
+    def __init__(self, runs):
+        if not isinstance(runs, array):
+            runs = array(TYPECODE, runs)
+        self.runs = runs  # a flat array of RUN_SIZE ints per run
+        # of the form [index of each run's first point..., number of points]
+        self._offsets = [0, *accumulate(runs[RUN_SIZE - 1::RUN_SIZE])]
+
+    @classmethod
+    def from_points(cls, points):
+        """ Builds the runs of a sequence of `Point`s or (x, y) tuples """
+        runs = array(TYPECODE)
+        run = None  # of the form [x, y, dx, dy, length]
+        for x, y in points:
+            if run is None:
+                run = [x, y, 0, 0, 1]
+            elif run[4] == 1:
+                run[2:] = [x - run[0], y - run[1], 2]
+            elif (x, y) == (
+                run[0] + run[4] * run[2], run[1] + run[4] * run[3]
+            ):
+                run[4] += 1
+            else:
+                runs.extend(run)
+                run = [x, y, 0, 0, 1]
+        if run is not None:
+            runs.extend(run)
+        return cls(runs)
+
+    def expand(self):
+        """ The points, as a list of (x, y) tuples """
+        return list(self)
+
+    def __len__(self):
+        return self._offsets[-1]
+
+    def __iter__(self):
+        runs = self.runs
+        for i in range(0, len(runs), RUN_SIZE):
+            x, y, dx, dy, length = runs[i:i + RUN_SIZE]
+            for step in range(length):
+                yield (x + step * dx, y + step * dy)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.expand()[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PointRuns index out of range")
+
+        run = bisect_right(self._offsets, index) - 1
+        x, y, dx, dy, _ = self.runs[run * RUN_SIZE:(run + 1) * RUN_SIZE]
+        step = index - self._offsets[run]
+        return (x + step * dx, y + step * dy)
+
+    def __eq__(self, other):
+        if isinstance(other, PointRuns):
+            return self.runs == other.runs
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and self.expand() == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # pickles of (mostly small) ints are more compact than of an array
+        return (PointRuns, (self.runs.tolist(),))
+
+    def __repr__(self):
+        return "PointRuns({})".format([
+            tuple(self.runs[i:i + RUN_SIZE])
+            for i in range(0, len(self.runs), RUN_SIZE)
+        ])
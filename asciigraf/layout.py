@@ -0,0 +1,386 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import re
+import textwrap
+from collections import OrderedDict, deque
+from heapq import heappop, heappush
+
+from .asciigraf import NODE_MATCH, CharGrid, is_label
+from .canvas import Canvas, draw_label, edge_chars
+from .point import Point
+
+COLUMN_GAP = 6  # blank columns between the longest names of neighbours
+ROW_GAP = 4  # blank rows between rows of nodes
+MARGIN = 3  # cells around the nodes, to leave room to route edges around
+MAX_EXPANSIONS = 16  # cells searched per cell between an edge's nodes
+# cells searched at most for an edge outside the layout's tree. Those are
+# the edges which often can't be routed, and searching in proportion to
+# their distance would make the layout quadratic in the number of nodes
+MAX_SEARCH = 1000
+
+
+def ascii_from_graph(graph, column_gap=COLUMN_GAP, row_gap=ROW_GAP):
+    """ Draws a networkx graph (which needs no positions) as an ascii
+        diagram, which `graph_from_ascii` parses back to the same nodes,
+        edges and edge labels.
+
+        Nodes are laid out as a tree (see `place_nodes`), and each edge is
+        routed through the free space between them by a `Router`. Any
+        edge that can't be routed is drawn below the rest, between copies
+        of its nodes. That happens when:
+
+          * the edge would have to cross others, which ascii diagrams
+            can't do. Every graph which isn't planar has some of these,
+            and so can others (e.g. grids, with a few edges per row),
+            since only the edges of the tree are laid out not to cross.
+          * the edge's nodes have no room left for it. Edges can only end
+            beside a node's name, or above or below every other one of
+            its characters, so a node named with n characters has room
+            for 2 + 2 * ceil(n / 2) edges (e.g. four, for "1" or "12").
+            Diagrams can't branch edges, so no more can be drawn.
+
+        Trees are drawn without any, other than for nodes with more edges
+        than they have room for.
+
+        Raises a ValueError if a node's name or an edge's label wouldn't
+        parse back as the same text.
+    """
+    names = node_names(graph)
+    edges = edge_labels(graph)
+    # room for the longest label on the edges between columns
+    column_gap += max(
+        (len(label) for label in edges.values() if label is not None),
+        default=0,
+    )
+    positions, tree = place_nodes(graph, names, column_gap, row_gap)
+    router = Router(positions, names)
+
+    canvas = Canvas()
+    for node, (x, y) in positions.items():
+        canvas.write(x, y, names[node])
+
+    unrouted = []
+    for u, v in sorted(edges, key=lambda edge: distance(positions, *edge)):
+        route = router.route(
+            positions[u], positions[v],
+            limit=None if frozenset((u, v)) in tree else MAX_SEARCH,
+        ) if u != v else None
+        if route is None:
+            unrouted.append((u, v))
+            continue
+        points, chars = route
+        for (x, y), char in zip(points, chars):
+            canvas.write(x, y, char)
+        label = edges[u, v]
+        if label is not None:
+            # written straight away, so that later routes keep clear of it
+            position = draw_label(canvas, points, label)
+            if position is None:
+                for x, y in points:
+                    canvas.write(x, y, " ")
+                unrouted.append((u, v))
+            else:
+                router.take_text(position, label)
+
+    draw_unrouted(canvas, [
+        "{}--{}--{}".format(names[u], edges[u, v], names[v])
+        if edges[u, v] is not None
+        else "{}---{}".format(names[u], names[v])
+        for u, v in unrouted
+    ])
+    return textwrap.dedent(canvas.render()).strip("\n")
+
+
+def node_names(graph):
+    """ The text of each node in `graph`, of the form {node -> name} """
+    names = OrderedDict()
+    for node in graph.nodes():
+        name = str(node)
+        if not NODE_MATCH.fullmatch(name) or is_label(name):
+            raise ValueError("Can't draw a node named {!r}".format(name))
+        names[node] = name
+    if len(set(names.values())) < len(names):
+        raise ValueError("Can't draw two different nodes with the same name")
+    return names
+
+
+def edge_labels(graph):
+    """ The label of each edge, as it's drawn, of the form
+        {(u, v) -> "(label)" or None}
+    """
+    labels = OrderedDict()
+    seen = set()
+    for u, v, data in graph.edges(data=True):
+        if frozenset((u, v)) in seen:  # e.g. both ways round a DiGraph
+            continue
+        seen.add(frozenset((u, v)))
+        label = data.get("label")
+        if label is not None:
+            label = "({})".format(label)
+            if not NODE_MATCH.fullmatch(label):
+                raise ValueError("Can't draw a label of {!r}".format(label))
+        labels[u, v] = label
+    return labels
+
+
+def place_nodes(graph, names, column_gap, row_gap):
+    """ The position of each node, of the form {node -> Point}, and the
+        edges of the tree they're laid out as, of the form {frozenset}.
+
+        Each component is laid out as a breadth first tree from its
+        busiest node, running left to right: a node's column is its
+        depth in the tree, and the leaves take a row each, in depth first
+        order, so every subtree has a block of rows of its own and the
+        edges of the tree never have to cross. Each node shares a row
+        with the middle of its children. Components are stacked one
+        below the other.
+    """
+    slots = OrderedDict()  # of the form {node -> (column, row)}
+    tree = set()
+    next_row = 0
+
+    by_degree = sorted(names, key=lambda node: -len(graph[node]))
+    for root in by_degree:
+        if root in slots:
+            continue
+        depths, children = {root: 0}, OrderedDict()
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            children[node] = []
+            for neighbour in graph[node]:
+                if neighbour not in depths:
+                    depths[neighbour] = depths[node] + 1
+                    children[node].append(neighbour)
+                    tree.add(frozenset((node, neighbour)))
+                    queue.append(neighbour)
+
+        # depth first, so each subtree's leaves are given rows together
+        stack = [(root, False)]
+        while stack:
+            node, visited = stack.pop()
+            if not children[node]:
+                slots[node] = (depths[node], next_row)
+                next_row += 1
+            elif visited:
+                middle = children[node][(len(children[node]) - 1) // 2]
+                slots[node] = (depths[node], slots[middle][1])
+            else:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False) for child in reversed(children[node])
+                )
+
+    column_width = max(map(len, names.values()), default=0) + column_gap
+    positions = OrderedDict(
+        (node, Point(
+            MARGIN + column * column_width,
+            MARGIN + row * (row_gap + 1),
+        ))
+        for node, (column, row) in slots.items()
+    )
+    return positions, tree
+
+
+def distance(positions, u, v):
+    return (
+        abs(positions[u].x - positions[v].x)
+        + abs(positions[u].y - positions[v].y)
+    )
+
+
+def draw_unrouted(canvas, drawings, width=79):
+    """ Writes the `drawings` of unrouted edges below everything else on
+        the canvas, a blank row apart and packed into rows of `width`
+    """
+    x, y = MARGIN, len(canvas.rows) + 1
+    for drawing in drawings:
+        if x > MARGIN and x + len(drawing) > width:
+            x, y = MARGIN, y + 2
+        canvas.write(x, y, drawing)
+        x += len(drawing) + 3
+
+
+class Router(object):
+    """ Routes edges between the nodes at `positions` (of the form
+        {node -> Point}) with the given `names`, keeping track of which
+        cells are taken in a `CharGrid` of the drawing.
+
+        Routes only step up, down, left and right, so are drawn with '-'
+        and '|' only, and never pass next to (above, below or beside) a
+        cell which is already taken, other than their own nodes at either
+        end. As neither character reaches diagonally, nothing routed
+        later can become a neighbour of anything routed before; each new
+        route is then checked against the grid's own neighbour rules (i.e.
+        `EDGE_CHAR_NEIGHBOURS` and `ABUTTING`) before it's kept.
+    """
+    BLOCKED = 6  # the grid's border, so searches never step off the grid
+
+    def __init__(self, positions, names):
+        # of the form {Point -> name}
+        self.nodes = {pos: names[node] for node, pos in positions.items()}
+        width = max(
+            (pos.x + len(name) for pos, name in self.nodes.items()),
+            default=0,
+        ) + MARGIN
+        height = max((pos.y for pos in self.nodes), default=0) + 1 + MARGIN
+        self.grid = CharGrid([" " * width] * height)
+        self.grid.mark_nodes(self.nodes)
+
+        cells, stride = self.grid.cells, self.grid.stride
+        cells[:stride] = cells[-stride:] = bytes([self.BLOCKED]) * stride
+        cells[::stride] = cells[stride - 1::stride] = bytes(
+            [self.BLOCKED]
+        ) * (len(cells) // stride)
+
+        # the spatial index routes are searched through: a cell is blocked
+        # if it, or any cell above, below or beside it, is taken
+        self.blocked = bytearray(len(cells))
+        for taken in re.finditer(b"[^\x00]+", cells):
+            for index in range(taken.start(), taken.end()):
+                self.block(index)
+
+    def route(self, source, target, limit=None):
+        """ Routes an edge from the node at `source` to the one at
+            `target`, returning its ([Point, ...], [edge char, ...]), or
+            None if there's no free route to it (searching no more than
+            `limit` cells for one, if it's given)
+        """
+        grid = self.grid
+        starts = self.attachments(source)
+        goals = set(self.attachments(target))
+        path = self.search(starts, goals, target, limit)
+        if path is None:
+            return None
+
+        points = [grid.point(index) for index in path]
+        chars = edge_chars(
+            points, self.node_chars(source), self.node_chars(target)
+        )
+        for index, char in zip(path, chars):
+            grid.cells[index] = CharGrid.EDGE_CODES[char]
+
+        source_indexes = set(map(grid.index, self.node_chars(source)))
+        target_indexes = set(map(grid.index, self.node_chars(target)))
+        ends = [source_indexes, *({index} for index in path), target_indexes]
+        for i, index in enumerate(path, 1):
+            previous, following = ends[i - 1], ends[i + 1]
+            neighbours = grid.neighbours(index)
+            if not (
+                len(neighbours) == 2
+                and any(neighbour in previous for neighbour in neighbours)
+                and any(neighbour in following for neighbour in neighbours)
+            ):
+                for index in path:
+                    grid.cells[index] = CharGrid.BLANK
+                return None
+        for index in path:
+            self.block(index)
+        return points, chars
+
+    def search(self, starts, goals, target, limit=None):
+        """ A* search from any of the cells at indexes `starts` to any of
+            `goals`, through cells with nothing next to them. Returns the
+            indexes of the cells along the way, or None if there aren't any
+            within MAX_EXPANSIONS per cell of distance (or `limit` cells in
+            all).
+        """
+        if not starts or not goals:
+            return None
+        blocked, stride = self.blocked, self.grid.stride
+        target_y, target_x = divmod(self.grid.index(target), stride)
+        target_end = target_x + len(self.nodes[target]) - 1
+
+        def estimate(index):
+            """ Steps from `index` to the nearest cell next to `target` """
+            y, x = divmod(index, stride)
+            return abs(y - target_y) + max(
+                target_x - x - 1, x - target_end - 1, 0
+            )
+
+        came_from = {index: None for index in starts}
+        cost = {index: 0 for index in starts}
+        # ties go to whichever cell is closer to the target
+        queue = [(estimate(index), estimate(index), index) for index in starts]
+        budget = MAX_EXPANSIONS * (min(map(estimate, starts)) + 1)
+        if limit is not None:
+            budget = min(budget, limit)
+        while queue and budget:
+            _, _, index = heappop(queue)
+            if index in goals:
+                path = []
+                while index is not None:
+                    path.append(index)
+                    index = came_from[index]
+                path.reverse()
+                return path
+            budget -= 1
+            steps = cost[index] + 1
+            for neighbour in (
+                index + 1, index - 1, index + stride, index - stride
+            ):
+                if (
+                    (neighbour in goals or not blocked[neighbour])
+                    and steps < cost.get(neighbour, steps + 1)
+                ):
+                    cost[neighbour] = steps
+                    came_from[neighbour] = index
+                    y, x = divmod(neighbour, stride)  # i.e. estimate()
+                    remaining = abs(y - target_y) + (
+                        target_x - x - 1 if x < target_x
+                        else x - target_end - 1 if x > target_end else 0
+                    )
+                    heappush(
+                        queue, (steps + remaining, remaining, neighbour)
+                    )
+        return None
+
+    def attachments(self, node):
+        """ The indexes of the free cells directly beside, above or below
+            the text of the node at `node`, which have nothing else next
+            to them
+        """
+        cells, stride = self.grid.cells, self.grid.stride
+        start = self.grid.index(node)
+        end = start + len(self.nodes[node])
+        candidates = [(start - 1, 1), (end, -1)]
+        for index in range(start, end):
+            candidates.extend([
+                (index - stride, stride), (index + stride, -stride)
+            ])
+        return [
+            index for index, to_node in candidates
+            if not cells[index] and not any(
+                cells[index + step]
+                for step in (1, -1, stride, -stride)
+                if step != to_node
+            )
+        ]
+
+    def take_text(self, position, text):
+        """ Takes the cells of `text` (e.g. an edge's label) written at
+            `position`, which routes then keep clear of as they do nodes
+        """
+        start = self.grid.index(position)
+        for index in range(start, start + len(text)):
+            self.grid.cells[index] = CharGrid.NODE
+            self.block(index)
+
+    def block(self, index):
+        """ Blocks the cells around the cell at `index`, once it's taken """
+        stride = self.grid.stride
+        for neighbour in (
+            index, index + 1, index - 1, index + stride, index - stride
+        ):
+            if 0 <= neighbour < len(self.blocked):
+                self.blocked[neighbour] = 1
+
+    def node_chars(self, node):
+        return {
+            Point(node.x + i, node.y) for i in range(len(self.nodes[node]))
+        }
@@ -5,8 +5,25 @@
 # LICENSE file in the root directory of this source tree.
 #############################################################################
 
+from operator import itemgetter
 
-class Point(object):
+
+class Point(tuple):
+    """ An immutable x, y position in a diagram.
+
+        Points are created and hashed for every character of a diagram,
+        so they're an (x, y) tuple underneath: they take no more memory
+        than one, and are hashed (and iterated) by tuple's own C code.
+        Unlike a tuple, they only equal other Points, and are ordered by
+        row and then column.
+    """
+    __slots__ = ()
+
+    x = property(itemgetter(0))
+    y = property(itemgetter(1))
+
+    def __new__(cls, x, y):
+        return tuple.__new__(cls, (x, y))
 
     def __setattr__(self, attr, val):
         raise TypeError("Can't set '{}' on Point object".format(attr))
@@ -14,28 +31,23 @@ class Point(object):
     def __delattr__(self, attr):
         raise TypeError("Can't delete '{}' on Point object".format(attr))
 
-    def __init__(self, x, y):
-        super(Point, self).__setattr__('x', x)
-        super(Point, self).__setattr__('y', y)
+    def __reduce__(self):
+        return (Point, tuple(self))
 
     def __add__(self, other):
-        return Point(self.x + other.x, self.y + other.y)
+        return Point(self[0] + other[0], self[1] + other[1])
 
     def __sub__(self, other):
-        return Point(self.x - other.x, self.y - other.y)
-
-    def __iter__(self):
-        for el in (self.x, self.y):
-            yield el
+        return Point(self[0] - other[0], self[1] - other[1])
 
     def __repr__(self):
-        return "Point({}, {})".format(self.x, self.y)
+        return "Point({}, {})".format(*self)
 
     def __eq__(self, other):
-        return (type(self) is type(other) and
-                self.x == other.x and
-                self.y == other.y
-                )
+        return other.__class__ is self.__class__ and tuple.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
 
     def __lt__(self, other):
         """Point instances are ordered by row and
@@ -50,10 +62,16 @@ class Point(object):
             and not (a, b) based on reading the diagram like
             a paragraph, left-to-right and then top-to-bottom.
         """
-        return self.y < other.y or (
-            not self.y > other.y and
-            self.x < other.x
+        return self[1] < other[1] or (
+            not self[1] > other[1] and
+            self[0] < other[0]
         )
 
-    def __hash__(self):
-        return hash((self.__class__, self.x, self.y))
+    def __gt__(self, other):
+        return other < self
+
+    # tuple's other comparisons, which would order by column first
+    __le__ = __ge__ = None
+
+    # defining __eq__ would otherwise leave Points unhashable
+    __hash__ = tuple.__hash__
@@ -0,0 +1,179 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from itertools import count
+from typing import Any, NamedTuple
+
+from .canvas import graph_geometry
+from .point import Point
+
+NODE, EDGE = "node", "edge"
+BUCKET_SIZE = 16  # buckets are this many characters across and down
+STRIDE = 1 << 32  # positions are packed into ints as y * STRIDE + x
+
+
+class Element(NamedTuple):
+    """ A node (with its name as `key`) or an edge (with its (u, v) as
+        `key`) of a parsed diagram
+    """
+    kind: str
+    key: Any
+
+
+class SpatialIndex(object):
+    """ Finds the nodes and edges drawn at, or near, positions in a
+        diagram:
+
+            index = SpatialIndex.from_graph(graph_from_ascii(diagram))
+
+            index.at(12, 3)
+            >>> Element(kind='edge', key=('A', 'B'))
+            index.within(0, 0, 20, 5)  # left, top, right, bottom
+            >>> [Element(kind='node', key='A'), ...]
+            index.nearest(40, 10, kind=NODE)
+            >>> (Element(kind='node', key='C'), Point(38, 12))
+
+        Every character of every node and edge is indexed (so a label's
+        characters find the edge they're on) in a dict keyed by its
+        packed position, for O(1) lookups by `at`. The positions are also
+        grouped into square buckets of BUCKET_SIZE characters, so that
+        `within` and `nearest` only look through the buckets around the
+        area they're asked about.
+    """
+
+    def __init__(self, nodes, edges, bucket_size=BUCKET_SIZE):
+        """ Indexes `nodes` and `edges`, as returned by `graph_geometry` """
+        self.bucket_size = bucket_size
+        self.elements = []  # element ids are indexes into this
+        self._ids = {}  # of the form {packed position -> element id}
+        self._buckets = {}  # of the form {(bx, by) -> [packed position]}
+
+        for node, (x, y) in nodes:
+            self._add(
+                Element(NODE, node),
+                (Point(x + i, y) for i in range(len(str(node)))),
+            )
+        for u, v, points, _ in edges:
+            self._add(Element(EDGE, (u, v)), points)
+
+        # the first and last column and row of buckets
+        columns = [column for column, _ in self._buckets]
+        rows = [row for _, row in self._buckets]
+        self._extent = (
+            (min(columns), min(rows), max(columns), max(rows))
+            if self._buckets else None
+        )
+
+    @classmethod
+    def from_graph(cls, graph, bucket_size=BUCKET_SIZE):
+        """ Indexes a networkx graph from `graph_from_ascii` (or one built
+            to look like it) or an `ArrayGraph`
+        """
+        return cls(*graph_geometry(graph), bucket_size=bucket_size)
+
+    def _add(self, element, points):
+        element_id = len(self.elements)
+        self.elements.append(element)
+        size = self.bucket_size
+        for x, y in points:
+            packed = y * STRIDE + x
+            if packed not in self._ids:
+                self._buckets.setdefault((x // size, y // size), []).append(
+                    packed
+                )
+            self._ids[packed] = element_id
+
+    def at(self, x, y):
+        """ The element drawn at (x, y), or None """
+        element_id = self._ids.get(y * STRIDE + x)
+        return None if element_id is None else self.elements[element_id]
+
+    def within(self, left, top, right, bottom):
+        """ Every element with a character in the box from (left, top) to
+            (right, bottom) inclusive, nodes first and then edges, each in
+            the order of the graph
+        """
+        size = self.bucket_size
+        columns = range(left // size, right // size + 1)
+        rows = range(top // size, bottom // size + 1)
+        if len(columns) * len(rows) <= len(self._buckets):
+            buckets = (
+                self._buckets.get((bx, by), ())
+                for by in rows for bx in columns
+            )
+        else:  # the box is mostly empty space
+            buckets = (
+                positions for (bx, by), positions in self._buckets.items()
+                if bx in columns and by in rows
+            )
+
+        found = set()
+        for positions in buckets:
+            for packed in positions:
+                y, x = divmod(packed, STRIDE)
+                if left <= x <= right and top <= y <= bottom:
+                    found.add(self._ids[packed])
+        return [self.elements[element_id] for element_id in sorted(found)]
+
+    def nearest(self, x, y, kind=None):
+        """ The element (of the given `kind`, if any) with a character
+            closest to (x, y), along with the position of that character,
+            or None if there aren't any. Distances are straight-line ones,
+            and ties go to whichever character comes first row-major.
+        """
+        if self._extent is None:
+            return None
+        size = self.bucket_size
+        bx, by = x // size, y // size
+        # beyond this many rings of buckets around (x, y) there are none
+        first_column, first_row, last_column, last_row = self._extent
+        last_ring = max(
+            abs(first_column - bx), abs(last_column - bx),
+            abs(first_row - by), abs(last_row - by),
+        )
+
+        best = None  # of the form (squared distance, y, x, element id)
+        for ring in count():
+            # no character in this ring's buckets is any closer than this
+            closest = max((ring - 1) * size + 1, 0)
+            if ring > last_ring or (
+                best is not None and closest * closest > best[0]
+            ):
+                break
+            for column, row in ring_of(bx, by, ring):
+                for packed in self._buckets.get((column, row), ()):
+                    element_id = self._ids[packed]
+                    if (
+                        kind is not None
+                        and self.elements[element_id].kind != kind
+                    ):
+                        continue
+                    char_y, char_x = divmod(packed, STRIDE)
+                    candidate = (
+                        (char_x - x) ** 2 + (char_y - y) ** 2,
+                        char_y, char_x, element_id,
+                    )
+                    if best is None or candidate < best:
+                        best = candidate
+
+        if best is None:
+            return None
+        _, char_y, char_x, element_id = best
+        return self.elements[element_id], Point(char_x, char_y)
+
+
+def ring_of(x, y, radius):
+    """ The cells exactly `radius` cells from (x, y), across or down """
+    if radius == 0:
+        yield x, y
+        return
+    for column in range(x - radius, x + radius + 1):
+        yield column, y - radius
+        yield column, y + radius
+    for row in range(y - radius + 1, y + radius):
+        yield x - radius, row
+        yield x + radius, row
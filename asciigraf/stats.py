@@ -0,0 +1,75 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from collections import OrderedDict
+from time import perf_counter
+
+COUNTERS = (
+    "rows", "chars", "nodes", "labels", "edge_chars", "edges",
+    "max_edge_length",
+)
+
+
+class ParseStats(object):
+    """ Timings and counters for one call of `graph_from_ascii`, which
+        fills them in when passed one as its `stats` argument:
+
+            stats = ParseStats()
+            graph = graph_from_ascii(diagram, stats=stats)
+            print(stats.times)
+            >>> OrderedDict([('get_nodes_and_labels', 0.0012), ...])
+
+        `times` holds the wall time of each stage of the parse, in seconds
+        and in the order they ran. The counters are the number of `rows`
+        and `chars` scanned; the number of `nodes`, `labels`,
+        `edge_chars` (counting those patched over labels) and `edges`
+        found; and `max_edge_length`, the most characters in any one edge.
+
+        `as_dict` flattens all of these for forwarding to a metrics
+        system. Passing the same `ParseStats` to another call starts it
+        over.
+    """
+    __slots__ = ("times", "_lap_start") + COUNTERS
+
+    def __init__(self):
+        self.start()
+
+    def start(self):
+        """ Resets everything, and starts timing the first stage """
+        self.times = OrderedDict()  # of the form {stage -> seconds}
+        for counter in COUNTERS:
+            setattr(self, counter, 0)
+        self._lap_start = perf_counter()
+
+    def lap(self, stage):
+        """ Records the time since the last stage ended as that of `stage`
+        """
+        now = perf_counter()
+        self.times[stage] = self.times.get(stage, 0) + now - self._lap_start
+        self._lap_start = now
+
+    @property
+    def total_time(self):
+        return sum(self.times.values())
+
+    def as_dict(self):
+        """ Every counter, and the time of every stage (as "time.<stage>"),
+            in one flat dict
+        """
+        flat = OrderedDict(
+            (counter, getattr(self, counter)) for counter in COUNTERS
+        )
+        for stage, seconds in self.times.items():
+            flat["time." + stage] = seconds
+        flat["time.total"] = self.total_time
+        return flat
+
+    def __repr__(self):
+        return "ParseStats({})".format(", ".join(
+            "{}={!r}".format(counter, getattr(self, counter))
+            for counter in COUNTERS + ("times",)
+        ))
@@ -0,0 +1,397 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import mmap
+import os
+import re
+from collections import OrderedDict, deque
+
+from .asciigraf import (
+    EDGE_CHARS,
+    NODE_MATCH,
+    InvalidEdgeError,
+    build_networkx_graph,
+    get_neighbours,
+    get_nodes_and_labels,
+    invalid_edge_error,
+    is_label,
+    patch_label_chars,
+)
+from .point import Point
+
+HEAD, TAIL = 0, 1
+
+# NODE_MATCH and EDGE_CHARS, for matching against the bytes of ascii rows
+NODE_MATCH_BYTES = re.compile(NODE_MATCH.pattern.encode("ascii"))
+EDGE_CHAR_MATCH_BYTES = re.compile(
+    "[{}]".format(re.escape("".join(sorted(EDGE_CHARS)))).encode("ascii")
+)
+
+
+def graph_from_lines(lines):
+    """ Produces a networkx graph from an iterable of the rows of an ascii
+        drawing of a network (e.g. the lines of a file)
+
+        Only the few rows around the one being parsed are held in memory,
+        so unlike `graph_from_ascii` the drawing isn't attached to the
+        graph as its `ascii_string` attribute.
+    """
+    parser = StreamParser()
+    for line in lines:
+        parser.feed(line)
+    return parser.close()
+
+
+def graph_from_file(fp):
+    """ Produces a networkx graph from a text file object containing an
+        ascii drawing of a network, reading it one row at a time
+    """
+    return graph_from_lines(fp)
+
+
+def graph_from_path(path):
+    """ Produces a networkx graph from an ascii (or utf-8) drawing of a
+        network, stored in the file at `path`.
+
+        The file is memory-mapped and scanned one row at a time, without
+        ever decoding the whole drawing into a `str`.
+    """
+    parser = StreamParser()
+    with open(path, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size == 0:
+            return parser.close()  # empty files can't be mapped
+
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = 0
+            while start <= len(buffer):
+                end = buffer.find(b"\n", start)
+                if end == -1:
+                    end = len(buffer)
+                parser.feed(buffer[start:end])
+                start = end + 1
+    return parser.close()
+
+
+class StreamParser(object):
+    """ Builds a graph from the rows of a diagram, fed in one at a time
+
+        e.g.
+
+        parser = StreamParser()
+        for line in lines:
+            parser.feed(line)
+        graph = parser.close()
+
+        Rows go through the same stages as in `get_edges`, staggered so
+        that only three rows need to be kept: feeding row `y` lets the
+        labels on row `y - 1` be patched (which needs the raw row below
+        them), and the neighbours of the edge characters on row `y - 2` be
+        resolved (which needs the patched rows either side of it). Edges
+        which are still being traced are carried forward by an
+        `EdgeTracer`.
+    """
+
+    def __init__(self):
+        self.nodes = OrderedDict()  # of the form {Point -> 'node_name'}
+        self._rows = {}  # of the form {row number -> _Row}
+        self._edge_chars = _RowView(self._rows, "edge_chars")
+        self._node_chars = _RowView(self._rows, "node_chars")
+        self._tracer = EdgeTracer()
+        self._n_rows = 0
+
+    def feed(self, line):
+        """ Parses the next row of the diagram, given as a `str` or as
+            utf-8 encoded `bytes`
+        """
+        y = self._n_rows
+        self._n_rows += 1
+        # only "\n" ends a row, as in `graph_from_ascii`, however the row
+        # was read
+        if isinstance(line, bytes):
+            row = _Row.from_bytes(
+                y, line[:-1] if line[-1:] == b"\n" else line
+            )
+        else:
+            row = _Row.from_text(y, line[:-1] if line[-1:] == "\n" else line)
+        self._rows[y] = row
+        for x, name in row.nodes.items():
+            self.nodes[Point(x, y)] = name
+
+        if y - 1 in self._rows:
+            self._patch(self._rows[y - 1])
+        if y - 2 in self._rows:
+            self._resolve(self._rows[y - 2])
+        self._rows.pop(y - 3, None)
+
+    def close(self):
+        """ Finishes parsing, and returns the graph of the diagram """
+        # two blank rows flush the last rows of the diagram through
+        self.feed("")
+        self.feed("")
+        return build_networkx_graph(self.nodes, self._tracer.close())
+
+    def _patch(self, row):
+        patch_label_chars(
+            {Point(x, row.y): label for x, label in row.labels.items()},
+            self._edge_chars,
+        )
+
+    def _resolve(self, row):
+        for x in sorted(row.edge_chars):
+            pos = Point(x, row.y)
+            neighbours = get_neighbours(
+                pos, self._edge_chars, self._node_chars
+            )
+            if len(neighbours) != 2:
+                raise invalid_edge_error(
+                    self._context(row.y), pos, neighbours
+                )
+
+            self._tracer.add(
+                pos,
+                neighbours,
+                {
+                    neighbour: self._node_chars[neighbour]
+                    for neighbour in neighbours
+                    if neighbour in self._node_chars
+                },
+                row.label_chars.get(x),
+            )
+
+    def _context(self, y):
+        """ The rows around row `y`, positioned as they were in the diagram
+            so that they can be used in error messages
+        """
+        first = max(y - 1, 0)
+        return "\n" * first + "\n".join(
+            self._rows[i].line if i in self._rows else ""
+            for i in range(first, y + 2)
+        )
+
+
+class EdgeTracer(object):
+    """ Assembles edges from edge characters which are added one at a time,
+        in row-major order, along with their two neighbours.
+
+        Characters are collected into fragments, whose ends either reach a
+        node or wait on a neighbour which hasn't been added yet. Adding
+        that neighbour extends the fragment, or joins two fragments which
+        were waiting on it. Complete edges are appended to `edges` in the
+        same order that `trace_edges` would produce them, i.e. by their
+        first character.
+    """
+
+    def __init__(self):
+        self.edges = []
+        self._awaiting = {}  # of the form {position -> [(fragment, end)]}
+        self._fragments = OrderedDict()  # of the form {first pos -> frag}
+
+    def add(self, pos, neighbours, nodes, label=None):
+        """ Adds the edge character at `pos`
+
+            Arguments:
+              * neighbours: the two neighbouring positions of `pos`
+              * nodes: {neighbour position -> node} for any neighbours
+                       that are node characters
+              * label: the label `pos` is a character of, if any
+        """
+        waiting = self._awaiting.pop(pos, [])
+        if not waiting:
+            fragment = self._fragments[pos] = _Fragment(pos)
+            for end, neighbour in zip((HEAD, TAIL), neighbours):
+                self._extend(fragment, end, neighbour, nodes)
+        elif len(waiting) == 1:
+            [(fragment, end)] = waiting
+            a, b = neighbours
+            previous = fragment.end_position(end)
+            fragment.add(end, [pos])
+            self._extend(fragment, end, a if b == previous else b, nodes)
+        else:
+            fragment = self._join(pos, *waiting)
+
+        if label is not None:
+            fragment.labels[pos] = label
+        if fragment.is_complete():
+            self._flush()
+
+    def close(self):
+        """ Returns every edge, once all the characters have been added """
+        return self.edges
+
+    def _extend(self, fragment, end, neighbour, nodes):
+        if neighbour in nodes:
+            fragment.terminals[end] = (neighbour, nodes[neighbour])
+            fragment.awaiting[end] = None
+        else:
+            self._awaiting.setdefault(neighbour, []).append((fragment, end))
+            fragment.awaiting[end] = neighbour
+
+    def _join(self, pos, waiting_1, waiting_2):
+        (fragment, end), (other, other_end) = waiting_1, waiting_2
+        if fragment is other:
+            raise InvalidEdgeError(
+                "Edge at ln {}, col {} never reaches a node".format(
+                    fragment.first.y, fragment.first.x
+                )
+            )
+        if len(fragment.points) < len(other.points):
+            (fragment, end), (other, other_end) = waiting_2, waiting_1
+
+        # attach `pos`, and then `other` starting from its end next to
+        # `pos`, onto `fragment`
+        fragment.add(end, [pos])
+        fragment.add(
+            end,
+            other.points if other_end == HEAD else reversed(other.points)
+        )
+        far_end = 1 - other_end
+        fragment.terminals[end] = other.terminals[far_end]
+        fragment.awaiting[end] = other.awaiting[far_end]
+        if other.awaiting[far_end] is not None:
+            awaiting = self._awaiting[other.awaiting[far_end]]
+            awaiting[awaiting.index((other, far_end))] = (fragment, end)
+        fragment.labels.update(other.labels)
+
+        # the joined fragment takes the place of whichever came first
+        if other.first < fragment.first:
+            self._fragments[other.first] = fragment
+            del self._fragments[fragment.first]
+            fragment.first = other.first
+        else:
+            del self._fragments[other.first]
+        return fragment
+
+    def _flush(self):
+        while self._fragments:
+            first = next(iter(self._fragments))
+            if not self._fragments[first].is_complete():
+                break
+            self.edges.append(self._fragments.pop(first).to_edge())
+
+
+class _Fragment(object):
+    """ A run of consecutive characters on an edge """
+
+    def __init__(self, first):
+        self.first = first
+        self.points = deque([first])
+        self.terminals = [None, None]  # (node char position, node) per end
+        self.awaiting = [None, None]  # neighbour position awaited per end
+        self.labels = {}  # of the form {position -> label}
+
+    def end_position(self, end):
+        return self.points[0] if end == HEAD else self.points[-1]
+
+    def add(self, end, positions):
+        if end == HEAD:
+            self.points.extendleft(positions)
+        else:
+            self.points.extend(positions)
+
+    def is_complete(self):
+        return None not in self.terminals
+
+    def to_edge(self):
+        """ The edge, in the same form as `build_edge_from_position` """
+        (start, start_node), (end, end_node) = self.terminals
+        points = list(self.points)
+        if start > end:
+            points.reverse()
+            start_node, end_node = end_node, start_node
+        elif start == end:
+            # a loop back onto the same node character: `trace_edges` would
+            # walk it from its first character, towards the lesser of that
+            # character's neighbours first
+            path = [start] + points + [end]
+            i = points.index(self.first)
+            if path[i] > path[i + 2]:
+                points.reverse()
+
+        edge = dict(points=points, nodes=(start_node, end_node))
+        if self.labels:
+            for position in points:
+                if position in self.labels:
+                    edge["label"] = self.labels[position]
+        return edge
+
+
+class _Row(object):
+    """ The nodes, labels and edge characters found on one row """
+
+    def __init__(self, y, line, nodes, labels, edge_chars):
+        self.y = y
+        self.line = line
+        self.nodes = nodes  # of the form {x -> 'node_name'}
+        self.labels = labels  # of the form {x -> 'label'}
+        self.edge_chars = edge_chars  # of the form {x -> edge char}
+
+        self.node_chars = {
+            x + i: node for x, node in nodes.items() for i in range(len(node))
+        }
+        self.label_chars = {
+            x + i: label
+            for x, label in labels.items()
+            for i in range(len(label))
+        }
+
+    @classmethod
+    def from_text(cls, y, line):
+        nodes, labels = get_nodes_and_labels(line)
+        return cls(
+            y,
+            line,
+            {pos.x: node for pos, node in nodes.items()},
+            {pos.x: label for pos, label in labels.items()},
+            {x: char for x, char in enumerate(line) if char in EDGE_CHARS},
+        )
+
+    @classmethod
+    def from_bytes(cls, y, line):
+        if not line.isascii():
+            # columns are counted in characters, not bytes
+            return cls.from_text(y, line.decode("utf-8"))
+
+        nodes, labels = {}, {}
+        for match in NODE_MATCH_BYTES.finditer(line):
+            text = match.group(0).decode("ascii")
+            (labels if is_label(text) else nodes)[match.start()] = text
+        return cls(
+            y,
+            line.decode("ascii"),
+            nodes,
+            labels,
+            {
+                match.start(): match.group(0).decode("ascii")
+                for match in EDGE_CHAR_MATCH_BYTES.finditer(line)
+            },
+        )
+
+
+class _RowView(object):
+    """ A mapping, keyed by `Point`, over one of the mappings of each of the
+        buffered rows
+    """
+
+    def __init__(self, rows, attribute):
+        self._rows = rows
+        self._attribute = attribute
+
+    def _row(self, pos):
+        row = self._rows.get(pos.y)
+        return getattr(row, self._attribute) if row is not None else {}
+
+    def get(self, pos, default=None):
+        return self._row(pos).get(pos.x, default)
+
+    def __contains__(self, pos):
+        return pos.x in self._row(pos)
+
+    def __getitem__(self, pos):
+        return self._row(pos)[pos.x]
+
+    def __setitem__(self, pos, value):
+        self._row(pos)[pos.x] = value
@@ -0,0 +1,264 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .asciigraf import (
+    CharGrid,
+    InvalidEdgeError,
+    build_networkx_graph,
+    get_nodes_and_labels,
+    invalid_edge_error,
+    trace_edges,
+)
+from .point import Point
+from .stream import HEAD, TAIL, _Fragment
+
+MIN_BAND_ROWS = 256  # bands are never split smaller than this
+
+
+def graph_from_ascii_tiled(
+        network_string, workers=None, min_band_rows=MIN_BAND_ROWS):
+    """ Produces the same networkx graph as `graph_from_ascii`, but parses
+        the diagram as horizontal bands spread across `workers` processes
+        (defaulting to one per CPU)
+
+        This only pays off for very large drawings: each band has to be
+        sent to a worker, and the edges which cross from one band into
+        another are stitched back together in this process.
+    """
+    nodes, edges = get_nodes_and_edges_tiled(
+        network_string, workers=workers, min_band_rows=min_band_rows
+    )
+    graph = build_networkx_graph(nodes, edges)
+    graph.graph["ascii_string"] = network_string
+    return graph
+
+
+def get_nodes_and_edges_tiled(
+        network_string, workers=None, min_band_rows=MIN_BAND_ROWS):
+    """ Finds the nodes and edges of a diagram, in the same form (and
+        order) as `get_nodes_and_labels` and `get_edges`, by parsing it in
+        bands across a pool of processes.
+
+        Each band is parsed like a `StreamParser` would, with one row of
+        context either side of it. Edge characters are only traced in the
+        band that owns their row, so an edge running into the next band is
+        left as a fragment waiting on a character there, and is joined up
+        with that band's fragments afterwards.
+
+        Invalid edges raise `InvalidEdgeError` just as `get_edges` does,
+        although (as with the `StreamParser`) the error only shows the rows
+        around the bad character.
+    """
+    lines = network_string.split("\n")
+    workers = workers or os.cpu_count() or 1
+    bands = split_bands(lines, workers, min_band_rows)
+    jobs = [
+        (lines[max(start - 1, 0):stop + 1], start, stop)
+        for start, stop in bands
+    ]
+
+    if len(jobs) == 1:
+        results = [_parse_band(*jobs[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_parse_band, *zip(*jobs)))
+
+    nodes = OrderedDict()  # of the form {Point -> 'node_name'}
+    for band_nodes, _ in results:
+        nodes.update(band_nodes)
+    return nodes, stitch_edges(results)
+
+
+def split_bands(lines, n_bands, min_band_rows=MIN_BAND_ROWS):
+    """ Splits rows into up to `n_bands` (start, stop) ranges of roughly
+        equal size.
+
+        Labels can change the way the rows around them are read (a label
+        sitting on a vertical edge is patched over using the patched row
+        above it), so bands are only ever split between two rows which
+        have no labels on them. That way a band only needs the raw row
+        either side of it for context.
+    """
+    size = max(min_band_rows, -(-len(lines) // max(n_bands, 1)))
+    bands = []
+    start = 0
+    while start < len(lines):
+        stop = start + size
+        while stop < len(lines) and (
+            "(" in lines[stop - 1] or "(" in lines[stop]
+        ):
+            stop += 1
+        stop = min(stop, len(lines))
+        bands.append((start, stop))
+        start = stop
+    return bands or [(0, 0)]
+
+
+def stitch_edges(results):
+    """ Joins up the fragments of edges that cross from one band into
+        another, and returns all the edges in the order `get_edges` would
+        give them
+    """
+    fragments = [
+        item for _, items in results for item in items
+        if isinstance(item, _Fragment)
+    ]
+    # of the form {(end position, awaited position) -> (fragment, end)}
+    ends = {
+        (fragment.end_position(end), fragment.awaiting[end]): (fragment, end)
+        for fragment in fragments
+        for end in (HEAD, TAIL)
+        if fragment.awaiting[end] is not None
+    }
+
+    # every band's edges are in order of their first characters, and an
+    # edge crossing several bands takes the place of its first fragment
+    edges = []
+    joined = set()  # of the form {id(fragment)}
+    for _, items in results:
+        for item in items:
+            if not isinstance(item, _Fragment):
+                edges.append(item)
+            elif id(item) not in joined:
+                for end in (HEAD, TAIL):
+                    while item.awaiting[end] is not None:
+                        joined.add(id(_join(item, end, ends)))
+                edges.append(item.to_edge())
+    return edges
+
+
+def _join(fragment, end, ends):
+    """ Extends `fragment` at `end` with the fragment it's waiting on, and
+        returns that fragment
+    """
+    position, awaited = fragment.end_position(end), fragment.awaiting[end]
+    other, other_end = ends.pop((awaited, position))
+    if other is fragment:
+        raise InvalidEdgeError(
+            "Edge at ln {}, col {} never reaches a node".format(
+                fragment.first.y, fragment.first.x
+            )
+        )
+
+    # `other`'s points run away from `fragment` starting at `other_end`,
+    # so they're added in order from there
+    points = other.points if other_end == HEAD else reversed(other.points)
+    fragment.add(end, points)
+    far_end = 1 - other_end
+    fragment.terminals[end] = other.terminals[far_end]
+    fragment.awaiting[end] = other.awaiting[far_end]
+    fragment.labels.update(other.labels)
+    fragment.first = min(fragment.first, other.first)
+    return other
+
+
+def _parse_band(lines, start, stop):
+    """ Parses rows `start` up to `stop` of a diagram on a `CharGrid`, given
+        `lines` which hold those rows and the row either side of them (if
+        there are any)
+
+        Returns the band's nodes, and its edges in the order `trace_edges`
+        finds them. Edges which run out of the band are returned as
+        `_Fragment`s waiting on the characters beyond it.
+    """
+    first = max(start - 1, 0)
+    to_diagram = Point(0, first)  # maps positions in the band to the diagram
+
+    nodes, labels = get_nodes_and_labels("\n".join(lines))
+    grid = CharGrid(lines)
+    grid.mark_nodes(nodes)
+    grid.patch_labels(labels)
+    owned = range(
+        grid.index(Point(0, start - first)), grid.index(Point(0, stop - first))
+    )
+
+    def point(index):
+        """ `CharGrid.point`, but positioned in the diagram """
+        y, x = divmod(index, grid.stride)
+        return Point(x - 1, y - 1 + first)
+
+    # characters beyond the band are treated as nodes called None, so that
+    # `trace_edges` stops at them
+    node_chars = grid.map_text_chars_to_text(nodes)
+    neighbour_map = {}
+    for index in grid.edge_indexes():
+        if index < owned.start:
+            continue
+        if index >= owned.stop:
+            break
+        neighbours = grid.neighbours(index)
+        if len(neighbours) != 2:
+            pos = point(index)
+            raise invalid_edge_error(
+                _context(lines, first, pos.y),
+                pos,
+                [point(neighbour) for neighbour in neighbours],
+            )
+        neighbour_map[index] = neighbours
+        for neighbour in neighbours:
+            if neighbour not in owned and neighbour not in node_chars:
+                node_chars[neighbour] = None
+
+    label_chars = grid.map_text_chars_to_text(labels)
+    items = []
+    for edge in trace_edges(neighbour_map, node_chars, label_chars, point):
+        if None in edge["nodes"]:
+            items.append(_fragment(edge, neighbour_map, node_chars,
+                                   label_chars, point))
+        else:
+            edge["points"] = [point(index) for index in edge["points"]]
+            items.append(edge)
+
+    band_nodes = [
+        (pos + to_diagram, node) for pos, node in nodes.items()
+        if start <= pos.y + first < stop
+    ]
+    return band_nodes, items
+
+
+def _fragment(edge, neighbour_map, node_chars, label_chars, point):
+    """ Turns an edge traced by `trace_edges` that ran out of the band into
+        a `_Fragment`
+    """
+    points = edge["points"]
+    if len(points) == 1:
+        terminals = sorted(neighbour_map[points[0]])
+    else:
+        # each end's terminal is its neighbour which isn't on the edge
+        terminals = [
+            next(n for n in neighbour_map[points[0]] if n != points[1]),
+            next(n for n in neighbour_map[points[-1]] if n != points[-2]),
+        ]
+
+    fragment = _Fragment(point(min(points)))
+    fragment.points = deque(point(index) for index in points)
+    for end, terminal in zip((HEAD, TAIL), terminals):
+        if node_chars[terminal] is None:
+            fragment.awaiting[end] = point(terminal)
+        else:
+            fragment.terminals[end] = (point(terminal), node_chars[terminal])
+    fragment.labels = {
+        point(index): label_chars[index]
+        for index in points
+        if index in label_chars
+    }
+    return fragment
+
+
+def _context(lines, first, y):
+    """ The rows around row `y`, positioned as they were in the diagram so
+        that they can be used in error messages (like
+        `StreamParser._context`)
+    """
+    above = max(y - 1, 0)
+    return "\n" * above + "\n".join(
+        lines[above - first:y - first + 2]
+    )
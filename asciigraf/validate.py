@@ -0,0 +1,134 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from typing import NamedTuple, Tuple
+
+from .asciigraf import (
+    CharGrid,
+    InvalidEdgeError,
+    get_nodes_and_labels,
+    highlight_bad_edge_characters,
+    invalid_edge_error,
+)
+from .point import Point
+
+TOO_FEW_NEIGHBOURS = "too few neighbours"
+TOO_MANY_NEIGHBOURS = "too many neighbours"
+NO_NODES = "never reaches a node"
+
+
+class EdgeProblem(NamedTuple):
+    """ Something wrong with the edge character at `position`, found by
+        `validate_ascii`:
+          * TOO_FEW_NEIGHBOURS or TOO_MANY_NEIGHBOURS: it doesn't have
+            exactly two `neighbours` (e.g. the end of an edge which
+            dangles in space, or the middle of a 'T' junction)
+          * NO_NODES: it's the first character of a loop of edge
+            characters which doesn't reach any node
+
+        The error map highlighting it in the diagram is only rendered
+        when `error_map` is called.
+    """
+    problem: str
+    position: Point
+    neighbours: Tuple[Point, ...]
+    network_string: str
+
+    @property
+    def message(self):
+        return "Edge character at ln {}, col {} {}".format(
+            self.position.y,
+            self.position.x,
+            "has " + self.problem if "neighbours" in self.problem
+            else self.problem,
+        )
+
+    def error_map(self):
+        """ The diagram, with this problem highlighted in ANSI colours """
+        return highlight_bad_edge_characters(
+            self.network_string, [self.position, *self.neighbours]
+        )
+
+    def error(self):
+        """ The `InvalidEdgeError` `graph_from_ascii` raises for this
+            problem
+        """
+        if self.problem == NO_NODES:
+            return InvalidEdgeError(
+                "Edge at ln {}, col {} never reaches a node".format(
+                    self.position.y, self.position.x
+                )
+            )
+        return invalid_edge_error(
+            self.network_string, self.position, self.neighbours
+        )
+
+
+def validate_ascii(network_string):
+    """ Checks every edge character of an ascii drawing of a network,
+        returning an `EdgeProblem` for each one which `graph_from_ascii`
+        would reject, in row-major order. An empty list means the drawing
+        parses.
+
+        Unlike `graph_from_ascii`, this carries on past the first problem,
+        and never traces whole edges or builds a graph: neighbours are
+        counted on a `CharGrid` in one pass, and a second pass over the
+        characters with exactly two neighbours finds any loops which
+        never reach a node.
+    """
+    nodes, labels = get_nodes_and_labels(network_string)
+    grid = CharGrid(network_string.split("\n"))
+    grid.mark_nodes(nodes)
+    grid.patch_labels(labels)
+
+    problems = []
+    neighbour_map = {}
+    for index in grid.edge_indexes():
+        neighbours = grid.neighbours(index)
+        if len(neighbours) == 2:
+            neighbour_map[index] = neighbours
+        else:
+            problems.append(EdgeProblem(
+                TOO_FEW_NEIGHBOURS if len(neighbours) < 2
+                else TOO_MANY_NEIGHBOURS,
+                grid.point(index),
+                tuple(sorted(map(grid.point, neighbours))),
+                network_string,
+            ))
+
+    # chars with two neighbours lead either to nodes, to chars which
+    # have already been reported, or around in a loop back to themselves
+    seen = set()
+    for index in neighbour_map:
+        if index in seen:
+            continue
+        seen.add(index)
+        ends = [
+            walk(index, neighbour, neighbour_map, seen)
+            for neighbour in sorted(neighbour_map[index])
+        ]
+        if index in ends:
+            problems.append(EdgeProblem(
+                NO_NODES, grid.point(index), (), network_string
+            ))
+
+    problems.sort(key=lambda problem: problem.position)
+    return problems
+
+
+def walk(start, position, neighbour_map, seen):
+    """ Follows the edge from `start` through `position`, adding every
+        character on the way to `seen`, and returning where it ends: at
+        the first character which isn't in `neighbour_map`, or back at
+        `start` (or at any other character it's already passed)
+    """
+    previous = start
+    while position in neighbour_map and position not in seen:
+        seen.add(position)
+        a, b = neighbour_map[position]
+        previous, position = position, a if b == previous else b
+    return position
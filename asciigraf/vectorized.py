@@ -0,0 +1,106 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+try:
+    import numpy
+except ImportError:  # the "numpy" engine falls back to the "grid" engine
+    numpy = None
+
+from .asciigraf import (
+    ABUTTING,
+    EDGE_CHAR_NEIGHBOURS,
+    CharGrid,
+    invalid_edge_error,
+    trace_edges,
+)
+
+EDGE_CODE_RANGE = (
+    min(CharGrid.EDGE_CODES.values()), max(CharGrid.EDGE_CODES.values())
+)
+
+
+def get_edges_from_array(network_string, nodes, labels, stats=None):
+    """ Equivalent of `get_edges_from_grid` which finds the neighbours of
+        every edge character at once, with numpy, rather than one
+        character at a time.
+
+        The `CharGrid`'s cells are viewed as an array of uint8 without
+        copying them. For each of the eight offsets in ABUTTING, the array
+        shifted by that offset is compared against the cells themselves,
+        following the same rules as `CharGrid.neighbours`: a neighbouring
+        cell counts if it isn't blank and the cell's own edge character
+        reaches it (see EDGE_CHAR_NEIGHBOURS), or if it's the edge
+        character which reaches back from there. Counting the hits finds
+        every invalid edge character in a handful of array operations.
+    """
+    grid = CharGrid(network_string.split("\n"))
+    grid.mark_nodes(nodes)
+    if stats is not None:
+        stats.lap("load_grid")
+    grid.patch_labels(labels)
+    if stats is not None:
+        stats.lap("patch_labels")
+
+    cells = numpy.frombuffer(grid.cells, dtype=numpy.uint8)
+    # every edge char is inside the grid's blank border, so the cells from
+    # `start` to `stop` can be shifted by any offset without leaving it
+    start, stop = grid.stride + 1, len(cells) - grid.stride - 1
+    centre = cells[start:stop]
+    edge_indexes = numpy.flatnonzero(
+        (centre >= EDGE_CODE_RANGE[0]) & (centre <= EDGE_CODE_RANGE[1])
+    )
+
+    deltas = []
+    hits = numpy.empty((len(edge_indexes), len(ABUTTING)), dtype=bool)
+    for column, (offset, abutting_char) in enumerate(ABUTTING.items()):
+        delta = grid.offset(offset)
+        deltas.append(delta)
+        shifted = cells[start + delta:stop + delta]
+        reaches = numpy.zeros(256, dtype=bool)  # by the cell's own code
+        for char, offsets in EDGE_CHAR_NEIGHBOURS.items():
+            if offset in offsets:
+                reaches[CharGrid.EDGE_CODES[char]] = True
+        hit = (
+            (reaches[centre] & (shifted != CharGrid.BLANK))
+            | (shifted == CharGrid.EDGE_CODES[abutting_char])
+        )
+        hits[:, column] = hit[edge_indexes]
+
+    edge_indexes += start
+    invalid = numpy.flatnonzero(hits.sum(axis=1) != 2)
+    if len(invalid):
+        # the same error as the other engines, for the first invalid char
+        index = int(edge_indexes[invalid[0]])
+        raise invalid_edge_error(
+            network_string,
+            grid.point(index),
+            [grid.point(neighbour) for neighbour in grid.neighbours(index)],
+        )
+
+    # every row of `hits` has exactly two hits, listed in row order
+    rows, columns = numpy.nonzero(hits)
+    neighbours = (
+        edge_indexes[rows] + numpy.array(deltas, dtype=numpy.int64)[columns]
+    ).reshape(-1, 2)
+    neighbour_map = dict(zip(
+        edge_indexes.tolist(), map(tuple, neighbours.tolist())
+    ))
+    if stats is not None:
+        stats.lap("get_neighbour_map")
+        stats.edge_chars = len(neighbour_map)
+
+    edges = trace_edges(
+        neighbour_map,
+        grid.map_text_chars_to_text(nodes),
+        grid.map_text_chars_to_text(labels),
+        point=grid.point,
+    )
+    for edge in edges:
+        edge["points"] = [grid.point(index) for index in edge["points"]]
+    if stats is not None:
+        stats.lap("trace_edges")
+    return edges
@@ -0,0 +1,68 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Regression benchmark for tracing very long edges
+
+    Run with `python -m benchmarks.edge_tracing`. Exits with a non-zero
+    status if tracing stops scaling linearly with the length of the edge.
+"""
+
+import sys
+import timeit
+
+from asciigraf import graph_from_ascii
+from asciigraf.asciigraf import build_edge_from_position
+
+LENGTHS = (1000, 10000, 100000)
+MAX_SLOWDOWN = 3.0  # allowed growth in time-per-char from shortest->longest
+
+
+def straight_edge_neighbour_map(length):
+    """ The neighbour map of a horizontal edge of `length` chars, running
+        between nodes at positions 0 and `length` + 1
+    """
+    return {
+        position: (position - 1, position + 1)
+        for position in range(1, length + 1)
+    }
+
+
+def time_per_char(function, length, repeat=5):
+    number = max(1, LENGTHS[-1] // length)
+    best = min(timeit.repeat(function, number=number, repeat=repeat))
+    return best / number / length
+
+
+def main():
+    per_char = {}
+    for length in LENGTHS:
+        neighbour_map = straight_edge_neighbour_map(length)
+        node_chars = {0: "A", length + 1: "B"}
+        per_char[length] = time_per_char(
+            lambda: build_edge_from_position(
+                length // 2, neighbour_map, node_chars
+            ),
+            length,
+        )
+        print("trace {:>7} chars: {:8.1f} ns/char".format(
+            length, per_char[length] * 1e9
+        ))
+
+    diagram = "A" + "-" * LENGTHS[-1] + "B"
+    parse = time_per_char(lambda: graph_from_ascii(diagram), LENGTHS[-1], 3)
+    print("graph_from_ascii on a {} char edge: {:.3f}s".format(
+        LENGTHS[-1], parse * LENGTHS[-1]
+    ))
+
+    slowdown = per_char[LENGTHS[-1]] / per_char[LENGTHS[0]]
+    print("slowdown per char: {:.2f}x (limit {}x)".format(
+        slowdown, MAX_SLOWDOWN
+    ))
+    return 0 if slowdown <= MAX_SLOWDOWN else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Deterministic generators of valid diagrams, for benchmarking
+
+    Each generator takes a target size in characters and returns a diagram
+    of roughly that size; the same size always gives the same diagram.
+
+    Run with `python -m benchmarks.generate <kind> <size>` to print one.
+"""
+
+import itertools
+import sys
+
+GRID_CELL_WIDTH = 12
+MESH_CELL_WIDTH = 8  # mesh nodes sit half a cell to the side of the row above
+MESH_NAME_LENGTH = 4
+DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+
+
+def chains(size, nodes_per_row=4, edge_length=200):
+    """ Rows of nodes strung together by long horizontal edges, with the
+        first node of each row hanging down to the first node of the next
+    """
+    def rows():
+        for row in itertools.count():
+            if row:
+                yield "|"
+            yield ("-" * edge_length).join(
+                "c{}_{}".format(row, i) for i in range(nodes_per_row)
+            )
+    return _take(rows(), size)
+
+
+def grid(size, columns=20, labels=False):
+    """ A grid of nodes, each linked to the node to its right and the node
+        below it. Every other vertical link is labelled, and with `labels`
+        so is every horizontal one.
+    """
+    width = GRID_CELL_WIDTH * (2 if labels else 1)
+
+    def rows():
+        for row in itertools.count():
+            if row:
+                yield ("|".ljust(width) * columns).rstrip()
+                yield "".join(
+                    ("(v)" if column % 2 else " | ").ljust(width)
+                    for column in range(columns)
+                )[1:].rstrip()
+                yield ("|".ljust(width) * columns).rstrip()
+            names = ["n{}_{}".format(row, column) for column in range(columns)]
+            yield "".join(
+                (name + ("--(h{})".format(column) if labels else "")).ljust(
+                    width, "-"
+                )
+                for column, name in enumerate(names[:-1])
+            ) + names[-1]
+    return _take(rows(), size)
+
+
+def labelled(size):
+    """ A `grid` with a label on every horizontal link """
+    return grid(size, columns=10, labels=True)
+
+
+def mesh(size, columns=30):
+    """ Rows of nodes linked side to side, and diagonally (with `\\` and `/`)
+        to the two nearest nodes of the next row, which is offset by half a
+        cell
+    """
+    half = MESH_CELL_WIDTH // 2
+
+    def xs(row):
+        """ The column of each node on `row` """
+        return range(
+            half * (row % 2), MESH_CELL_WIDTH * columns, MESH_CELL_WIDTH
+        )
+
+    def rows():
+        for row in itertools.count():
+            if row:
+                links = [[" "] * (MESH_CELL_WIDTH * columns) for _ in range(3)]
+                for x in xs(row - 1):
+                    for step in range(3):
+                        if x + half in xs(row):  # down and to the right
+                            links[step][x + 1 + step] = "\\"
+                        if x - half in xs(row):  # down and to the left
+                            links[step][x + MESH_NAME_LENGTH - 2 - step] = "/"
+                for link in links:
+                    yield "".join(link).rstrip()
+            names = [
+                _name(row * columns + column, MESH_NAME_LENGTH)
+                for column in range(len(xs(row)))
+            ]
+            yield " " * xs(row)[0] + "".join(
+                name.ljust(MESH_CELL_WIDTH, "-") for name in names[:-1]
+            ) + names[-1]
+    return _take(rows(), size)
+
+
+def text(size, nodes_per_row=6):
+    """ Rows of nodes with long, many-worded names, linked side to side,
+        and each row linked to the next from its first node
+    """
+    def rows():
+        for row in itertools.count():
+            if row:
+                yield "|"
+            yield "--".join(
+                "Feeder {} Breaker {} Load Point".format(row, i)
+                for i in range(nodes_per_row)
+            )
+    return _take(rows(), size)
+
+
+KINDS = {
+    "chains": chains,
+    "grid": grid,
+    "mesh": mesh,
+    "labelled": labelled,
+    "text": text,
+}
+
+
+def generate(kind, size):
+    """ A diagram of roughly `size` characters, from the generator `kind` """
+    return KINDS[kind](size)
+
+
+def _name(number, length):
+    """ `number` in base 36, as a name of `length` characters (names repeat
+        after 36 ** `length` nodes, which is still a valid diagram)
+    """
+    digits = []
+    for _ in range(length):
+        number, digit = divmod(number, len(DIGITS))
+        digits.append(DIGITS[digit])
+    return "".join(reversed(digits))
+
+
+def _take(rows, size):
+    """ Joins up lines from `rows` until there are at least `size`
+        characters, finishing on a row of nodes (the generators above yield
+        each row of nodes last in its group of rows)
+    """
+    lines, length = [], 0
+    for line in rows:
+        lines.append(line)
+        length += len(line) + 1
+        if length > size and _is_node_row(line):
+            break
+    return "\n".join(lines)
+
+
+def _is_node_row(line):
+    return line.strip(" |/\\()v") != ""
+
+
+if __name__ == "__main__":
+    print(generate(sys.argv[1], int(sys.argv[2])))
@@ -0,0 +1,74 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Benchmark for the time `import asciigraf` takes, from `-X importtime`
+
+    Run with `python -m benchmarks.import_time [--budget MS]`. Each import
+    runs in a fresh interpreter, and the best of REPEAT is checked against
+    the budget. Exits with a non-zero status if it's over budget, or if
+    importing asciigraf imports any of DEFERRED, which should only be
+    imported once they're needed.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+REPEAT = 5
+BUDGET_MS = 50.0  # with bytecode already compiled
+DEFERRED = ("networkx", "colorama", "concurrent.futures.process")
+
+# prints the modules imported, after -X importtime prints its timings
+SCRIPT = "import sys, asciigraf; print(' '.join(sys.modules))"
+
+
+def import_time():
+    """ The cumulative time `import asciigraf` takes in a fresh interpreter,
+        in milliseconds, along with the names of every module it imported
+    """
+    # import times are meaningless if the bytecode is compiled every run
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", SCRIPT],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+        env=env,
+    )
+    # lines are of the form "import time: <self us> | <cumulative us> | name"
+    for line in result.stderr.splitlines():
+        _, cumulative_us, name = line.split("|")
+        if name.strip() == "asciigraf":
+            return int(cumulative_us) / 1000, result.stdout.split()
+    raise RuntimeError("-X importtime didn't time asciigraf")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--budget", type=float, default=BUDGET_MS)
+    args = parser.parse_args(argv)
+
+    import_time()  # compiles the bytecode, if it isn't already
+    times = []
+    for _ in range(REPEAT):
+        milliseconds, modules = import_time()
+        times.append(milliseconds)
+    best = min(times)
+    imported = [module for module in DEFERRED if module in modules]
+
+    print("import asciigraf: best {:.1f}ms of {} (budget {}ms)".format(
+        best, REPEAT, args.budget
+    ))
+    if imported:
+        print("imported too early: {}".format(", ".join(imported)))
+    return 0 if best <= args.budget and not imported else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Regression benchmark for drawing big graphs without positions
+
+    Run with `python -m benchmarks.layout`. Draws random graphs with 1.5
+    edges per node, which are far from trees, so many of their edges can't
+    be routed. Exits with a non-zero status if `ascii_from_graph` stops
+    scaling linearly with the number of nodes.
+"""
+
+import sys
+import time
+
+import networkx
+
+from asciigraf import ascii_from_graph
+
+SIZES = (500, 1000, 2000, 4000)
+# allowed growth in time-per-node from smallest->largest; quadratic
+# behaviour would be a slowdown of around 8x
+MAX_SLOWDOWN = 2.0
+
+
+def time_per_node(graph, repeat=2):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        ascii_from_graph(graph)
+        best = min(best, time.perf_counter() - start)
+    return best / graph.number_of_nodes()
+
+
+def main():
+    per_node = {}
+    for size in SIZES:
+        graph = networkx.gnm_random_graph(size, size * 3 // 2, seed=0)
+        per_node[size] = time_per_node(graph)
+        print("{:>5} nodes: {:6.2f}s, {:5.2f} ms/node".format(
+            size, per_node[size] * size, per_node[size] * 1e3
+        ))
+
+    slowdown = per_node[SIZES[-1]] / per_node[SIZES[0]]
+    print("slowdown per node: {:.2f}x (limit {}x)".format(
+        slowdown, MAX_SLOWDOWN
+    ))
+    return 0 if slowdown <= MAX_SLOWDOWN else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
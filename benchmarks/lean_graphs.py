@@ -0,0 +1,77 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Benchmark for the memory taken up by many parsed graphs held at once,
+    as with a suite's worth of test fixtures, with and without `lean`
+
+    Run with `python -m benchmarks.lean_graphs [--size N] [--count N]`.
+    Each of `count` copies of a generated diagram (see
+    `benchmarks.generate`) is read into a new string, as if from its own
+    file, parsed, and then only the graph is kept.
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+from asciigraf import graph_from_ascii
+
+from .generate import KINDS, generate
+
+MODES = {
+    "default": {},
+    "lean": {"lean": True},
+    "lean, runs": {"lean": True, "geometry": "runs"},
+    "lean, none": {"lean": True, "geometry": "none"},
+}
+DEFAULT_SIZE = 10 ** 4
+DEFAULT_COUNT = 20
+
+
+def held_memory(diagram, count, **kwargs):
+    """ The memory taken up by `count` graphs parsed from copies of
+        `diagram`, in bytes
+    """
+    tracemalloc.start()
+    try:
+        graphs = [
+            graph_from_ascii(diagram.encode("utf-8").decode("utf-8"), **kwargs)
+            for _ in range(count)
+        ]
+        held = tracemalloc.get_traced_memory()[0]
+        del graphs
+        return held
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT)
+    args = parser.parse_args(argv)
+
+    for kind in KINDS:
+        diagram = generate(kind, args.size)
+        held = {
+            mode: held_memory(diagram, args.count, **kwargs)
+            for mode, kwargs in MODES.items()
+        }
+        print("{:>8} {:>7} x{}: {}".format(
+            kind, args.size, args.count, "  ".join(
+                "{} {:.1f}KB ({:.0%})".format(
+                    mode,
+                    held[mode] / args.count / 2 ** 10,
+                    held[mode] / held["default"],
+                )
+                for mode in MODES
+            )
+        ))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
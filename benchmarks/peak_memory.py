@@ -0,0 +1,56 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Benchmark for the peak memory of parsing generated diagrams (see
+    `benchmarks.generate`) with each engine
+
+    Run with `python -m benchmarks.peak_memory [--size N]`. Memory is
+    measured with `tracemalloc`, which slows parsing down a lot, so sizes
+    default to 100KB.
+"""
+
+import argparse
+import sys
+import tracemalloc
+
+from asciigraf import graph_from_ascii
+
+from .generate import KINDS, generate
+
+ENGINES = ("dict", "grid")
+DEFAULT_SIZE = 10 ** 5
+
+
+def peak_memory(diagram, engine):
+    """ The most memory allocated at once while parsing `diagram`, in
+        bytes, not counting the diagram itself
+    """
+    tracemalloc.start()
+    try:
+        graph_from_ascii(diagram, engine=engine)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE)
+    args = parser.parse_args(argv)
+
+    for kind in KINDS:
+        diagram = generate(kind, args.size)
+        print("{:>8} {:>9}: {}".format(kind, args.size, "  ".join(
+            "{} {:7.2f}MB".format(
+                engine, peak_memory(diagram, engine) / 2 ** 20
+            )
+            for engine in ENGINES
+        )))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
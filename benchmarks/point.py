@@ -0,0 +1,86 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Micro-benchmarks for `asciigraf.point.Point`
+
+    Compares `Point` against `DictPoint`, a copy of the original
+    `__dict__`-backed implementation, on memory per instance and on the
+    cost of the operations a parse performs millions of times.
+
+    Run with `python -m benchmarks.point`
+"""
+
+import timeit
+import tracemalloc
+
+from asciigraf.point import Point
+
+N_POINTS = 100000
+
+
+class DictPoint(object):
+    """ The original Point layout: an instance `__dict__`, and a hash
+        over a (class, x, y) tuple
+    """
+    def __setattr__(self, attr, val):
+        raise TypeError("Can't set '{}' on Point object".format(attr))
+
+    def __init__(self, x, y):
+        super(DictPoint, self).__setattr__('x', x)
+        super(DictPoint, self).__setattr__('y', y)
+
+    def __add__(self, other):
+        return DictPoint(self.x + other.x, self.y + other.y)
+
+    def __eq__(self, other):
+        return (type(self) is type(other) and
+                self.x == other.x and
+                self.y == other.y
+                )
+
+    def __hash__(self):
+        return hash((self.__class__, self.x, self.y))
+
+
+def bytes_per_instance(cls):
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    points = [cls(i, i) for i in range(N_POINTS)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # don't count the list holding the points
+    return (after - before - len(points) * 8) / N_POINTS
+
+
+def ns_per_call(statement, number=200000):
+    best = min(timeit.repeat(statement, number=number, repeat=5))
+    return best / number * 1e9
+
+
+def measure(cls):
+    a, b = cls(3, 4), cls(1, 1)
+    lookup = {cls(x, y): None for x in range(50) for y in range(50)}
+    return {
+        "bytes/instance": bytes_per_instance(cls),
+        "create (ns)": ns_per_call(lambda: cls(3, 4)),
+        "hash (ns)": ns_per_call(lambda: hash(a)),
+        "add (ns)": ns_per_call(lambda: a + b),
+        "dict lookup (ns)": ns_per_call(lambda: cls(3, 4) in lookup),
+    }
+
+
+def main():
+    results = {cls.__name__: measure(cls) for cls in (DictPoint, Point)}
+    print("{:<18}{:>12}{:>12}{:>10}".format("", "DictPoint", "Point", ""))
+    for metric in results["Point"]:
+        old, new = results["DictPoint"][metric], results["Point"][metric]
+        print("{:<18}{:>12.1f}{:>12.1f}{:>9.2f}x".format(
+            metric, old, new, old / new
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Benchmark for each stage of parsing, over generated diagrams of 1KB up
+    to 100MB (see `benchmarks.generate`)
+
+    Run with `python -m benchmarks.stages [--max-size N] [--kinds K ...]
+    [--output results.json] [--compare baseline.json]`. Stages are timed
+    on the "dict" engine, whose stages are separate functions, and the
+    whole of `graph_from_ascii` is timed with its default engine.
+
+    `--output` saves the timings as JSON. `--compare` checks them against
+    a saved file, and exits with a non-zero status if any stage got more
+    than MAX_SLOWDOWN times slower. Sizes default to 1MB and below, since
+    the dict engine needs a few hundred bytes of memory per character.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import asciigraf
+from asciigraf.asciigraf import (
+    build_networkx_graph,
+    get_edge_chars,
+    get_neighbour_map,
+    get_nodes_and_labels,
+    map_text_chars_to_text,
+    patch_edge_chars_over_labels,
+    tokenize,
+    trace_edges,
+)
+
+from .generate import KINDS, generate
+
+SIZES = (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8)
+DEFAULT_MAX_SIZE = 10 ** 6
+STAGES = (
+    "get_nodes_and_labels",
+    "get_edge_chars",
+    "patch_edge_chars_over_labels",
+    "get_neighbour_map",
+    "trace_edges",
+    "build_networkx_graph",
+    "tokenize",
+    "graph_from_ascii",
+)
+MAX_SLOWDOWN = 1.5
+MIN_COMPARED_TIME = 1e-3  # faster stages than this are mostly noise
+
+
+def time_stages(diagram):
+    """ The time each of STAGES takes to parse `diagram`, in seconds, along
+        with the graph it parses to
+    """
+    times = {}
+
+    def timed(stage, function, *args):
+        start = time.perf_counter()
+        result = function(*args)
+        times[stage] = time.perf_counter() - start
+        return result
+
+    nodes, labels = timed(
+        "get_nodes_and_labels", get_nodes_and_labels, diagram
+    )
+    edge_chars = timed("get_edge_chars", get_edge_chars, diagram)
+    edge_chars = timed(
+        "patch_edge_chars_over_labels",
+        patch_edge_chars_over_labels, labels, edge_chars,
+    )
+    neighbour_map = timed(
+        "get_neighbour_map", get_neighbour_map, diagram, edge_chars, nodes
+    )
+    edges = timed(
+        "trace_edges",
+        lambda neighbour_map, nodes, labels: trace_edges(
+            neighbour_map,
+            map_text_chars_to_text(nodes),
+            map_text_chars_to_text(labels),
+        ),
+        neighbour_map, nodes, labels,
+    )
+    graph = timed("build_networkx_graph", build_networkx_graph, nodes, edges)
+    # free the intermediate results before timing the whole parse
+    del nodes, labels, edge_chars, neighbour_map, edges
+
+    # the single pass that replaces the first three stages
+    timed("tokenize", tokenize, diagram)
+    timed("graph_from_ascii", asciigraf.graph_from_ascii, diagram)
+    return times, graph
+
+
+def best_times(diagram, repeat):
+    """ The best of `repeat` runs of `time_stages`, stage by stage """
+    best = {}
+    for _ in range(repeat):
+        times, graph = time_stages(diagram)
+        for stage, elapsed in times.items():
+            best[stage] = min(elapsed, best.get(stage, elapsed))
+    return best, graph
+
+
+def run(kinds, max_size):
+    results = []
+    for kind in kinds:
+        for size in SIZES:
+            if size > max_size:
+                break
+            diagram = generate(kind, size)
+            repeat = 3 if size < 10 ** 6 else 1
+            times, graph = best_times(diagram, repeat)
+            results.append({
+                "kind": kind,
+                "size": size,
+                "chars": len(diagram),
+                "nodes": graph.number_of_nodes(),
+                "edges": graph.number_of_edges(),
+                "stages": times,
+            })
+            print("{:>8} {:>9}: {}".format(kind, size, "  ".join(
+                "{} {:.4f}s".format(stage, times[stage]) for stage in STAGES
+            )))
+    return {"metadata": metadata(), "results": results}
+
+
+def metadata():
+    return {
+        "asciigraf": asciigraf.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def compare(baseline, current):
+    """ Prints how much slower each stage is than in `baseline`, and returns
+        whether any is more than MAX_SLOWDOWN times slower
+    """
+    def by_diagram(report):
+        return {
+            (result["kind"], result["size"]): result["stages"]
+            for result in report["results"]
+        }
+
+    old = by_diagram(baseline)
+    regressed = False
+    for key, stages in by_diagram(current).items():
+        if key not in old:
+            continue
+        for stage, elapsed in stages.items():
+            before = old[key].get(stage)
+            if before is None or before < MIN_COMPARED_TIME:
+                continue
+            ratio = elapsed / before
+            slower = ratio > MAX_SLOWDOWN
+            regressed |= slower
+            print("{:>8} {:>9} {:<29} {:6.2f}x{}".format(
+                *key, stage, ratio, "  SLOWER" if slower else ""
+            ))
+    return regressed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-size", type=float, default=DEFAULT_MAX_SIZE)
+    parser.add_argument(
+        "--kinds", nargs="+", choices=sorted(KINDS), default=list(KINDS)
+    )
+    parser.add_argument("--output")
+    parser.add_argument("--compare")
+    args = parser.parse_args(argv)
+
+    report = run(args.kinds, args.max_size)
+    if args.output:
+        with open(args.output, "w") as fp:
+            json.dump(report, fp, indent=2)
+    if args.compare:
+        with open(args.compare) as fp:
+            if compare(json.load(fp), report):
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Benchmark for parsing one very large diagram in bands across processes
+
+    Run with `python -m benchmarks.tiled_parsing [rows] [columns]`. Prints
+    the time `graph_from_ascii_tiled` takes with 1, 2, 4, ... workers (up to
+    the number of CPUs), next to the serial `graph_from_ascii`.
+"""
+
+import os
+import sys
+import time
+
+from asciigraf import graph_from_ascii
+from asciigraf.tiles import graph_from_ascii_tiled
+
+CELL_WIDTH = 12
+
+
+def grid_diagram(rows, columns):
+    """ A grid of `rows` x `columns` nodes, each linked to the node to its
+        right and the node below it, with every other vertical link labelled
+    """
+    lines = []
+    for row in range(rows):
+        names = ["n{}_{}".format(row, column) for column in range(columns)]
+        lines.append("".join(
+            name.ljust(CELL_WIDTH, "-") for name in names[:-1]
+        ) + names[-1])
+        if row == rows - 1:
+            break
+        lines.append("|".ljust(CELL_WIDTH) * columns)
+        lines.append("".join(
+            ("(v)" if column % 2 else " | ").ljust(CELL_WIDTH)
+            for column in range(columns)
+        )[1:])
+        lines.append("|".ljust(CELL_WIDTH) * columns)
+    return "\n".join(line.rstrip() for line in lines)
+
+
+def best_of(function, repeat=3):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(rows=2000, columns=40):
+    diagram = grid_diagram(rows, columns)
+    print("{} x {} grid: {:.1f} MB".format(
+        rows, columns, len(diagram) / 1e6
+    ))
+
+    serial = best_of(lambda: graph_from_ascii(diagram))
+    print("graph_from_ascii:              {:7.2f}s".format(serial))
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        elapsed = best_of(
+            lambda: graph_from_ascii_tiled(diagram, workers=workers)
+        )
+        print("graph_from_ascii_tiled({:>3}):   {:7.2f}s  ({:.2f}x)".format(
+            workers, elapsed, serial / elapsed
+        ))
+        workers *= 2
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
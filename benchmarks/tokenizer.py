@@ -0,0 +1,71 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+""" Regression benchmark for tokenizing adversarial diagrams
+
+    Run with `python -m benchmarks.tokenizer`. Exits with a non-zero status
+    if `tokenize` stops scaling linearly with the size of any of them.
+"""
+
+import sys
+import timeit
+
+from asciigraf.asciigraf import tokenize
+
+# kept small enough to stay in the CPU's caches: past them regex matching
+# slows down a few times per char for reasons that have nothing to do with
+# how the tokenizer scales, and would hide a real regression
+SIZES = (10000, 30000, 100000)
+# allowed growth in time-per-char from smallest->largest; linear behaviour
+# stays within measurement noise of 1x, quadratic behaviour would be ~10x
+MAX_SLOWDOWN = 2.0
+
+PATHOLOGICAL = {
+    # one node whose name is many words, with or without a final space
+    "spaced words": lambda size: "a " * (size // 2),
+    "spaced words, then an edge": lambda size: "ab " * (size // 3) + "-",
+    # carets, which the old node pattern also accepted between words
+    "carets": lambda size: "^" * (size - 1) + " ",
+    "caret words": lambda size: "a^ " * (size // 3),
+    # words split by double spaces, so every word is a node of its own
+    "double spaced words": lambda size: "ab  " * (size // 4),
+    # one enormous label, across an edge
+    "long label": lambda size: "A-(" + "x " * (size // 2) + ")-B",
+    # a label on every other row, crossing one long vertical edge
+    "stacked labels": lambda size: "A\n" + "|\n(l)\n" * (size // 6) + "|\nB",
+}
+
+
+def time_per_char(function, size, repeat=5):
+    number = max(1, SIZES[-1] // size)
+    best = min(timeit.repeat(function, number=number, repeat=repeat))
+    return best / number / size
+
+
+def main():
+    worst = 0
+    for name, diagram_of_size in PATHOLOGICAL.items():
+        per_char = {}
+        for size in SIZES:
+            diagram = diagram_of_size(size)
+            per_char[size] = time_per_char(
+                lambda: tokenize(diagram), len(diagram)
+            )
+        slowdown = per_char[SIZES[-1]] / per_char[SIZES[0]]
+        worst = max(worst, slowdown)
+        print("{:<28} {}  slowdown {:.2f}x".format(name, "  ".join(
+            "{:>7}: {:6.1f} ns/char".format(size, per_char[size] * 1e9)
+            for size in SIZES
+        ), slowdown))
+
+    print("worst slowdown per char: {:.2f}x (limit {}x)".format(
+        worst, MAX_SLOWDOWN
+    ))
+    return 0 if worst <= MAX_SLOWDOWN else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+DIAGRAMS = [
+    " A---B----C----D",
+    "  n1---(label)--n2  ",
+    r"""
+          s---p----1---nx
+         /    |        |
+        /     |        0---f
+       6l-a   c--
+      /   |      \--k
+     /   ua         |  9e
+    q      \        | /
+            \-r7z   jud
+                \    |
+                 m   y
+                  \  |
+                   v-ow
+    """,
+    """
+        A---(nuts)----B----(string)---C
+                      |
+                      |
+                      |
+                      D---(string)----E
+    """,
+    """
+                C
+        A---D   |
+          (Vertical)
+                |
+                B
+    """,
+    """
+         ------|
+         |     |
+         1     |
+        2------|
+    """,
+]
+
+
+def assert_same_graph(graph, parsed, ordered=True):
+    """ Asserts `graph` has the same nodes and edges, with the same data,
+        as `parsed`, and in the same order unless `ordered` is False
+    """
+    if ordered:
+        assert list(graph.nodes(data=True)) == list(parsed.nodes(data=True))
+        assert list(graph.edges(data=True)) == list(parsed.edges(data=True))
+    else:
+        assert dict(graph.nodes(data=True)) == dict(parsed.nodes(data=True))
+        assert {
+            frozenset((u, v)): data for u, v, data in graph.edges(data=True)
+        } == {
+            frozenset((u, v)): data for u, v, data in parsed.edges(data=True)
+        }
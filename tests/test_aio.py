@@ -0,0 +1,202 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+import asciigraf.aio
+from asciigraf import graph_from_ascii
+from asciigraf.aio import graph_from_ascii_async, graph_from_stream
+from asciigraf.asciigraf import InvalidEdgeError
+
+from .helpers import DIAGRAMS, assert_same_graph
+
+
+def reader_of(data):
+    async def read():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await graph_from_stream(reader)
+    return read()
+
+
+class SlowParse(object):
+    """ Stands in for `graph_from_ascii`, counting how many are running """
+
+    def __init__(self, seconds=0.05):
+        self.seconds = seconds
+        self.running = self.most_running = self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, network_string, **kwargs):
+        with self.lock:
+            self.calls += 1
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        time.sleep(self.seconds)
+        with self.lock:
+            self.running -= 1
+        return network_string
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_async_graphs_match_graph_from_ascii(network_string):
+    graph = asyncio.run(graph_from_ascii_async(network_string))
+
+    assert_same_graph(graph, graph_from_ascii(network_string))
+    assert graph.graph == graph_from_ascii(network_string).graph
+
+
+def test_diagrams_can_be_parsed_in_other_processes():
+    async def parse():
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            return await graph_from_ascii_async(
+                "A---B", executor=executor, backend="arrays"
+            )
+
+    assert asyncio.run(parse()) == graph_from_ascii("A---B", backend="arrays")
+
+
+def test_errors_are_raised_by_the_call():
+    with pytest.raises(InvalidEdgeError):
+        asyncio.run(graph_from_ascii_async("A---"))
+
+
+def test_limit_caps_how_many_diagrams_are_parsed_at_once(monkeypatch):
+    slow_parse = SlowParse()
+    monkeypatch.setattr(asciigraf.aio, "graph_from_ascii", slow_parse)
+
+    async def parse_all():
+        limit = asyncio.Semaphore(2)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return await asyncio.gather(*(
+                graph_from_ascii_async(str(i), executor=executor, limit=limit)
+                for i in range(6)
+            ))
+
+    assert asyncio.run(parse_all()) == [str(i) for i in range(6)]
+    assert slow_parse.most_running == 2
+
+
+def test_cancelled_calls_keep_their_place_until_their_parse_stops(
+        monkeypatch):
+    slow_parse = SlowParse(seconds=0.2)
+    monkeypatch.setattr(asciigraf.aio, "graph_from_ascii", slow_parse)
+
+    async def cancel_one():
+        limit = asyncio.Semaphore(1)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = asyncio.ensure_future(
+                graph_from_ascii_async("A", executor=executor, limit=limit)
+            )
+            waiting = asyncio.ensure_future(
+                graph_from_ascii_async("B", executor=executor, limit=limit)
+            )
+            await asyncio.sleep(0.05)
+            first.cancel()
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+
+            # the first parse is still running, and still holds the limit
+            assert limit.locked()
+            assert await graph_from_ascii_async(
+                "C", executor=executor, limit=limit
+            ) == "C"
+            assert slow_parse.most_running == 1
+
+    asyncio.run(cancel_one())
+    assert slow_parse.calls == 2  # "B" never ran
+
+
+def test_queued_parses_are_cancelled(monkeypatch):
+    slow_parse = SlowParse(seconds=0.2)
+    monkeypatch.setattr(asciigraf.aio, "graph_from_ascii", slow_parse)
+
+    async def cancel_queued():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            first = asyncio.ensure_future(
+                graph_from_ascii_async("A", executor=executor)
+            )
+            queued = asyncio.ensure_future(
+                graph_from_ascii_async("B", executor=executor)
+            )
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            assert await first == "A"
+
+    asyncio.run(cancel_queued())
+    assert slow_parse.calls == 1
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_streamed_graphs_match_graph_from_ascii(network_string):
+    graph = asyncio.run(reader_of(network_string.encode("utf-8")))
+
+    assert_same_graph(graph, graph_from_ascii(network_string))
+
+
+def test_streams_are_parsed_as_rows_arrive():
+    async def parse():
+        reader = asyncio.StreamReader()
+        parse = asyncio.ensure_future(graph_from_stream(reader))
+        for row in [b"A---B\n", b"|\n", b"C"]:
+            reader.feed_data(row)
+            await asyncio.sleep(0)
+            assert not parse.done()
+        reader.feed_eof()
+        return await parse
+
+    assert set(asyncio.run(parse()).edges()) == {("A", "B"), ("A", "C")}
+
+
+def test_streams_raise_invalid_edges():
+    with pytest.raises(InvalidEdgeError):
+        asyncio.run(reader_of(b"A---\n"))
+
+
+def test_streams_can_be_cancelled():
+    async def cancel():
+        reader = asyncio.StreamReader()
+        limit = asyncio.Semaphore(1)
+        parse = asyncio.ensure_future(graph_from_stream(reader, limit=limit))
+        reader.feed_data(b"A---B\n")
+        await asyncio.sleep(0)
+        parse.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await parse
+        assert not limit.locked()
+
+    asyncio.run(cancel())
+
+
+def test_big_streams_let_other_tasks_run(monkeypatch):
+    monkeypatch.setattr(asciigraf.aio, "ROWS_PER_YIELD", 10)
+    ticks = []
+
+    async def parse():
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        ticks.clear()
+        graph = await reader_of(b"A\n" + b"|\n" * 100 + b"B")
+        ticker.cancel()
+        return graph
+
+    assert set(asyncio.run(parse()).edges()) == {("A", "B")}
+    assert len(ticks) >= 10
@@ -0,0 +1,47 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import pickle
+
+import pytest
+
+from asciigraf import graph_from_ascii
+
+from .helpers import DIAGRAMS, assert_same_graph
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS + [
+    "A--B\n|  |\nC--D\n\nA---(lbl)-B",  # repeated nodes and edges
+])
+def test_arrays_convert_to_the_same_graph(network_string):
+    arrays = graph_from_ascii(network_string, backend="arrays")
+
+    assert_same_graph(arrays.to_networkx(), graph_from_ascii(network_string))
+    assert pickle.loads(pickle.dumps(arrays)) == arrays
+
+
+def test_array_layout():
+    arrays = graph_from_ascii("""
+        A---(x)---B
+        |
+        C
+    """, backend="arrays")
+
+    assert arrays.nodes == ["A", "B", "C"]
+    assert list(arrays.positions) == [8, 1, 18, 1, 8, 3]
+    assert list(arrays.sources) == [0, 0]
+    assert list(arrays.targets) == [1, 2]
+    assert list(arrays.lengths) == [9, 1]
+    assert arrays.labels == ["x", None]
+    assert list(arrays.point_offsets) == [0, 9, 10]
+    assert arrays.edge_points(1) == [(8, 2)]
+    assert list(arrays.points[:4]) == [9, 1, 10, 1]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        graph_from_ascii("A---B", backend="numpy")
@@ -362,3 +362,59 @@ Too many many neighbors at ln 3, col 16
 \x1b[0m                \x1b[31m\x1b[1m|\x1b[0m
 \x1b[0m                n3
 \x1b[0m\x1b[2m"""\x1b[0m'''  # noqa
+
+
+def test_errors_in_big_diagrams_only_render_a_window_of_them():
+    rows = ["A{}-----B{}".format(i, i) for i in range(1000)]
+    rows[500] = "A500----- B500"
+
+    with pytest.raises(InvalidEdgeError) as e:
+        graph_from_ascii("\n".join(rows))
+
+    lines = str(e.value).replace("\x1b[0m", "").splitlines()
+    assert lines[:5] == [
+        "Too few many neighbors at ln 500, col 8",
+        "",
+        "network_string, ln 490-510, col 0-48:",
+        "      ... 490 rows above ...",
+        "          0         10        20        30        40",
+    ]
+    assert lines[6] == "490 |     A490-----B490"
+    assert lines[16] == (
+        "500 |     A500---\x1b[31m\x1b[1m-\x1b[31m\x1b[1m- B500"
+    )
+    assert lines[-1] == "      ... more rows below ..."
+    assert len(lines) == 28
+
+
+def test_error_windows_mark_the_columns_they_leave_out():
+    network_string = "A" + "-" * 5000 + " " + "-" * 5000 + "B"
+
+    with pytest.raises(InvalidEdgeError) as e:
+        graph_from_ascii(network_string)
+
+    *_, ruler, ticks, row = str(e.value).replace("\x1b[0m", "").splitlines()
+    assert ruler.split() == [str(x) for x in range(4960, 5040, 10)]
+    assert ticks == "        .|" + "....:....|" * 8
+    assert row.startswith("0 | ... ----")
+    assert row.endswith("---- ...")
+
+
+@pytest.mark.parametrize("engine", ["dict", "grid"])
+def test_very_long_edges_are_traced(engine):
+    # well beyond the depth at which a recursive trace would fail
+    graph = graph_from_ascii("A" + "-" * 20000 + "B", engine=engine)
+
+    assert set(graph.edges()) == {("A", "B")}
+    assert graph.get_edge_data("A", "B")["length"] == 20000
+
+
+@pytest.mark.parametrize("engine", ["dict", "grid"])
+def test_edges_that_loop_without_reaching_a_node_raise(engine):
+    with pytest.raises(InvalidEdgeError) as e:
+        graph_from_ascii("""
+            -----
+            |   |
+            -----""", engine=engine)
+
+    assert str(e.value) == "Edge at ln 1, col 12 never reaches a node"
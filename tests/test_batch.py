@@ -0,0 +1,43 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from asciigraf import graph_from_ascii, graphs_from_ascii
+from asciigraf.asciigraf import InvalidEdgeError
+
+from .helpers import DIAGRAMS, assert_same_graph
+
+
+def test_results_come_back_in_order():
+    results = list(graphs_from_ascii(DIAGRAMS, workers=2, chunksize=2))
+
+    assert [result.index for result in results] == list(range(len(DIAGRAMS)))
+    for result, network_string in zip(results, DIAGRAMS):
+        assert result.error is None
+        assert_same_graph(
+            result.graph.to_networkx(), graph_from_ascii(network_string)
+        )
+
+
+def test_results_as_completed():
+    results = graphs_from_ascii(
+        DIAGRAMS, workers=2, chunksize=1, ordered=False
+    )
+
+    assert sorted(result.index for result in results) == list(
+        range(len(DIAGRAMS))
+    )
+
+
+def test_errors_are_reported_per_diagram():
+    results = list(graphs_from_ascii(
+        ["A---B", "A--- B", "C---D"], workers=2, chunksize=2
+    ))
+
+    assert results[0].graph.nodes == ["A", "B"]
+    assert results[1].graph is None
+    assert isinstance(results[1].error, InvalidEdgeError)
+    assert results[2].graph.nodes == ["C", "D"]
@@ -0,0 +1,154 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import threading
+import time
+
+import networkx
+import pytest
+
+import asciigraf.asciigraf
+from asciigraf.asciigraf import InvalidEdgeError
+from asciigraf.cache import CacheInfo, ParseCache
+
+from .helpers import assert_same_graph
+
+
+def test_repeated_diagrams_are_served_from_the_cache():
+    cache = ParseCache()
+
+    first = cache.graph_from_ascii("A---B")
+    second = cache.graph_from_ascii("A---B")
+
+    assert set(first.edges()) == set(second.edges()) == {("A", "B")}
+    assert cache.info() == CacheInfo(
+        hits=1, misses=1, evictions=0, currsize=1, maxsize=128
+    )
+
+
+def test_least_recently_used_diagrams_are_evicted():
+    cache = ParseCache(maxsize=2)
+
+    cache.graph_from_ascii("A---B")
+    cache.graph_from_ascii("C---D")
+    cache.graph_from_ascii("A---B")
+    cache.graph_from_ascii("E---F")  # evicts C---D
+    cache.graph_from_ascii("A---B")
+    cache.graph_from_ascii("C---D")
+
+    assert cache.info() == CacheInfo(
+        hits=2, misses=4, evictions=2, currsize=2, maxsize=2
+    )
+
+
+def test_copies_dont_affect_cached_graphs():
+    cache = ParseCache()
+
+    graph = cache.graph_from_ascii("A---B")
+    graph.add_edge("B", "C")
+    graph.add_node("A", position=(100, 100))
+
+    fresh = cache.graph_from_ascii("A---B")
+    assert set(fresh.edges()) == {("A", "B")}
+    assert networkx.get_node_attributes(fresh, "position")["A"] == (0, 0)
+
+
+def test_copies_match_the_parsed_graph_and_arent_frozen():
+    cache = ParseCache()
+    diagram = "A---(x)---B\n|\nC"
+
+    cache.graph_from_ascii(diagram)
+    graph = cache.graph_from_ascii(diagram)
+    parsed = asciigraf.graph_from_ascii(diagram)
+
+    assert not networkx.is_frozen(graph)
+    assert_same_graph(graph, parsed)
+    assert graph.graph == parsed.graph
+
+
+def test_uncopied_graphs_are_frozen():
+    cache = ParseCache(copy=False)
+
+    graph = cache.graph_from_ascii("A---B")
+
+    assert graph is cache.graph_from_ascii("A---B")
+    assert networkx.is_frozen(graph)
+    with pytest.raises(networkx.NetworkXError):
+        graph.add_edge("B", "C")
+
+
+def test_parse_arguments_are_part_of_the_key():
+    cache = ParseCache()
+
+    cache.graph_from_ascii("A---B", engine="dict")
+    cache.graph_from_ascii("A---B", engine="grid")
+
+    assert cache.info().misses == 2
+
+
+def test_errors_are_raised_and_not_cached():
+    cache = ParseCache()
+
+    for _ in range(2):
+        with pytest.raises(InvalidEdgeError):
+            cache.graph_from_ascii("A---")
+
+    assert cache.info().misses == 2
+    assert cache.info().currsize == 0
+
+
+def test_clearing_drops_graphs_and_counters():
+    cache = ParseCache()
+    cache.graph_from_ascii("A---B")
+    cache.graph_from_ascii("A---B")
+
+    cache.clear()
+
+    assert cache.info() == CacheInfo(0, 0, 0, 0, 128)
+
+
+def test_concurrent_requests_for_a_diagram_parse_it_once(monkeypatch):
+    parse_calls = []
+    graph_from_ascii = asciigraf.asciigraf.graph_from_ascii
+
+    def slow_graph_from_ascii(network_string, **kwargs):
+        parse_calls.append(network_string)
+        time.sleep(0.1)
+        return graph_from_ascii(network_string, **kwargs)
+
+    monkeypatch.setattr(
+        asciigraf.asciigraf, "graph_from_ascii", slow_graph_from_ascii
+    )
+    cache = ParseCache()
+    graphs = []
+
+    threads = [
+        threading.Thread(
+            target=lambda: graphs.append(cache.graph_from_ascii("A---B"))
+        )
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert parse_calls == ["A---B"]
+    assert len(graphs) == 8
+    assert cache.info().misses == 1
+    assert cache.info().hits == 7
+
+
+def test_array_graphs_are_copied():
+    cache = ParseCache()
+
+    first = cache.graph_from_ascii("A---B", backend="arrays")
+    first.points[0] = 100
+    second = cache.graph_from_ascii("A---B", backend="arrays")
+
+    assert list(second.points) == [1, 0, 2, 0, 3, 0]
+    assert cache.info().hits == 1
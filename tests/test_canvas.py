@@ -0,0 +1,91 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import networkx
+import pytest
+
+from asciigraf import draw_graph, graph_from_ascii
+from asciigraf.canvas import Canvas, draw_chars
+from asciigraf.point import Point
+
+from .helpers import DIAGRAMS
+
+
+def edge_data(graph):
+    return {
+        frozenset((u, v)): (data["points"], data.get("label"))
+        for u, v, data in graph.edges(data=True)
+    }
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_drawn_graphs_parse_back_to_the_same_graph(network_string):
+    graph = graph_from_ascii(network_string)
+    redrawn = graph_from_ascii(draw_graph(graph))
+
+    assert (
+        networkx.get_node_attributes(redrawn, "position")
+        == networkx.get_node_attributes(graph, "position")
+    )
+    assert edge_data(redrawn) == edge_data(graph)
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_drawing_array_graphs(network_string):
+    graph = graph_from_ascii(network_string, backend="arrays")
+
+    assert draw_graph(graph) == draw_graph(graph.to_networkx())
+
+
+def test_drawing_a_graph():
+    graph = networkx.Graph()
+    graph.add_node("A", position=(0, 0))
+    graph.add_node("B", position=(3, 3))
+    graph.add_edge(
+        "A", "B", points=[(1, 0), (2, 0), (3, 0), (3, 1), (3, 2)]
+    )
+
+    assert draw_graph(graph) == "A--|\n   |\n   |\n   B"
+
+
+def test_labels_go_on_the_first_stretch_with_room():
+    graph = graph_from_ascii("""
+        A--------\\
+                  \\
+                   \\------------B
+    """)
+    graph["A"]["B"]["label"] = "x"
+
+    assert draw_graph(graph).splitlines()[1] == "        A-(x)----\\"
+
+
+@pytest.mark.parametrize("network_string", ["b-b\n\nb", "A---B\n\nA---C"])
+def test_nodes_drawn_more_than_once_cant_be_redrawn(network_string):
+    graph = graph_from_ascii(network_string)
+
+    with pytest.raises(ValueError) as e:
+        draw_graph(graph)
+
+    assert "drawn more than once" in str(e.value)
+
+
+def test_drawing_chars():
+    assert draw_chars([
+        (Point(3, 1), "-"),
+        (Point(0, 1), "A"),
+        ((2, 3), "B"),
+    ]) == "\nA  -\n\n  B"
+
+
+def test_canvas_grows_to_fit():
+    canvas = Canvas([2, 2])
+    canvas.write(1, 0, "abc")
+    canvas.write(0, 3, "d")
+
+    assert canvas.get(3, 0) == "c"
+    assert canvas.get(4, 0) == " "
+    assert canvas.render() == " abc\n  \n\nd"
@@ -0,0 +1,92 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import networkx
+import pytest
+
+from asciigraf import Diagram, graph_from_ascii
+from asciigraf.asciigraf import InvalidEdgeError
+
+from .helpers import DIAGRAMS, assert_same_graph
+
+
+def assert_matches_its_text(diagram):
+    # edits don't keep the edges in the order a fresh parse would give
+    assert_same_graph(
+        diagram.graph, graph_from_ascii(diagram.text), ordered=False
+    )
+
+
+NETWORK = """
+  A---(l1)---B-----C
+  |          |      \\
+  |          D       E
+  F----G     |
+       |     H---(x)---I
+       J
+"""
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_diagram_matches_graph_from_ascii(network_string):
+    assert_matches_its_text(Diagram(network_string))
+
+
+def test_replacing_a_node():
+    diagram = Diagram(NETWORK)
+    diagram.replace(1, 13, 14, "K")
+
+    assert_matches_its_text(diagram)
+    assert "B" not in diagram.graph
+    assert diagram.graph.has_edge("A", "K")
+    assert diagram.graph.has_edge("K", "C")
+
+
+def test_redrawing_an_edge():
+    diagram = Diagram(NETWORK)
+    diagram.replace(5, 7, 8, " ")
+
+    assert_matches_its_text(diagram)
+    assert not diagram.graph.has_edge("G", "J")
+
+    diagram.replace(5, 7, 8, "|")
+
+    assert_matches_its_text(diagram)
+    assert diagram.graph.has_edge("G", "J")
+
+
+def test_inserting_and_deleting_lines_moves_what_is_below():
+    diagram = Diagram(NETWORK)
+    diagram.insert_lines(5, ["       |     |"])
+
+    assert_matches_its_text(diagram)
+    assert networkx.get_node_attributes(diagram.graph, "position")["J"] == (
+        7, 7
+    )
+
+    diagram.delete_lines(5, 6)
+
+    assert_matches_its_text(diagram)
+    assert diagram.text == NETWORK
+
+
+def test_invalid_edits_are_not_applied():
+    diagram = Diagram(NETWORK)
+
+    with pytest.raises(InvalidEdgeError):
+        diagram.replace(1, 5, 6, "|")
+
+    assert diagram.text == NETWORK
+    assert_matches_its_text(diagram)
+
+
+def test_multiline_replace():
+    diagram = Diagram("A---B")
+    diagram.replace(0, 4, 5, "C\n|\nD")
+
+    assert diagram.lines == ["A---C", "|", "D"]
+    assert_matches_its_text(diagram)
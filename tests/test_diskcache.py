@@ -0,0 +1,162 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import os
+import threading
+
+import pytest
+
+import asciigraf.asciigraf
+from asciigraf import graph_from_ascii
+from asciigraf.asciigraf import InvalidEdgeError
+from asciigraf.diskcache import CACHE_DIRNAME, SUFFIX, DiskCache, dumps, loads
+
+from .helpers import DIAGRAMS, assert_same_graph
+
+
+def entries(directory):
+    return sorted(
+        name for name in os.listdir(str(directory)) if name.endswith(SUFFIX)
+    )
+
+
+def fail_to_parse(monkeypatch):
+    def graph_from_ascii(*args, **kwargs):
+        raise AssertionError("parsed a cached diagram")
+
+    monkeypatch.setattr(
+        asciigraf.asciigraf, "graph_from_ascii", graph_from_ascii
+    )
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS + [""])
+def test_entries_hold_the_same_graph(network_string):
+    arrays = graph_from_ascii(network_string, backend="arrays")
+
+    assert loads(dumps(arrays)) == arrays
+
+
+def test_cached_graphs_are_the_same_as_parsed_ones(tmp_path):
+    network_string = """
+        A---(nuts)----B----()---C
+                      |
+                      D"""
+    cache = DiskCache(tmp_path)
+
+    cache.graph_from_ascii(network_string)  # parses it
+    graph = cache.graph_from_ascii(network_string)  # loads it
+    parsed = graph_from_ascii(network_string)
+
+    assert_same_graph(graph, parsed)
+    assert graph.graph == parsed.graph
+    assert cache.graph_from_ascii(network_string, backend="arrays") == (
+        graph_from_ascii(network_string, backend="arrays")
+    )
+
+
+def test_cached_diagrams_arent_parsed_again(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path)
+    cache.graph_from_ascii("A---B")
+    assert len(entries(tmp_path)) == 1
+
+    fail_to_parse(monkeypatch)
+    assert set(DiskCache(tmp_path).graph_from_ascii("A---B").edges()) == {
+        ("A", "B")
+    }
+
+
+def test_entries_are_kept_next_to_diagram_files(tmp_path, monkeypatch):
+    path = tmp_path / "diagram.txt"
+    path.write_text("A---B\n|\nC")
+    cache = DiskCache()
+
+    assert set(cache.graph_from_path(str(path)).edges()) == {
+        ("A", "B"), ("A", "C")
+    }
+    assert len(entries(tmp_path / CACHE_DIRNAME)) == 1
+
+    fail_to_parse(monkeypatch)
+    cache.graph_from_path(str(path))
+
+
+def test_changed_diagrams_and_versions_get_new_entries(tmp_path, monkeypatch):
+    cache = DiskCache(tmp_path)
+    cache.graph_from_ascii("A---B")
+    cache.graph_from_ascii("A---C")
+    monkeypatch.setattr("asciigraf.diskcache.version", lambda: "0.0.1")
+    cache.graph_from_ascii("A---B")
+
+    assert len(entries(tmp_path)) == 3
+
+
+def test_invalid_entries_are_parsed_again(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.graph_from_ascii("A---B")
+    entry, = entries(tmp_path)
+    with open(str(tmp_path / entry), "r+b") as fp:
+        fp.truncate(30)
+
+    assert set(cache.graph_from_ascii("A---B").edges()) == {("A", "B")}
+    assert os.path.getsize(str(tmp_path / entry)) > 30
+
+
+def test_invalid_diagrams_arent_cached(tmp_path):
+    cache = DiskCache(tmp_path)
+
+    with pytest.raises(InvalidEdgeError):
+        cache.graph_from_ascii("A---")
+    assert entries(tmp_path) == []
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = DiskCache(tmp_path)
+    used = {}  # of the form {diagram -> entry}
+    for i, network_string in enumerate(["A---B", "C---D", "E---F"]):
+        cache.graph_from_ascii(network_string)
+        entry, = set(entries(tmp_path)) - set(used.values())
+        os.utime(str(tmp_path / entry), (i, i))  # used in this order
+        used[network_string] = entry
+    size = os.path.getsize(str(tmp_path / used["A---B"]))
+
+    cache.graph_from_ascii("A---B")  # which is now the most recently used
+    DiskCache(tmp_path, max_bytes=3 * size).graph_from_ascii("G---H")
+
+    remaining = entries(tmp_path)
+    assert len(remaining) == 3
+    assert used["C---D"] not in remaining
+    assert used["A---B"] in remaining and used["E---F"] in remaining
+
+
+def test_concurrent_writes_leave_a_valid_entry(tmp_path):
+    network_string = DIAGRAMS[-1]
+    results = []
+
+    def parse():
+        results.append(DiskCache(tmp_path).graph_from_ascii(
+            network_string, backend="arrays"
+        ))
+
+    threads = [threading.Thread(target=parse) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    expected = graph_from_ascii(network_string, backend="arrays")
+    assert results == [expected] * 8
+    assert os.listdir(str(tmp_path)) == entries(tmp_path)  # no temp files
+    assert DiskCache(tmp_path).graph_from_ascii(
+        network_string, backend="arrays"
+    ) == expected
+
+
+def test_clear_deletes_every_entry(tmp_path):
+    cache = DiskCache(tmp_path)
+    cache.graph_from_ascii("A---B")
+    cache.clear()
+
+    assert entries(tmp_path) == []
@@ -0,0 +1,131 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import pytest
+
+from asciigraf import graph_from_ascii
+from asciigraf.asciigraf import (
+    CharGrid,
+    GRID_ENGINE_THRESHOLD,
+    InvalidEdgeError,
+    get_edges,
+    get_nodes_and_labels,
+    resolve_engine,
+)
+from asciigraf.point import Point
+
+from .helpers import DIAGRAMS
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_grid_and_dict_engines_produce_the_same_edges(network_string):
+    nodes, labels = get_nodes_and_labels(network_string)
+
+    assert (
+        get_edges(network_string, nodes, labels, engine="grid")
+        == get_edges(network_string, nodes, labels, engine="dict")
+    )
+
+
+@pytest.mark.parametrize("network_string", [
+    "1---",
+    """
+               1---------------3
+                       |
+                       2""",
+    """
+                n1
+                |
+           n2--(label)
+                |
+                n3
+        """,
+])
+def test_grid_and_dict_engines_raise_the_same_errors(network_string):
+    errors = []
+    for engine in ("dict", "grid"):
+        with pytest.raises(InvalidEdgeError) as e:
+            graph_from_ascii(network_string, engine=engine)
+        errors.append(str(e.value))
+
+    assert errors[0] == errors[1]
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS + [
+    "A\n \\\n  B\n /\nC",
+    "A---B\n|\n|\nC",
+    "",
+])
+def test_numpy_engine_produces_the_same_edges(network_string):
+    pytest.importorskip("numpy")
+    nodes, labels = get_nodes_and_labels(network_string)
+
+    assert (
+        get_edges(network_string, nodes, labels, engine="numpy")
+        == get_edges(network_string, nodes, labels, engine="grid")
+    )
+
+
+@pytest.mark.parametrize("network_string", [
+    "1---",
+    "A---B\n|\n|\n---C\n  |\n",
+    """
+               1---------------3
+                       |
+                       2""",
+    """
+                n1
+                |
+           n2--(label)
+                |
+                n3
+        """,
+])
+def test_numpy_engine_raises_the_same_errors(network_string):
+    pytest.importorskip("numpy")
+    errors = []
+    for engine in ("grid", "numpy"):
+        with pytest.raises(InvalidEdgeError) as e:
+            graph_from_ascii(network_string, engine=engine)
+        errors.append(str(e.value))
+
+    assert errors[0] == errors[1]
+
+
+def test_numpy_engine_falls_back_to_grid_without_numpy(monkeypatch):
+    monkeypatch.setattr("asciigraf.vectorized.numpy", None)
+
+    assert resolve_engine("numpy", "A-B") == "grid"
+    assert set(graph_from_ascii("A---B", engine="numpy").edges()) == {
+        ("A", "B")
+    }
+
+
+def test_auto_engine_switches_to_grid_on_large_diagrams():
+    assert resolve_engine("auto", "A-B") == "dict"
+    assert resolve_engine("auto", "-" * GRID_ENGINE_THRESHOLD) == "grid"
+    assert resolve_engine("dict", "-" * GRID_ENGINE_THRESHOLD) == "dict"
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        graph_from_ascii("A---B", engine="quantum")
+
+
+def test_char_grid_indexes_round_trip():
+    grid = CharGrid(["ab", "", "abcd"])
+
+    for pos in (Point(0, 0), Point(3, 2), Point(1, 1)):
+        assert grid.point(grid.index(pos)) == pos
+
+
+def test_char_grid_finds_edge_chars_in_row_major_order():
+    grid = CharGrid(["a-|", "/ \\"])
+
+    assert [grid.point(index) for index in grid.edge_indexes()] == [
+        Point(1, 0), Point(2, 0), Point(0, 1), Point(2, 1),
+    ]
@@ -0,0 +1,57 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import pickle
+
+import networkx
+import pytest
+
+from asciigraf import graph_from_ascii
+from asciigraf.geometry import PointRuns
+
+from .helpers import DIAGRAMS
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_runs_expand_to_the_same_points(network_string):
+    graph = graph_from_ascii(network_string)
+    runs_graph = graph_from_ascii(network_string, geometry="runs")
+
+    for u, v, data in runs_graph.edges(data=True):
+        points = graph[u][v]["points"]
+        assert data["points"].expand() == points
+        assert data["points"] == points
+        assert [data["points"][i] for i in range(len(points))] == points
+        assert data["length"] == len(data["points"]) == len(points)
+
+
+def test_straight_edges_are_one_run():
+    graph = graph_from_ascii("""
+        A------\\
+                \\
+                 |
+                 B
+    """, geometry="runs")
+    points = networkx.get_edge_attributes(graph, "points")[("A", "B")]
+
+    assert points == PointRuns([9, 1, 1, 0, 7, 16, 2, 1, 1, 2])
+    assert len(points) == 9
+    assert points[-1] == (17, 3)
+    assert points[2:4] == [(11, 1), (12, 1)]
+
+
+def test_runs_pickle():
+    points = PointRuns.from_points([(0, 0), (1, 0), (2, 0), (2, 1)])
+
+    assert pickle.loads(pickle.dumps(points)) == points
+
+
+def test_unknown_geometry():
+    with pytest.raises(ValueError):
+        graph_from_ascii("A---B", geometry="curves")
+    with pytest.raises(ValueError):
+        graph_from_ascii("A---B", geometry="runs", backend="arrays")
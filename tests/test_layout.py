@@ -0,0 +1,140 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import math
+
+import networkx
+import pytest
+
+from asciigraf import ascii_from_graph, graph_from_ascii
+from asciigraf.asciigraf import get_nodes_and_labels
+
+
+def assert_same_topology(graph, drawing):
+    parsed = graph_from_ascii(drawing)
+
+    assert set(parsed.nodes()) == set(map(str, graph.nodes()))
+    assert {
+        frozenset((u, v)): data.get("label")
+        for u, v, data in parsed.edges(data=True)
+    } == {
+        frozenset((str(u), str(v))): data.get("label")
+        for u, v, data in graph.edges(data=True)
+    }
+
+
+def fallbacks(graph, drawing):
+    """ How many edges were drawn below the rest, between copies of their
+        nodes
+    """
+    nodes, _ = get_nodes_and_labels(drawing)
+    return (len(nodes) - graph.number_of_nodes()) // 2
+
+
+def test_drawing_a_small_graph():
+    graph = networkx.Graph()
+    graph.add_edge("A", "B")
+    graph.add_edge("B", "C", label="cable")
+    graph.add_edge("C", "A")
+    graph.add_node("D")
+
+    assert_same_topology(graph, ascii_from_graph(graph))
+
+
+@pytest.mark.parametrize("graph", [
+    networkx.path_graph(10),
+    networkx.star_graph(12),
+    networkx.complete_graph(6),  # which has to be drawn with crossings
+    networkx.grid_2d_graph(6, 6),
+    networkx.balanced_tree(3, 5),
+    networkx.gnm_random_graph(300, 400, seed=7),
+])
+def test_drawings_parse_back_to_the_same_graph(graph):
+    graph = networkx.relabel_nodes(
+        graph, lambda node: "n{}".format(node).replace(", ", "_")[:12]
+        .replace("(", "").replace(")", "")
+    )
+
+    assert_same_topology(graph, ascii_from_graph(graph))
+
+
+@pytest.mark.parametrize("graph", [
+    networkx.balanced_tree(3, 4),
+    networkx.balanced_tree(2, 6),
+    networkx.balanced_tree(5, 2),  # with more edges than room at nodes
+    networkx.path_graph(60),
+])
+def test_trees_only_fall_back_for_nodes_without_room(graph):
+    drawing = ascii_from_graph(graph)
+
+    # edges end beside a name, or at every other character above or below
+    assert fallbacks(graph, drawing) <= sum(
+        max(0, len(graph[node]) - (2 + 2 * math.ceil(len(str(node)) / 2)))
+        for node in graph.nodes()
+    )
+    assert_same_topology(graph, drawing)
+
+
+@pytest.mark.parametrize("size", [4, 6, 10])
+def test_grids_fall_back_for_a_few_edges_per_row(size):
+    graph = networkx.convert_node_labels_to_integers(
+        networkx.grid_2d_graph(size, size)
+    )
+    drawing = ascii_from_graph(graph)
+
+    assert fallbacks(graph, drawing) <= 2 * size
+    assert_same_topology(graph, drawing)
+
+
+def test_labels_are_drawn_on_their_edges():
+    graph = networkx.Graph()
+    graph.add_edge("A", "B", label="cable")
+    graph.add_edge("B", "C", label="line")
+    graph.add_edge("C", "A", label="transformer")
+
+    drawing = ascii_from_graph(graph)
+
+    assert fallbacks(graph, drawing) == 0
+    assert_same_topology(graph, drawing)
+
+
+def test_self_loops_and_directed_graphs():
+    graph = networkx.DiGraph()
+    graph.add_edge("A", "B")
+    graph.add_edge("B", "A")
+    graph.add_edge("B", "B")
+
+    assert_same_topology(graph.to_undirected(), ascii_from_graph(graph))
+
+
+def test_empty_graph():
+    assert ascii_from_graph(networkx.Graph()) == ""
+
+
+@pytest.mark.parametrize("name", ["a-b", "(a)", "a  b", " a", ""])
+def test_nodes_which_cant_be_drawn(name):
+    graph = networkx.Graph()
+    graph.add_edge(name, "b")
+
+    with pytest.raises(ValueError):
+        ascii_from_graph(graph)
+
+
+def test_nodes_with_the_same_name():
+    graph = networkx.Graph()
+    graph.add_edge(1, "1")
+
+    with pytest.raises(ValueError):
+        ascii_from_graph(graph)
+
+
+def test_labels_which_cant_be_drawn():
+    graph = networkx.Graph()
+    graph.add_edge("a", "b", label="x|y")
+
+    with pytest.raises(ValueError):
+        ascii_from_graph(graph)
@@ -0,0 +1,71 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import networkx
+import pytest
+
+from asciigraf import graph_from_ascii
+
+from .helpers import DIAGRAMS, assert_same_graph
+
+DIAGRAM = """
+    Alpha---(a label)---Beta
+                         |
+                         Gamma
+"""
+
+
+def fresh(network_string):
+    """ An equal copy of `network_string`, which isn't the same object """
+    return network_string.encode("utf-8").decode("utf-8")
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_lean_graphs_have_the_same_nodes_and_edges(network_string):
+    graph = graph_from_ascii(network_string)
+    lean = graph_from_ascii(network_string, lean=True)
+
+    assert_same_graph(lean, graph)
+    assert "ascii_string" not in lean.graph
+
+
+def test_no_geometry_keeps_only_the_length_of_edges():
+    graph = graph_from_ascii(DIAGRAM)
+    bare = graph_from_ascii(DIAGRAM, geometry="none")
+
+    assert networkx.get_edge_attributes(bare, "points") == {}
+    assert networkx.get_edge_attributes(bare, "length") == (
+        networkx.get_edge_attributes(graph, "length")
+    )
+    assert networkx.get_edge_attributes(bare, "label") == {
+        ("Alpha", "Beta"): "a label"
+    }
+
+
+def test_lean_graphs_share_names_and_labels():
+    first = graph_from_ascii(fresh(DIAGRAM), lean=True)
+    second = graph_from_ascii(fresh(DIAGRAM), lean=True)
+
+    for name, other in zip(first.nodes(), second.nodes()):
+        assert name is other
+    for (u, v, data), (*_, other) in zip(
+            first.edges(data=True), second.edges(data=True)):
+        assert first[u][v] is data
+        if "label" in data:
+            assert data["label"] is other["label"]
+    # edges refer to nodes by the same strings as the nodes themselves
+    node, neighbour = next(iter(first.edges()))
+    assert next(n for n in first[neighbour] if n == node) is node
+
+
+def test_lean_array_graphs_share_names_and_labels():
+    first = graph_from_ascii(fresh(DIAGRAM), backend="arrays", lean=True)
+    second = graph_from_ascii(fresh(DIAGRAM), backend="arrays", lean=True)
+
+    assert first == graph_from_ascii(DIAGRAM, backend="arrays")
+    assert all(a is b for a, b in zip(first.nodes, second.nodes))
+    assert all(a is b for a, b in zip(first.labels, second.labels))
@@ -74,6 +74,24 @@ def test_patching_edge_chars_over_vertical_label():
         |"""
 
 
+def test_patching_edge_chars_in_place_keeps_row_major_order():
+    edge_chars = get_edge_chars("""
+  ---(a)---
+    (b)
+     |
+  ---(c)--""")
+    labels = {Point(5, 4): "(c)", Point(5, 1): "(a)", Point(4, 2): "(b)"}
+    patched = patch_edge_chars_over_labels(labels, edge_chars)
+
+    assert patched is edge_chars
+    assert list(patched) == sorted(patched)
+    assert draw(patched) == """
+  ---------
+
+     |
+  --------"""
+
+
 def test_drawing_nodes_and_edge_chars():
     assert draw(
         edge_chars={
@@ -5,6 +5,8 @@
 # LICENSE file in the root directory of this source tree.
 #############################################################################
 
+import copy
+import pickle
 
 import pytest
 
@@ -59,6 +61,15 @@ def test_sorting_commutes():
     assert not Point(34, 1) > Point(33, 2)
 
 
+def test_points_dont_order_like_tuples():
+    # tuples order column first, which points mustn't fall back to
+    with pytest.raises(TypeError):
+        Point(2, 1) <= Point(1, 2)
+
+    with pytest.raises(TypeError):
+        Point(2, 1) >= Point(1, 2)
+
+
 def test_points_with_same_coords_are_equal(p12):
     assert p12 == Point(1, 2)
 
@@ -97,3 +108,19 @@ def test_point_attributes_cant_be_deleted(p12):
 
     with pytest.raises(TypeError):
         del p12.z
+
+
+def test_points_dont_carry_an_instance_dict(p12):
+    assert not hasattr(p12, "__dict__")
+
+
+def test_points_arent_equal_to_tuples(p12):
+    assert p12 != (1, 2)
+    assert Point(1, 2) == p12
+    assert hash(Point(1, 2)) == hash(p12)
+
+
+def test_points_can_be_pickled_and_copied(p12):
+    assert pickle.loads(pickle.dumps(p12)) == p12
+    assert copy.copy(p12) == p12
+    assert copy.deepcopy(p12) == p12
@@ -0,0 +1,126 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import random
+
+import networkx
+import pytest
+
+from asciigraf import SpatialIndex, graph_from_ascii
+from asciigraf.point import Point
+from asciigraf.spatial import EDGE, NODE, Element
+
+from .helpers import DIAGRAMS
+
+DIAGRAM = """
+    A---(nuts)---B
+                 |
+                 |
+    C------------D    Loner
+"""
+
+
+def every_char(graph):
+    """ {(x, y) -> Element} for every character of the graph, by brute force
+    """
+    chars = {}
+    positions = networkx.get_node_attributes(graph, "position")
+    for node, (x, y) in positions.items():
+        for i in range(len(node)):
+            chars[x + i, y] = Element(NODE, node)
+    for u, v, data in graph.edges(data=True):
+        for position in data["points"]:
+            chars[tuple(position)] = Element(EDGE, (u, v))
+    return chars
+
+
+def test_characters_are_found_by_position():
+    index = SpatialIndex.from_graph(graph_from_ascii(DIAGRAM))
+
+    assert index.at(4, 1) == Element(NODE, "A")
+    assert index.at(5, 1) == Element(EDGE, ("A", "B"))
+    assert index.at(10, 1) == Element(EDGE, ("A", "B"))  # on the label
+    assert index.at(17, 3) == Element(EDGE, ("B", "D"))
+    assert index.at(22, 4) == Element(NODE, "Loner")
+    assert index.at(0, 0) is None
+    assert index.at(-1, 100) is None
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_lookups_match_a_scan_of_the_graph(network_string):
+    graph = graph_from_ascii(network_string)
+    index = SpatialIndex.from_graph(graph)
+    chars = every_char(graph)
+
+    width = max(map(len, network_string.split("\n"))) + 2
+    height = network_string.count("\n") + 2
+    for y in range(-1, height):
+        for x in range(-1, width):
+            assert index.at(x, y) == chars.get((x, y))
+
+
+def test_array_graphs_can_be_indexed():
+    graph = graph_from_ascii(DIAGRAM)
+    arrays = graph_from_ascii(DIAGRAM, backend="arrays")
+
+    assert (
+        SpatialIndex.from_graph(arrays).elements
+        == SpatialIndex.from_graph(graph).elements
+    )
+
+
+def test_graphs_without_geometry_cant_be_indexed():
+    graph = graph_from_ascii(DIAGRAM, geometry="none")
+
+    with pytest.raises(ValueError) as e:
+        SpatialIndex.from_graph(graph)
+
+    assert 'geometry="none"' in str(e.value)
+
+
+def test_elements_within_a_box():
+    index = SpatialIndex.from_graph(graph_from_ascii(DIAGRAM), bucket_size=4)
+
+    assert index.within(0, 0, 5, 1) == [
+        Element(NODE, "A"), Element(EDGE, ("A", "B"))
+    ]
+    assert index.within(17, 2, 40, 4) == [
+        Element(NODE, "D"), Element(NODE, "Loner"),
+        Element(EDGE, ("B", "D")),
+    ]
+    assert index.within(0, 2, 15, 3) == []
+    assert index.within(0, -1000, 10 ** 6, 1000) == index.elements
+
+
+def test_nearest_elements():
+    index = SpatialIndex.from_graph(graph_from_ascii(DIAGRAM), bucket_size=4)
+
+    assert index.nearest(4, 1) == (Element(NODE, "A"), Point(4, 1))
+    assert index.nearest(10, 3) == (Element(EDGE, ("C", "D")), Point(10, 4))
+    assert index.nearest(10, 3, kind=NODE) == (Element(NODE, "C"), Point(4, 4))
+    assert index.nearest(200, 200, kind=NODE) == (
+        Element(NODE, "Loner"), Point(26, 4)
+    )
+    assert SpatialIndex([], []).nearest(0, 0) is None
+    assert index.nearest(0, 0, kind="other") is None
+
+
+@pytest.mark.parametrize("bucket_size", [1, 3, 16])
+def test_nearest_matches_a_scan_of_the_graph(bucket_size):
+    graph = graph_from_ascii(DIAGRAMS[-1])
+    index = SpatialIndex.from_graph(graph, bucket_size=bucket_size)
+    chars = every_char(graph)
+
+    rng = random.Random(0)
+    for _ in range(200):
+        x, y = rng.randint(-10, 80), rng.randint(-10, 40)
+        distance, char_y, char_x = min(
+            ((cx - x) ** 2 + (cy - y) ** 2, cy, cx) for cx, cy in chars
+        )
+        assert index.nearest(x, y) == (
+            chars[char_x, char_y], Point(char_x, char_y)
+        )
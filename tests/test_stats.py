@@ -0,0 +1,76 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import pytest
+
+from asciigraf import ParseCache, ParseStats, graph_from_ascii
+
+DIAGRAM = """
+    A---(nuts)----B
+                  |
+                  C
+"""
+
+
+@pytest.mark.parametrize("engine, stages", [
+    ("dict", [
+        "tokenize",
+        "get_neighbour_map",
+        "trace_edges",
+        "build_networkx_graph",
+    ]),
+    ("grid", [
+        "get_nodes_and_labels",
+        "load_grid",
+        "patch_labels",
+        "get_neighbour_map",
+        "trace_edges",
+        "build_networkx_graph",
+    ]),
+])
+def test_stats_are_filled_in(engine, stages):
+    stats = ParseStats()
+    graph_from_ascii(DIAGRAM, engine=engine, stats=stats)
+
+    assert list(stats.times) == stages
+    assert all(seconds >= 0 for seconds in stats.times.values())
+    assert stats.total_time == sum(stats.times.values())
+    assert (stats.rows, stats.chars) == (5, len(DIAGRAM))
+    assert (stats.nodes, stats.labels) == (3, 1)
+    assert (stats.edge_chars, stats.edges) == (14, 2)
+    assert stats.max_edge_length == 13
+
+
+def test_stats_as_dict():
+    stats = ParseStats()
+    graph_from_ascii(DIAGRAM, backend="arrays", stats=stats)
+
+    flat = stats.as_dict()
+    assert flat["nodes"] == 3
+    assert flat["time.build_array_graph"] == (
+        stats.times["build_array_graph"]
+    )
+    assert flat["time.total"] == stats.total_time
+
+
+def test_stats_start_over_for_each_parse():
+    stats = ParseStats()
+    graph_from_ascii(DIAGRAM, stats=stats)
+    graph_from_ascii("A---B", stats=stats)
+
+    assert (stats.nodes, stats.labels, stats.edges) == (2, 0, 1)
+
+
+def test_stats_are_not_part_of_the_cache_key():
+    cache = ParseCache()
+    first, second = ParseStats(), ParseStats()
+    cache.graph_from_ascii(DIAGRAM, stats=first)
+    cache.graph_from_ascii(DIAGRAM, stats=second)
+
+    assert cache.info().hits == 1
+    assert first.nodes == 3
+    assert second.nodes == 0
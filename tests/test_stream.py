@@ -0,0 +1,133 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import io
+
+import pytest
+
+from asciigraf import graph_from_ascii
+from asciigraf.asciigraf import InvalidEdgeError
+from asciigraf.stream import (
+    StreamParser,
+    graph_from_file,
+    graph_from_lines,
+    graph_from_path,
+)
+
+from .helpers import DIAGRAMS, assert_same_graph
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_streamed_files_match_graph_from_ascii(network_string):
+    assert_same_graph(
+        graph_from_file(io.StringIO(network_string)),
+        graph_from_ascii(network_string),
+    )
+
+
+def test_lines_can_be_given_with_or_without_newlines():
+    lines = ["A---B", "|", "C"]
+
+    assert_same_graph(
+        graph_from_lines(lines),
+        graph_from_lines(line + "\n" for line in lines),
+    )
+
+
+def test_edges_are_carried_between_rows():
+    network_string = (
+        "A\n" + "|\n" * 5000 + "B-----\n" + "     |\n" * 100 + "     C"
+    )
+
+    assert_same_graph(
+        graph_from_lines(network_string.split("\n")),
+        graph_from_ascii(network_string),
+    )
+
+
+def test_only_a_window_of_rows_is_kept():
+    parser = StreamParser()
+    parser.feed("A")
+    for _ in range(1000):
+        parser.feed("|")
+        assert len(parser._rows) <= 3
+    parser.feed("B")
+
+    assert set(parser.close().edges()) == {("A", "B")}
+
+
+@pytest.mark.parametrize("network_string", [
+    "1---",
+    """
+               1---------------3
+                       |
+                       2""",
+    """
+                n1
+                |
+           n2--(label)
+                |
+                n3
+        """,
+    """
+            -----
+            |   |
+            -----""",
+])
+def test_bad_edges_raise_the_same_error(network_string):
+    with pytest.raises(InvalidEdgeError) as parsed:
+        graph_from_ascii(network_string)
+    with pytest.raises(InvalidEdgeError) as streamed:
+        graph_from_lines(network_string.split("\n"))
+
+    assert (
+        str(streamed.value).splitlines()[0]
+        == str(parsed.value).splitlines()[0]
+    )
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS + [
+    "Zürich---(über)---Genève\n   |\n   Bern",
+    "A---B\n",
+])
+def test_mapped_files_match_graph_from_ascii(tmp_path, network_string):
+    path = tmp_path / "diagram.txt"
+    path.write_bytes(network_string.encode("utf-8"))
+
+    assert_same_graph(
+        graph_from_path(str(path)), graph_from_ascii(network_string)
+    )
+
+
+def test_windows_line_endings_are_read_like_graph_from_ascii(tmp_path):
+    network_string = "A---B\r\n|\r\nC\r\n"
+    path = tmp_path / "diagram.txt"
+    path.write_bytes(network_string.encode("utf-8"))
+
+    assert_same_graph(
+        graph_from_path(str(path)), graph_from_ascii(network_string)
+    )
+    with open(str(path), newline="") as fp:
+        assert_same_graph(
+            graph_from_file(fp), graph_from_ascii(network_string)
+        )
+
+
+def test_empty_files_have_empty_graphs(tmp_path):
+    path = tmp_path / "diagram.txt"
+    path.write_bytes(b"")
+
+    assert len(graph_from_path(str(path))) == 0
+
+
+def test_rows_can_be_fed_as_bytes():
+    network_string = "n1---(label)---n2\n |\n n3"
+    parser = StreamParser()
+    for line in network_string.encode("utf-8").split(b"\n"):
+        parser.feed(line)
+
+    assert_same_graph(parser.close(), graph_from_ascii(network_string))
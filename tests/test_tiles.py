@@ -0,0 +1,63 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import pytest
+
+from asciigraf import graph_from_ascii
+from asciigraf.asciigraf import InvalidEdgeError
+from asciigraf.tiles import graph_from_ascii_tiled, split_bands
+
+from .helpers import DIAGRAMS, assert_same_graph
+
+
+@pytest.mark.parametrize("min_band_rows", [1, 2, 3])
+@pytest.mark.parametrize("network_string", DIAGRAMS + [
+    # edges running through several bands, and loops back onto a node
+    """
+     A
+     |
+     |
+     |
+     B
+     |
+    (x)
+     |
+     C
+    """,
+    "  \\\n N|K (q)\n  /K ",
+    " /--\\\n |  |\n A--/",
+])
+def test_tiled_parsing_matches_graph_from_ascii(network_string, min_band_rows):
+    tiled = graph_from_ascii_tiled(
+        network_string, workers=2, min_band_rows=min_band_rows
+    )
+    parsed = graph_from_ascii(network_string)
+
+    assert_same_graph(tiled, parsed)
+    assert tiled.graph["ascii_string"] == parsed.graph["ascii_string"]
+
+
+def test_bands_are_not_split_around_labels():
+    lines = ["A", "|", "(x)", "|", "B", "|", "C"]
+
+    assert split_bands(lines, n_bands=7, min_band_rows=1) == [
+        (0, 1), (1, 4), (4, 5), (5, 6), (6, 7)
+    ]
+
+
+def test_invalid_edges_in_a_band():
+    with pytest.raises(InvalidEdgeError):
+        graph_from_ascii_tiled("A\n|\n|\n \n|\nB", min_band_rows=1)
+
+
+def test_loops_across_bands():
+    with pytest.raises(InvalidEdgeError) as error:
+        graph_from_ascii_tiled(
+            "A\n /-\\\n |  |\n \\--/", workers=2, min_band_rows=1
+        )
+
+    assert "never reaches a node" in str(error.value)
@@ -0,0 +1,81 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+import pytest
+
+from asciigraf import graph_from_ascii
+from asciigraf.asciigraf import (
+    get_edge_chars,
+    get_nodes_and_labels,
+    patch_edge_chars_over_labels,
+    tokenize,
+)
+from asciigraf.point import Point
+
+from .helpers import DIAGRAMS
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS + [
+    "",
+    "\n\n",
+    "(a)\n|\n(b)--",
+    "A-(x)-B\n  |\n  (y)\n  |",
+])
+def test_tokenize_matches_the_separate_passes(network_string):
+    nodes, labels = get_nodes_and_labels(network_string)
+    edge_chars = patch_edge_chars_over_labels(
+        labels, get_edge_chars(network_string)
+    )
+
+    tokens = tokenize(network_string)
+
+    assert [list(found.items()) for found in tokens] == [
+        list(nodes.items()), list(labels.items()), list(edge_chars.items())
+    ]
+
+
+def test_edge_chars_are_in_row_major_order():
+    _, _, edge_chars = tokenize("""
+        A---(label)---B
+                      |
+        C-----(x)-----|
+    """)
+
+    assert list(edge_chars) == sorted(edge_chars)
+
+
+def test_long_space_separated_names():
+    # one node, with a name of 20,000 words
+    name = " ".join(["word"] * 20000)
+    nodes, labels, edge_chars = tokenize("A-- " + name + "  --B")
+
+    assert list(nodes.items()) == [
+        (Point(0, 0), "A"),
+        (Point(4, 0), name),
+        (Point(len(name) + 8, 0), "B"),
+    ]
+    assert not labels
+    assert len(edge_chars) == 4
+
+
+@pytest.mark.parametrize("text", [
+    "a " * 20000,
+    "^" * 40000 + " ",
+    "a^ " * 20000,
+])
+def test_adversarial_text_is_one_node(text):
+    nodes, _, _ = tokenize(text)
+
+    assert list(nodes.values()) == [text.strip()]
+
+
+def test_long_labels():
+    label = "(" + "x " * 10000 + ")"
+    graph = graph_from_ascii("A-" + label + "-B", engine="dict")
+
+    assert graph["A"]["B"]["label"] == label[1:-1]
+    assert graph["A"]["B"]["length"] == len(label) + 2
@@ -0,0 +1,96 @@
+#############################################################################
+# Copyright (c) 2017-present, Opus One Energy Solutions Corporation
+#
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+#############################################################################
+
+from unittest import mock
+
+import pytest
+
+from asciigraf import graph_from_ascii, validate_ascii
+from asciigraf.asciigraf import InvalidEdgeError
+from asciigraf.point import Point
+from asciigraf.validate import (
+    NO_NODES,
+    TOO_FEW_NEIGHBOURS,
+    TOO_MANY_NEIGHBOURS,
+)
+
+from .helpers import DIAGRAMS
+
+
+@pytest.mark.parametrize("network_string", DIAGRAMS)
+def test_valid_diagrams_have_no_problems(network_string):
+    assert validate_ascii(network_string) == []
+
+
+def test_every_problem_is_reported():
+    problems = validate_ascii("""
+        1---------------3
+                |
+                2
+
+        4---
+
+        -----
+        |   |
+        -----""")
+
+    assert [
+        (problem.problem, problem.position) for problem in problems
+    ] == [
+        (TOO_MANY_NEIGHBOURS, Point(16, 1)),
+        (TOO_FEW_NEIGHBOURS, Point(11, 5)),
+        (NO_NODES, Point(8, 7)),
+    ]
+    assert problems[0].neighbours == (
+        Point(15, 1), Point(17, 1), Point(16, 2)
+    )
+    assert problems[0].message == (
+        "Edge character at ln 1, col 16 has too many neighbours"
+    )
+    assert problems[2].message == (
+        "Edge character at ln 7, col 8 never reaches a node"
+    )
+
+
+def test_problems_raise_the_same_error_as_parsing():
+    network_string = """
+               1---------------3
+                       |
+                       2"""
+    problem, = validate_ascii(network_string)
+
+    with pytest.raises(InvalidEdgeError) as e:
+        graph_from_ascii(network_string)
+
+    assert str(problem.error()) == str(e.value)
+
+
+def test_loops_raise_the_same_error_as_parsing():
+    network_string = """
+            -----
+            |   |
+            -----"""
+    problem, = validate_ascii(network_string)
+
+    with pytest.raises(InvalidEdgeError) as e:
+        graph_from_ascii(network_string)
+
+    assert str(problem.error()) == str(e.value)
+
+
+def test_error_maps_are_only_rendered_when_asked_for():
+    with mock.patch(
+        "asciigraf.validate.highlight_bad_edge_characters",
+        return_value="error map",
+    ) as highlight:
+        problem, = validate_ascii("1---")
+        highlight.assert_not_called()
+
+        assert problem.error_map() == "error map"
+        highlight.assert_called_once_with(
+            "1---", [Point(3, 0), Point(2, 0)]
+        )
@@ -1,3 +1,18 @@
 def test_version():
     import asciigraf
     assert asciigraf.__version__ == "9999999999.0.0dev1+unreleased"
+
+
+def test_import_defers_slow_dependencies():
+    import subprocess
+    import sys
+
+    modules = subprocess.run(
+        [sys.executable, "-c",
+         "import sys, asciigraf; print(' '.join(sys.modules))"],
+        stdout=subprocess.PIPE, universal_newlines=True, check=True,
+    ).stdout.split()
+
+    assert "asciigraf" in modules
+    assert "networkx" not in modules
+    assert "colorama" not in modules